@@ -0,0 +1,84 @@
+//! Throughput benchmarks for the Rust extractors
+//!
+//! Mirrors the page benchmarks in `tests/test_benchmarks.py` without the
+//! Python conversion, so a regression can be pinned to the core or to the
+//! bindings. Run with `cargo bench`; criterion reports MB/s of HTML and
+//! compares each run against the previous one.
+
+use criterion::{black_box, criterion_group, criterion_main, BenchmarkId, Criterion, Throughput};
+use meta_oxide::extractors::{all, jsonld, meta};
+
+/// News-article style page, ~100 KB, with head metadata, JSON-LD and h-entries
+fn article_html() -> String {
+    let mut html = String::from(
+        r#"<html lang="en"><head><title>Article</title>
+        <meta name="description" content="An article">
+        <meta property="og:title" content="Article">
+        <meta property="og:image" content="/lead.jpg">
+        <meta name="twitter:card" content="summary_large_image">
+        <link rel="canonical" href="/article">
+        <script type="application/ld+json">
+        {"@context": "https://schema.org", "@type": "NewsArticle", "headline": "Article"}
+        </script></head><body>"#,
+    );
+    for i in 0..300 {
+        html.push_str(&format!(
+            r#"<article class="h-entry"><h2 class="p-name">Entry {i}</h2>
+            <a class="u-url" href="/entry/{i}">link</a>
+            <div class="e-content"><p>{}</p></div></article>"#,
+            "Lorem ipsum dolor sit amet. ".repeat(8)
+        ));
+    }
+    html.push_str("</body></html>");
+    html
+}
+
+/// Product page whose JSON-LD block carries 2,000 offers
+fn large_jsonld_html() -> String {
+    let offers: Vec<String> = (0..2000)
+        .map(|i| {
+            format!(
+                r#"{{"@type": "Offer", "sku": "SKU-{i}", "price": "{i}.99", "priceCurrency": "USD"}}"#
+            )
+        })
+        .collect();
+    format!(
+        r#"<html><head><script type="application/ld+json">
+        {{"@context": "https://schema.org", "@type": "Product", "name": "Widget",
+          "offers": [{}]}}
+        </script></head><body></body></html>"#,
+        offers.join(",")
+    )
+}
+
+fn extract_meta_bench(c: &mut Criterion) {
+    let html = article_html();
+    let mut group = c.benchmark_group("extract_meta");
+    group.throughput(Throughput::Bytes(html.len() as u64));
+    group.bench_function("article", |b| b.iter(|| meta::extract(black_box(&html), None)));
+    group.finish();
+}
+
+fn extract_all_bench(c: &mut Criterion) {
+    let html = article_html();
+    let mut group = c.benchmark_group("extract_all");
+    group.throughput(Throughput::Bytes(html.len() as u64));
+    for base_url in [None, Some("https://example.com/news/")] {
+        let id = BenchmarkId::new("article", if base_url.is_some() { "base_url" } else { "none" });
+        group.bench_with_input(id, &base_url, |b, base_url| {
+            b.iter(|| all::extract(black_box(&html), *base_url))
+        });
+    }
+    group.finish();
+}
+
+fn jsonld_large_bench(c: &mut Criterion) {
+    let html = large_jsonld_html();
+    let mut group = c.benchmark_group("extract_jsonld");
+    group.throughput(Throughput::Bytes(html.len() as u64));
+    group.bench_function("2000_offers", |b| b.iter(|| jsonld::extract(black_box(&html), None)));
+    group.finish();
+}
+
+criterion_group!(benches, extract_meta_bench, extract_all_bench, jsonld_large_bench);
+criterion_main!(benches);
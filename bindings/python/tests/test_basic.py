@@ -6,16 +6,10 @@ Run with: pytest python/tests/
 
 import pytest
 
-# This will fail until the package is built with maturin
-try:
-    import meta_oxide
+# Skips the module until the package is built with maturin
+meta_oxide = pytest.importorskip("meta_oxide")
 
-    PACKAGE_AVAILABLE = True
-except ImportError:
-    PACKAGE_AVAILABLE = False
 
-
-@pytest.mark.skipif(not PACKAGE_AVAILABLE, reason="Package not built yet")
 class TestHCard:
     """Test h-card extraction."""
 
@@ -62,7 +56,6 @@ class TestHCard:
         assert len(cards) == 0
 
 
-@pytest.mark.skipif(not PACKAGE_AVAILABLE, reason="Package not built yet")
 class TestHEntry:
     """Test h-entry extraction."""
 
@@ -99,7 +92,6 @@ class TestHEntry:
         assert "Python" in entries[0]["category"]
 
 
-@pytest.mark.skipif(not PACKAGE_AVAILABLE, reason="Package not built yet")
 class TestHEvent:
     """Test h-event extraction."""
 
@@ -121,7 +113,6 @@ class TestHEvent:
         assert events[0]["location"] == "Convention Center"
 
 
-@pytest.mark.skipif(not PACKAGE_AVAILABLE, reason="Package not built yet")
 class TestExtractAll:
     """Test extracting all microformats."""
 
@@ -148,7 +139,6 @@ class TestExtractAll:
         assert len(result["h-entry"]) == 1
 
 
-@pytest.mark.skipif(not PACKAGE_AVAILABLE, reason="Package not built yet")
 class TestURLResolution:
     """Test URL resolution."""
 
@@ -177,8 +167,14 @@ class TestURLResolution:
         assert cards[0]["url"] == "https://other.com/page"
 
 
-@pytest.mark.skipif(not PACKAGE_AVAILABLE, reason="Package not built yet")
 def test_version():
     """Test that version is available."""
     assert hasattr(meta_oxide, "__version__")
     assert isinstance(meta_oxide.__version__, str)
+
+
+def test_warmup():
+    """Test that warmup() is safe to call repeatedly and leaves extraction working."""
+    assert meta_oxide.warmup() is None
+    meta_oxide.warmup()
+    assert meta_oxide.extract_all("<title>After warmup</title>")["meta"]["title"] == "After warmup"
@@ -1,6 +1,7 @@
 """Integration tests for combined extraction (Phase E)"""
 
 import meta_oxide
+import pytest
 
 
 def test_extract_all_complete_page():
@@ -547,3 +548,78 @@ def test_extract_all_special_characters():
     assert "&" in data["meta"]["title"]
     assert "<" in data["meta"]["title"]
     assert ">" in data["meta"]["title"]
+
+
+def test_extract_all_batch_matches_extract_all():
+    """Test extract_all_batch() returns one extract_all() result per document, in order"""
+    htmls = [
+        '<title>First</title><meta property="og:title" content="First OG">',
+        "",
+        '<script type="application/ld+json">{"@type": "Person", "name": "Jane"}</script>',
+        '<div class="h-card"><span class="p-name">Person One</span></div>',
+    ]
+
+    results = meta_oxide.extract_all_batch(htmls, "https://example.com")
+
+    assert len(results) == len(htmls)
+    assert results == [meta_oxide.extract_all(html, "https://example.com") for html in htmls]
+    assert results[0]["meta"]["title"] == "First"
+    assert results[2]["jsonld"][0]["name"] == "Jane"
+
+
+def test_extract_all_batch_empty_list():
+    """Test extract_all_batch() with no documents"""
+    assert meta_oxide.extract_all_batch([]) == []
+
+
+def test_extract_all_batch_per_document_base_urls():
+    """Test extract_all_batch() resolves each document against its own base URL"""
+    html = '<link rel="canonical" href="/page">'
+
+    results = meta_oxide.extract_all_batch(
+        [html, html, html],
+        base_url="https://default.example",
+        base_urls=["https://one.example", None, "https://three.example"],
+    )
+
+    assert [r["meta"]["canonical"] for r in results] == [
+        "https://one.example/page",
+        "https://default.example/page",
+        "https://three.example/page",
+    ]
+
+
+def test_extract_all_batch_base_urls_length_mismatch():
+    """Test extract_all_batch() rejects base_urls that don't line up with htmls"""
+    with pytest.raises(ValueError, match="base_urls"):
+        meta_oxide.extract_all_batch(["<title>A</title>", "<title>B</title>"], base_urls=[None])
+
+
+def test_extract_all_lazy_matches_extract_all():
+    """Test extract_all_lazy() exposes the same sections as extract_all()"""
+    html = """
+    <html><head>
+        <title>Lazy</title>
+        <meta property="og:title" content="Lazy OG">
+        <script type="application/ld+json">{"@type": "Article", "headline": "Hi"}</script>
+    </head><body>
+        <div class="h-card"><span class="p-name">Jane</span></div>
+    </body></html>
+    """
+    expected = meta_oxide.extract_all(html)
+
+    result = meta_oxide.extract_all_lazy(html)
+
+    assert "meta" in result
+    assert "microdata" not in result
+    assert 1 not in result
+    assert result["jsonld"] == expected["jsonld"]
+    assert result["jsonld"] is result["jsonld"]
+    assert result.get("microdata") is None
+    assert result.get("microdata", []) == []
+    assert sorted(result) == sorted(expected)
+    assert len(result) == len(expected)
+    assert result.keys() == list(expected.keys())
+    assert result.to_dict() == expected
+    with pytest.raises(KeyError):
+        result["microdata"]
@@ -222,6 +222,33 @@ class TestJSONLDMultipleObjects:
         assert len(objects) == 1
         assert objects[0]["@type"] == ["Article", "BlogPosting"]
 
+    def test_filter_by_types(self):
+        """Test that types= keeps only objects whose @type is in the set"""
+        html = """
+        <html>
+        <head>
+            <script type="application/ld+json">
+            {
+                "@context": "https://schema.org",
+                "@graph": [
+                    {"@type": "Article", "headline": "Article in Graph"},
+                    {"@type": "Person", "name": "Author Name"},
+                    {"@type": ["Organization", "Corporation"], "name": "Publisher Name"}
+                ]
+            }
+            </script>
+        </head>
+        <body></body>
+        </html>
+        """
+
+        objects = meta_oxide.extract_jsonld(html, types={"Article", "Corporation"})
+
+        assert len(objects) == 2
+        assert objects[0]["@type"] == "Article"
+        assert objects[1]["name"] == "Publisher Name"
+        assert meta_oxide.extract_jsonld(html, types=frozenset({"Recipe"})) == []
+
 
 class TestJSONLDEdgeCases:
     """Test edge cases and error handling"""
@@ -313,6 +340,38 @@ class TestJSONLDEdgeCases:
         assert objects[0]["headline"] == "日本語のタイトル"
         assert objects[0]["description"] == "Описание на русском"
 
+    def test_bytes_input(self):
+        """Test that bytes, bytearray and memoryview give the same result as str"""
+        html = """
+        <script type="application/ld+json">
+        {"@type": "Article", "headline": "日本語のタイトル"}
+        </script>
+        """
+        encoded = html.encode("utf-8")
+        expected = meta_oxide.extract_jsonld(html)
+        assert meta_oxide.extract_jsonld(encoded) == expected
+        assert meta_oxide.extract_jsonld(bytearray(encoded)) == expected
+        assert meta_oxide.extract_jsonld(memoryview(encoded)) == expected
+
+    def test_oversized_integer(self):
+        """Test that integers beyond 64 bits are kept as floats, not dropped"""
+        html = """
+        <script type="application/ld+json">
+        {"@type": "Product", "name": "Widget", "gtin": 123456789012345678901234567890}
+        </script>
+        """
+        result = meta_oxide.extract_jsonld(html)
+        assert len(result) == 1
+        assert result[0]["name"] == "Widget"
+        assert result[0]["gtin"] == pytest.approx(1.2345678901234568e29)
+
+    def test_invalid_input(self):
+        """Test that non-UTF-8 bytes and non-text input are rejected"""
+        with pytest.raises(ValueError, match="UTF-8"):
+            meta_oxide.extract_jsonld(b"<title>\xff</title>")
+        with pytest.raises(TypeError):
+            meta_oxide.extract_jsonld(123)
+
 
 class TestJSONLDIntegration:
     """Test JSON-LD integration with extract_all()"""
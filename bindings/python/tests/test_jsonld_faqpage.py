@@ -103,6 +103,54 @@ class TestFAQPageMultipleQuestions:
         assert "Why use structured data?" in main_entity_str or "structured data" in main_entity_str
 
 
+class TestFAQPageSelect:
+    """Test selecting FAQPage nodes with meta_oxide.select()"""
+
+    HTML = """
+    <html>
+    <head>
+        <script type="application/ld+json">
+        {
+            "@context": "https://schema.org",
+            "@type": "FAQPage",
+            "author": {"@type": "Organization", "name": "Example Corp"},
+            "mainEntity": [
+                {"@type": "Question", "name": "What is Schema.org?"},
+                {"@type": "Question", "name": "Why use structured data?"},
+                {"@type": "Comment", "text": "Not a question"}
+            ]
+        }
+        </script>
+    </head>
+    <body></body>
+    </html>
+    """
+
+    def test_select_questions(self):
+        """Test filtering mainEntity down to Question nodes"""
+        questions = meta_oxide.select(self.HTML, "$..mainEntity[?(@['@type']=='Question')]")
+
+        assert [q["name"] for q in questions] == [
+            "What is Schema.org?",
+            "Why use structured data?",
+        ]
+
+    def test_select_scalar_values(self):
+        """Test selecting leaf values through a filter on the root list"""
+        names = meta_oxide.select(self.HTML, "$[?(@['@type']=='FAQPage')].author.name")
+
+        assert names == ["Example Corp"]
+
+    def test_select_no_matches(self):
+        """Test that a path with no matches returns an empty list"""
+        assert meta_oxide.select(self.HTML, "$..acceptedAnswer") == []
+
+    def test_select_invalid_path(self):
+        """Test that malformed paths raise ValueError"""
+        with pytest.raises(ValueError, match="Invalid JSONPath"):
+            meta_oxide.select(self.HTML, "mainEntity")
+
+
 class TestFAQPageWithMetadata:
     """Test FAQPage with additional metadata"""
 
@@ -5,6 +5,8 @@ This module tests the extraction of Recipe structured data from JSON-LD,
 following the Schema.org Recipe specification.
 """
 
+from typing import List, Optional
+
 import meta_oxide
 import pytest
 
@@ -148,8 +150,13 @@ class TestRecipeIngredients:
         assert len(objects) == 1
         assert objects[0]["@type"] == "Recipe"
         assert objects[0]["name"] == "Simple Omelette"
-        # Array property should be present
-        assert "recipeIngredient" in objects[0]
+        # Array property should come back as a native list
+        assert objects[0]["recipeIngredient"] == [
+            "3 eggs",
+            "2 tablespoons butter",
+            "Salt and pepper to taste",
+            "1/4 cup shredded cheese",
+        ]
 
     def test_recipe_with_single_ingredient(self):
         """Test Recipe with a single ingredient"""
@@ -460,7 +467,9 @@ class TestRecipeNutrition:
         objects = meta_oxide.extract_jsonld(html)
 
         assert len(objects) == 1
-        assert "nutrition" in objects[0]
+        nutrition = objects[0]["nutrition"]
+        assert isinstance(nutrition, dict)
+        assert nutrition["calories"] == "320 calories"
 
 
 class TestRecipeAuthor:
@@ -764,5 +773,43 @@ class TestRecipeIntegration:
         assert data["jsonld"][0]["name"] == "Perfect Pancakes"
 
 
+class TestRecipeSchema:
+    """Test converting Recipe objects into user-supplied schema types"""
+
+    def test_extract_into_msgspec_struct(self):
+        """Test that schema= builds msgspec Structs instead of dicts"""
+        msgspec = pytest.importorskip("msgspec")
+
+        class Recipe(msgspec.Struct):
+            name: str
+            recipeYield: Optional[str] = None
+            recipeIngredient: Optional[List[str]] = None
+
+        html = """
+        <html>
+        <head>
+            <script type="application/ld+json">
+            {
+                "@context": "https://schema.org",
+                "@type": "Recipe",
+                "name": "Perfect Pancakes",
+                "recipeYield": "4 servings",
+                "recipeIngredient": ["2 cups flour", "2 eggs"]
+            }
+            </script>
+        </head>
+        <body></body>
+        </html>
+        """
+
+        recipes = meta_oxide.extract_jsonld(html, schema=Recipe)
+
+        assert len(recipes) == 1
+        assert isinstance(recipes[0], Recipe)
+        assert recipes[0].name == "Perfect Pancakes"
+        assert recipes[0].recipeYield == "4 servings"
+        assert recipes[0].recipeIngredient == ["2 cups flour", "2 eggs"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -9,15 +9,9 @@ Run with: pytest python/tests/test_rel_links.py -v
 
 import pytest
 
-try:
-    import meta_oxide
+meta_oxide = pytest.importorskip("meta_oxide")
 
-    PACKAGE_AVAILABLE = True
-except ImportError:
-    PACKAGE_AVAILABLE = False
 
-
-@pytest.mark.skipif(not PACKAGE_AVAILABLE, reason="Package not built yet")
 class TestBasicExtraction:
     """Test basic rel-* link extraction."""
 
@@ -99,7 +93,6 @@ class TestBasicExtraction:
         assert len(links["payment"]) == 1
 
 
-@pytest.mark.skipif(not PACKAGE_AVAILABLE, reason="Package not built yet")
 class TestSpecificRelTypes:
     """Test specific rel-* types commonly used."""
 
@@ -212,7 +205,6 @@ class TestSpecificRelTypes:
         assert links["next"] == ["/page/3"]
 
 
-@pytest.mark.skipif(not PACKAGE_AVAILABLE, reason="Package not built yet")
 class TestURLHandling:
     """Test URL resolution and handling."""
 
@@ -247,7 +239,6 @@ class TestURLHandling:
         assert links["search"] == ["https://example.com/search?type=opensearch"]
 
 
-@pytest.mark.skipif(not PACKAGE_AVAILABLE, reason="Package not built yet")
 class TestMultipleValues:
     """Test handling of multiple rel values."""
 
@@ -294,7 +285,6 @@ class TestMultipleValues:
         assert len(links) == 2
 
 
-@pytest.mark.skipif(not PACKAGE_AVAILABLE, reason="Package not built yet")
 class TestEdgeCases:
     """Test edge cases and malformed input."""
 
@@ -346,7 +336,6 @@ class TestEdgeCases:
         assert isinstance(links, dict)
 
 
-@pytest.mark.skipif(not PACKAGE_AVAILABLE, reason="Package not built yet")
 class TestIntegration:
     """Test integration scenarios."""
 
@@ -1,6 +1,7 @@
 """Stress tests and edge cases for robustness"""
 
 import meta_oxide
+import pytest
 
 
 def test_extremely_large_html():
@@ -33,10 +34,10 @@ def test_html_with_binary_data():
     # Should handle null bytes and binary data gracefully
     try:
         meta = meta_oxide.extract_meta(html)
-        assert isinstance(meta, dict)
-    except Exception:
-        # If it raises, that's also acceptable
-        pass
+    except (ValueError, TypeError, RuntimeError) as e:
+        # Rejecting the input is acceptable, but record it rather than passing silently
+        pytest.skip(f"raised {type(e).__name__}")
+    assert isinstance(meta, dict)
 
 
 def test_html_with_only_whitespace():
@@ -0,0 +1,27 @@
+"""Helpers shared by the example scripts"""
+
+import io
+import sys
+from contextlib import redirect_stdout
+from functools import wraps
+
+
+def buffered(func):
+    """Collect an example's output and write it to stdout in a single call"""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        buf = io.StringIO()
+        try:
+            with redirect_stdout(buf):
+                return func(*args, **kwargs)
+        finally:
+            # Flush whatever was printed even if the example raised
+            sys.stdout.write(buf.getvalue())
+
+    return wrapper
+
+
+def header(title, rule):
+    """Frame `title` between two copies of the `rule` line"""
+    return f"{rule}\n{title}\n{rule}"
@@ -5,8 +5,18 @@ Demo script showing BreadcrumbList JSON-LD extraction
 This demonstrates the new BreadcrumbList type support in meta_oxide.
 """
 
+from operator import itemgetter
+
 import meta_oxide
 
+
+_get_crumb = itemgetter("position", "name", "item")
+_get_name = itemgetter("name")
+_BREADCRUMB_TYPES = frozenset({"BreadcrumbList"})
+_SEP50 = "=" * 50
+
+meta_oxide.warmup()
+
 # Example 1: E-commerce breadcrumb
 ecommerce_html = """
 <html>
@@ -50,17 +60,19 @@ ecommerce_html = """
 """
 
 print("Example 1: E-commerce Breadcrumb")
-print("=" * 50)
-objects = meta_oxide.extract_jsonld(ecommerce_html)
+print(_SEP50)
+objects = meta_oxide.extract_jsonld(ecommerce_html, types=_BREADCRUMB_TYPES)
 breadcrumb = objects[0]
 print(f"Type: {breadcrumb['@type']}")
 print(f"Number of items: {len(breadcrumb['itemListElement'])}")
 print("\nBreadcrumb trail:")
-for item in breadcrumb["itemListElement"]:
-    position = item["position"]
-    name = item["name"]
-    url = item.get("item", "(current page)")
-    print(f"  {position}. {name} -> {url}")
+# The last crumb (current page) may omit "item", so fall back per entry
+print(
+    "\n".join(
+        f"  {item['position']}. {item['name']} -> {item.get('item', '(current page)')}"
+        for item in breadcrumb["itemListElement"]
+    )
+)
 
 # Example 2: Documentation breadcrumb with all fields
 documentation_html = """
@@ -102,15 +114,14 @@ documentation_html = """
 """
 
 print("\n\nExample 2: Documentation Breadcrumb (with metadata)")
-print("=" * 50)
-objects = meta_oxide.extract_jsonld(documentation_html)
+print(_SEP50)
+objects = meta_oxide.extract_jsonld(documentation_html, types=_BREADCRUMB_TYPES)
 breadcrumb = objects[0]
 print(f"Type: {breadcrumb['@type']}")
 print(f"Name: {breadcrumb.get('name', 'N/A')}")
 print(f"Number of Items: {breadcrumb.get('numberOfItems', 'N/A')}")
 print("\nBreadcrumb trail:")
-for item in breadcrumb["itemListElement"]:
-    print(f"  {item['position']}. {item['name']} -> {item['item']}")
+print("\n".join(f"  {p}. {n} -> {u}" for p, n, u in map(_get_crumb, breadcrumb["itemListElement"])))
 
 # Example 3: Using extract_all() to get breadcrumb with other data
 combined_html = """
@@ -153,7 +164,7 @@ combined_html = """
 """
 
 print("\n\nExample 3: Combined extraction with extract_all()")
-print("=" * 50)
+print(_SEP50)
 data = meta_oxide.extract_all(combined_html)
 print(f"Title: {data['meta']['title']}")
 print(f"OG Title: {data['opengraph']['title']}")
@@ -162,11 +173,11 @@ for obj in data["jsonld"]:
     obj_type = obj["@type"]
     print(f"  - {obj_type}")
     if obj_type == "BreadcrumbList":
-        print(f"    Trail: {' > '.join([item['name'] for item in obj['itemListElement']])}")
+        print(f"    Trail: {' > '.join(map(_get_name, obj['itemListElement']))}")
     elif obj_type == "Product":
         print(f"    Name: {obj['name']}")
         print(f"    SKU: {obj['sku']}")
 
-print("\n" + "=" * 50)
+print("\n" + _SEP50)
 print("BreadcrumbList support successfully implemented!")
-print("=" * 50)
+print(_SEP50)
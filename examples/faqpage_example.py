@@ -8,6 +8,13 @@ and can improve search engine visibility with rich results.
 """
 
 import meta_oxide
+from _shared import buffered, header
+
+_FAQ_TYPES = frozenset({"FAQPage"})
+_QUESTION_PATH = "$..mainEntity[?(@['@type']=='Question')]"
+_SEP70 = "=" * 70
+_DASH70 = "-" * 70
+
 
 # Sample HTML with FAQPage JSON-LD
 html = """
@@ -75,14 +82,13 @@ html = """
 """
 
 
+@buffered
 def main():
-    print("=" * 70)
-    print("FAQPage JSON-LD Extraction Example")
-    print("=" * 70)
+    print(header("FAQPage JSON-LD Extraction Example", _SEP70))
     print()
 
     # Extract JSON-LD data
-    jsonld_objects = meta_oxide.extract_jsonld(html)
+    jsonld_objects = meta_oxide.extract_jsonld(html, types=_FAQ_TYPES)
 
     print(f"Found {len(jsonld_objects)} JSON-LD object(s)")
     print()
@@ -98,32 +104,35 @@ def main():
             print(f"  Date Published: {obj.get('datePublished')}")
 
             # Author information
-            if "author" in obj:
-                author = obj["author"]
-                if isinstance(author, str):
-                    print(f"  Author: {author}")
-                else:
-                    author_str = str(author)
-                    if "@type" in author_str:
-                        print("  Author Type: Organization")
-                        if "name" in author_str:
-                            print("  Author: (see full object)")
-
-            # Questions count
-            main_entity = str(obj.get("mainEntity", ""))
-            if "Question" in main_entity:
-                # Count occurrences of "@type": "Question"
-                import re
-
-                question_count = len(re.findall(r'"@type"\s*:\s*"Question"', main_entity))
+            author = obj.get("author")
+            if isinstance(author, str):
+                print(f"  Author: {author}")
+            elif isinstance(author, dict):
+                if author.get("@type") == "Organization":
+                    print("  Author Type: Organization")
+                if "name" in author:
+                    print(f"  Author: {author['name']}")
+
+            # Questions in this FAQPage's mainEntity
+            main_entity = obj.get("mainEntity") or []
+            if isinstance(main_entity, dict):
+                main_entity = [main_entity]
+            question_count = sum(
+                1 for q in main_entity if isinstance(q, dict) and q.get("@type") == "Question"
+            )
+            if question_count:
                 print(f"  Number of Questions: {question_count}")
 
         print()
 
+    # Page-wide total across every JSON-LD block, matched in Rust with one query
+    print(f"Questions on the page: {len(meta_oxide.select(html, _QUESTION_PATH))}")
+    print()
+
     # Also demonstrate extract_all()
-    print("-" * 70)
+    print(_DASH70)
     print("Using extract_all() - extracts FAQPage with other metadata")
-    print("-" * 70)
+    print(_DASH70)
     print()
 
     all_data = meta_oxide.extract_all(html)
@@ -149,9 +158,7 @@ def main():
             print(f"  Description: {meta.get('description')}")
 
     print()
-    print("=" * 70)
-    print("Benefits of FAQPage Schema:")
-    print("=" * 70)
+    print(header("Benefits of FAQPage Schema:", _SEP70))
     print(
         """
 1. Rich Results: FAQs can appear directly in Google search results
@@ -164,4 +171,5 @@ def main():
 
 
 if __name__ == "__main__":
+    meta_oxide.warmup()
     main()
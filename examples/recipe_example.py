@@ -6,142 +6,165 @@ This example shows how to extract Schema.org Recipe structured data
 from HTML pages, which is commonly used by food blogs and recipe websites.
 """
 
-import json
+from typing import List, Optional
 
 import meta_oxide
+from _shared import buffered, header
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
+_RECIPE_TYPES = frozenset({"Recipe"})
+_SEP60 = "=" * 60
+
+
+def _format_fields(obj, fields):
+    """Render (label, key) pairs of `obj` as one "Label: value" line each"""
+    return "\n".join(f"{label}: {obj.get(key)}" for label, key in fields)
+
+
+_BASIC_RECIPE_FIELDS = (("Name", "name"), ("Description", "description"), ("Image", "image"))
+_COMPLETE_RECIPE_FIELDS = (
+    ("Name", "name"),
+    ("Description", "description"),
+    ("Category", "recipeCategory"),
+    ("Cuisine", "recipeCuisine"),
+    ("Prep Time", "prepTime"),
+    ("Cook Time", "cookTime"),
+    ("Total Time", "totalTime"),
+    ("Yield", "recipeYield"),
+    ("Date Published", "datePublished"),
+)
+
+
+_BASIC_RECIPE_HTML = """
+<html>
+<head>
+    <title>Simple Pancake Recipe</title>
+    <script type="application/ld+json">
+    {
+        "@context": "https://schema.org",
+        "@type": "Recipe",
+        "name": "Classic Pancakes",
+        "description": "Fluffy homemade pancakes that are perfect for breakfast",
+        "image": "https://example.com/pancakes.jpg"
+    }
+    </script>
+</head>
+<body></body>
+</html>
+"""
+
+
+@buffered
 def example_basic_recipe():
     """Extract a basic recipe with minimal fields"""
-    html = """
-    <html>
-    <head>
-        <title>Simple Pancake Recipe</title>
-        <script type="application/ld+json">
-        {
-            "@context": "https://schema.org",
-            "@type": "Recipe",
-            "name": "Classic Pancakes",
-            "description": "Fluffy homemade pancakes that are perfect for breakfast",
-            "image": "https://example.com/pancakes.jpg"
-        }
-        </script>
-    </head>
-    <body></body>
-    </html>
-    """
-
-    print("=" * 60)
-    print("Example 1: Basic Recipe")
-    print("=" * 60)
+    print(header("Example 1: Basic Recipe", _SEP60))
 
-    recipes = meta_oxide.extract_jsonld(html)
+    recipes = meta_oxide.extract_jsonld(_BASIC_RECIPE_HTML, types=_RECIPE_TYPES)
     for recipe in recipes:
         if recipe.get("@type") == "Recipe":
-            print(f"Name: {recipe.get('name')}")
-            print(f"Description: {recipe.get('description')}")
-            print(f"Image: {recipe.get('image')}")
+            print(_format_fields(recipe, _BASIC_RECIPE_FIELDS))
+
+    # Raw bytes (or a memoryview over them, e.g. a response body) work too
+    body = _BASIC_RECIPE_HTML.encode("utf-8")
+    from_bytes = meta_oxide.extract_jsonld(memoryview(body), types=_RECIPE_TYPES)
+    print(f"Same result from memoryview input: {from_bytes == recipes}")
     print()
 
 
-def example_complete_recipe():
-    """Extract a complete recipe with all fields"""
-    html = """
-    <html>
-    <head>
-        <title>Grandma's Apple Pie Recipe</title>
-        <script type="application/ld+json">
-        {
-            "@context": "https://schema.org",
-            "@type": "Recipe",
-            "name": "Grandma's Apple Pie",
-            "description": "A classic homemade apple pie recipe passed down through generations",
-            "image": [
-                "https://example.com/apple-pie-1.jpg",
-                "https://example.com/apple-pie-2.jpg"
-            ],
-            "author": {
-                "@type": "Person",
-                "name": "Jane Smith"
-            },
-            "datePublished": "2024-01-15",
-            "prepTime": "PT30M",
-            "cookTime": "PT1H",
-            "totalTime": "PT1H30M",
-            "recipeYield": "8 servings",
-            "recipeCategory": "Dessert",
-            "recipeCuisine": "American",
-            "recipeIngredient": [
-                "6 cups thinly sliced apples",
-                "3/4 cup white sugar",
-                "2 tablespoons all-purpose flour",
-                "3/4 teaspoon ground cinnamon",
-                "1/4 teaspoon ground nutmeg",
-                "1 recipe pastry for a 9 inch double crust pie"
-            ],
-            "recipeInstructions": [
-                "Preheat oven to 425 degrees F (220 degrees C)",
-                "Combine sugar, flour, cinnamon, and nutmeg in a bowl",
-                "Mix in apples until evenly coated",
-                "Place bottom crust in pie pan and fill with apple mixture",
-                "Cover with top crust and seal edges",
-                "Bake for 40-50 minutes until crust is golden brown"
-            ],
-            "nutrition": {
-                "@type": "NutritionInformation",
-                "calories": "410 calories",
-                "carbohydrateContent": "58g",
-                "fatContent": "19g",
-                "proteinContent": "4g"
-            },
-            "aggregateRating": {
-                "@type": "AggregateRating",
-                "ratingValue": "4.9",
-                "reviewCount": "523"
-            }
+_COMPLETE_RECIPE_HTML = """
+<html>
+<head>
+    <title>Grandma's Apple Pie Recipe</title>
+    <script type="application/ld+json">
+    {
+        "@context": "https://schema.org",
+        "@type": "Recipe",
+        "name": "Grandma's Apple Pie",
+        "description": "A classic homemade apple pie recipe passed down through generations",
+        "image": [
+            "https://example.com/apple-pie-1.jpg",
+            "https://example.com/apple-pie-2.jpg"
+        ],
+        "author": {
+            "@type": "Person",
+            "name": "Jane Smith"
+        },
+        "datePublished": "2024-01-15",
+        "prepTime": "PT30M",
+        "cookTime": "PT1H",
+        "totalTime": "PT1H30M",
+        "recipeYield": "8 servings",
+        "recipeCategory": "Dessert",
+        "recipeCuisine": "American",
+        "recipeIngredient": [
+            "6 cups thinly sliced apples",
+            "3/4 cup white sugar",
+            "2 tablespoons all-purpose flour",
+            "3/4 teaspoon ground cinnamon",
+            "1/4 teaspoon ground nutmeg",
+            "1 recipe pastry for a 9 inch double crust pie"
+        ],
+        "recipeInstructions": [
+            "Preheat oven to 425 degrees F (220 degrees C)",
+            "Combine sugar, flour, cinnamon, and nutmeg in a bowl",
+            "Mix in apples until evenly coated",
+            "Place bottom crust in pie pan and fill with apple mixture",
+            "Cover with top crust and seal edges",
+            "Bake for 40-50 minutes until crust is golden brown"
+        ],
+        "nutrition": {
+            "@type": "NutritionInformation",
+            "calories": "410 calories",
+            "carbohydrateContent": "58g",
+            "fatContent": "19g",
+            "proteinContent": "4g"
+        },
+        "aggregateRating": {
+            "@type": "AggregateRating",
+            "ratingValue": "4.9",
+            "reviewCount": "523"
         }
-        </script>
-    </head>
-    <body></body>
-    </html>
-    """
+    }
+    </script>
+</head>
+<body></body>
+</html>
+"""
 
-    print("=" * 60)
-    print("Example 2: Complete Recipe with All Fields")
-    print("=" * 60)
 
-    recipes = meta_oxide.extract_jsonld(html)
+@buffered
+def example_complete_recipe():
+    """Extract a complete recipe with all fields"""
+    print(header("Example 2: Complete Recipe with All Fields", _SEP60))
+
+    recipes = meta_oxide.extract_jsonld(_COMPLETE_RECIPE_HTML, types=_RECIPE_TYPES)
     for recipe in recipes:
         if recipe.get("@type") == "Recipe":
-            print(f"Name: {recipe.get('name')}")
-            print(f"Description: {recipe.get('description')}")
-            print(f"Category: {recipe.get('recipeCategory')}")
-            print(f"Cuisine: {recipe.get('recipeCuisine')}")
-            print(f"Prep Time: {recipe.get('prepTime')}")
-            print(f"Cook Time: {recipe.get('cookTime')}")
-            print(f"Total Time: {recipe.get('totalTime')}")
-            print(f"Yield: {recipe.get('recipeYield')}")
-            print(f"Date Published: {recipe.get('datePublished')}")
-
-            # Parse complex fields that are JSON strings
+            print(_format_fields(recipe, _COMPLETE_RECIPE_FIELDS))
+
+            # Nested fields are returned as native lists and dicts
             if "recipeIngredient" in recipe:
-                ingredients = json.loads(recipe["recipeIngredient"])
+                ingredients = recipe["recipeIngredient"]
                 print(f"\nIngredients ({len(ingredients)}):")
                 for i, ingredient in enumerate(ingredients, 1):
                     print(f"  {i}. {ingredient}")
 
             if "recipeInstructions" in recipe:
-                instructions = json.loads(recipe["recipeInstructions"])
+                instructions = recipe["recipeInstructions"]
                 print(f"\nInstructions ({len(instructions)} steps):")
                 for i, step in enumerate(instructions, 1):
                     print(f"  {i}. {step}")
 
             if "author" in recipe:
-                author = json.loads(recipe["author"])
+                author = recipe["author"]
                 print(f"\nAuthor: {author.get('name')}")
 
             if "nutrition" in recipe:
-                nutrition = json.loads(recipe["nutrition"])
+                nutrition = recipe["nutrition"]
                 print("\nNutrition Info:")
                 print(f"  Calories: {nutrition.get('calories')}")
                 print(f"  Carbs: {nutrition.get('carbohydrateContent')}")
@@ -149,48 +172,48 @@ def example_complete_recipe():
                 print(f"  Protein: {nutrition.get('proteinContent')}")
 
             if "aggregateRating" in recipe:
-                rating = json.loads(recipe["aggregateRating"])
+                rating = recipe["aggregateRating"]
                 print(
                     f"\nRating: {rating.get('ratingValue')} ⭐ ({rating.get('reviewCount')} reviews)"
                 )
     print()
 
 
+_QUICK_PASTA_HTML = """
+<html>
+<head>
+    <title>Quick Pasta Recipe</title>
+    <meta name="description" content="Easy pasta recipe">
+    <meta property="og:title" content="Quick Pasta">
+    <script type="application/ld+json">
+    {
+        "@context": "https://schema.org",
+        "@type": "Recipe",
+        "name": "Quick Spaghetti Carbonara",
+        "description": "A fast and delicious Italian pasta dish",
+        "prepTime": "PT10M",
+        "cookTime": "PT15M",
+        "recipeYield": "4 servings",
+        "recipeIngredient": [
+            "400g spaghetti",
+            "200g pancetta",
+            "4 eggs",
+            "100g parmesan cheese"
+        ]
+    }
+    </script>
+</head>
+<body></body>
+</html>
+"""
+
+
+@buffered
 def example_extract_all():
     """Extract recipe using extract_all() which includes all metadata"""
-    html = """
-    <html>
-    <head>
-        <title>Quick Pasta Recipe</title>
-        <meta name="description" content="Easy pasta recipe">
-        <meta property="og:title" content="Quick Pasta">
-        <script type="application/ld+json">
-        {
-            "@context": "https://schema.org",
-            "@type": "Recipe",
-            "name": "Quick Spaghetti Carbonara",
-            "description": "A fast and delicious Italian pasta dish",
-            "prepTime": "PT10M",
-            "cookTime": "PT15M",
-            "recipeYield": "4 servings",
-            "recipeIngredient": [
-                "400g spaghetti",
-                "200g pancetta",
-                "4 eggs",
-                "100g parmesan cheese"
-            ]
-        }
-        </script>
-    </head>
-    <body></body>
-    </html>
-    """
-
-    print("=" * 60)
-    print("Example 3: Using extract_all()")
-    print("=" * 60)
+    print(header("Example 3: Using extract_all()", _SEP60))
 
-    data = meta_oxide.extract_all(html)
+    data = meta_oxide.extract_all(_QUICK_PASTA_HTML)
 
     print("Available metadata types:")
     for key in data.keys():
@@ -209,20 +232,55 @@ def example_extract_all():
     print()
 
 
+if msgspec is not None:
+
+    class Recipe(msgspec.Struct):
+        """Typed view of the Recipe fields used in these examples"""
+
+        name: Optional[str] = None
+        description: Optional[str] = None
+        recipeCuisine: Optional[str] = None
+        recipeYield: Optional[str] = None
+        totalTime: Optional[str] = None
+        recipeIngredient: Optional[List[str]] = None
+
+
+@buffered
+def example_typed_recipe():
+    """Extract recipes directly into msgspec Structs"""
+    print(header("Example 4: Typed Recipes with msgspec", _SEP60))
+
+    if msgspec is None:
+        print("msgspec is not installed (pip install meta-oxide[schemas]); skipping")
+        print()
+        return
+
+    recipes = meta_oxide.extract_jsonld(_COMPLETE_RECIPE_HTML, types={"Recipe"}, schema=Recipe)
+    for recipe in recipes:
+        print(f"Name: {recipe.name}")
+        print(f"Cuisine: {recipe.recipeCuisine}")
+        print(f"Yield: {recipe.recipeYield}")
+        print(f"Total Time: {recipe.totalTime}")
+        print(f"Ingredients: {len(recipe.recipeIngredient or [])}")
+    print()
+
+
 def main():
     """Run all examples"""
-    print("\n" + "=" * 60)
+    print("\n" + _SEP60)
     print("JSON-LD Recipe Extraction Examples")
-    print("=" * 60 + "\n")
+    print(_SEP60 + "\n")
 
     example_basic_recipe()
     example_complete_recipe()
     example_extract_all()
+    example_typed_recipe()
 
-    print("=" * 60)
+    print(_SEP60)
     print("All examples completed successfully!")
-    print("=" * 60 + "\n")
+    print(_SEP60 + "\n")
 
 
 if __name__ == "__main__":
+    meta_oxide.warmup()
     main()
@@ -0,0 +1,448 @@
+//! Run every extractor over a single document
+//!
+//! `extract` collects the output of each format into an owned [`AllResult`],
+//! without touching Python. Keeping collection separate from conversion lets
+//! the bindings run it with the GIL released and fan it out across documents.
+//!
+//! The HTML is parsed once and every extractor runs over that shared document,
+//! instead of each format re-parsing (and re-allocating) its own DOM.
+
+use aho_corasick::AhoCorasick;
+#[cfg(feature = "python")]
+use pyo3::intern;
+#[cfg(feature = "python")]
+use pyo3::prelude::*;
+#[cfg(feature = "python")]
+use pyo3::sync::GILOnceCell;
+#[cfg(feature = "python")]
+use pyo3::types::{PyDict, PyList, PyString};
+use std::collections::HashMap;
+use std::sync::OnceLock;
+
+use crate::extractors;
+use crate::extractors::common::html_utils;
+use crate::types::dublin_core::DublinCore;
+use crate::types::jsonld::JsonLdObject;
+use crate::types::manifest::ManifestDiscovery;
+use crate::types::meta::MetaTags;
+use crate::types::microdata::MicrodataItem;
+use crate::types::oembed::OEmbedDiscovery;
+use crate::types::rdfa::RdfaItem;
+use crate::types::social::{OpenGraph, TwitterCard};
+use crate::types::{HAdr, HCard, HEntry, HEvent, HFeed, HGeo, HProduct, HRecipe, HReview};
+
+/// Results of every extractor for one document
+///
+/// Formats that failed to extract, or found nothing, are left empty
+/// (`None` or an empty collection).
+#[derive(Debug, Clone, Default)]
+pub struct AllResult {
+    pub meta: Option<MetaTags>,
+    pub opengraph: Option<OpenGraph>,
+    pub twitter: Option<TwitterCard>,
+    pub jsonld: Vec<JsonLdObject>,
+    pub microdata: Vec<MicrodataItem>,
+    pub hcard: Vec<HCard>,
+    pub hentry: Vec<HEntry>,
+    pub hevent: Vec<HEvent>,
+    pub hreview: Vec<HReview>,
+    pub hrecipe: Vec<HRecipe>,
+    pub hproduct: Vec<HProduct>,
+    pub hfeed: Vec<HFeed>,
+    pub hadr: Vec<HAdr>,
+    pub hgeo: Vec<HGeo>,
+    /// Only set when at least one oEmbed endpoint was discovered
+    pub oembed: Option<OEmbedDiscovery>,
+    pub dublin_core: Option<DublinCore>,
+    pub rel_links: HashMap<String, Vec<String>>,
+    pub rdfa: Vec<RdfaItem>,
+    /// Only set when a manifest link was found
+    pub manifest: Option<ManifestDiscovery>,
+}
+
+/// Top-level keys of `extract_all()` results, in the order they are inserted
+pub const KEYS: [&str; 11] = [
+    "meta",
+    "opengraph",
+    "twitter",
+    "jsonld",
+    "microdata",
+    "microformats",
+    "oembed",
+    "dublin_core",
+    "rel_links",
+    "rdfa",
+    "manifest",
+];
+
+impl AllResult {
+    /// Whether the top-level section `key` has any data
+    ///
+    /// Sections without data are left out of `extract_all()` results.
+    pub fn has_section(&self, key: &str) -> bool {
+        match key {
+            "meta" => self.meta.is_some(),
+            "opengraph" => self.opengraph.is_some(),
+            "twitter" => self.twitter.is_some(),
+            "jsonld" => !self.jsonld.is_empty(),
+            "microdata" => !self.microdata.is_empty(),
+            "microformats" => self.has_microformats(),
+            "oembed" => self.oembed.is_some(),
+            "dublin_core" => self.dublin_core.is_some(),
+            "rel_links" => !self.rel_links.is_empty(),
+            "rdfa" => !self.rdfa.is_empty(),
+            "manifest" => self.manifest.is_some(),
+            _ => false,
+        }
+    }
+
+    /// Whether any microformat type was found
+    pub fn has_microformats(&self) -> bool {
+        !(self.hcard.is_empty()
+            && self.hentry.is_empty()
+            && self.hevent.is_empty()
+            && self.hreview.is_empty()
+            && self.hrecipe.is_empty()
+            && self.hproduct.is_empty()
+            && self.hfeed.is_empty()
+            && self.hadr.is_empty()
+            && self.hgeo.is_empty())
+    }
+}
+
+/// Substrings that any match of a format must contain
+///
+/// Formats whose marker does not occur anywhere in the HTML can't produce
+/// results, so their selector walks are skipped. Markers are matched ASCII
+/// case-insensitively: attribute names, and class names in quirks mode, are
+/// case-insensitive. The order matches the `Marker` discriminants.
+const MARKERS: [&str; 15] = [
+    "ld+json",
+    "itemscope",
+    "typeof",
+    "vocab",
+    "oembed",
+    "manifest",
+    "h-card",
+    "h-entry",
+    "h-event",
+    "h-review",
+    "h-recipe",
+    "h-product",
+    "h-feed",
+    "h-adr",
+    "h-geo",
+];
+
+#[derive(Clone, Copy)]
+enum Marker {
+    JsonLd,
+    Microdata,
+    RdfaTypeof,
+    RdfaVocab,
+    OEmbed,
+    Manifest,
+    HCard,
+    HEntry,
+    HEvent,
+    HReview,
+    HRecipe,
+    HProduct,
+    HFeed,
+    HAdr,
+    HGeo,
+}
+
+/// Which of the [`MARKERS`] occur in a document
+struct Markers([bool; MARKERS.len()]);
+
+impl Markers {
+    /// Scan `html` once for every marker, stopping early once all were seen
+    fn scan(html: &str) -> Self {
+        static MATCHER: OnceLock<AhoCorasick> = OnceLock::new();
+        let matcher = MATCHER.get_or_init(|| {
+            AhoCorasick::builder()
+                .ascii_case_insensitive(true)
+                .build(MARKERS)
+                .expect("markers are valid patterns")
+        });
+
+        let mut present = [false; MARKERS.len()];
+        let mut remaining = MARKERS.len();
+        for found in matcher.find_iter(html) {
+            let seen = &mut present[found.pattern().as_usize()];
+            if !*seen {
+                *seen = true;
+                remaining -= 1;
+                if remaining == 0 {
+                    break;
+                }
+            }
+        }
+        Self(present)
+    }
+
+    fn has(&self, marker: Marker) -> bool {
+        self.0[marker as usize]
+    }
+}
+
+/// Run every extractor over `html`
+///
+/// Extraction never fails as a whole: errors from individual extractors are
+/// logged as warnings and the corresponding field is left empty.
+pub fn extract(html: &str, base_url: Option<&str>) -> AllResult {
+    let mut result = AllResult::default();
+    let document = html_utils::parse_html(html);
+    let markers = Markers::scan(html);
+
+    // Phase 1: Standard Meta Tags
+    match extractors::meta::extract_from_document(&document, base_url) {
+        Ok(meta_tags) => result.meta = Some(meta_tags),
+        Err(e) => eprintln!("Meta extraction warning: {}", e),
+    }
+
+    // Phase 2: Open Graph
+    match extractors::social::opengraph::extract_from_document(&document, base_url) {
+        Ok(og) => result.opengraph = Some(og),
+        Err(e) => eprintln!("OpenGraph extraction warning: {}", e),
+    }
+
+    // Phase 2: Twitter Cards (with fallback to OG)
+    match extractors::social::twitter::extract_with_fallback_from_document(&document, base_url) {
+        Ok(twitter) => result.twitter = Some(twitter),
+        Err(e) => eprintln!("Twitter extraction warning: {}", e),
+    }
+
+    // Phase 3: JSON-LD
+    if markers.has(Marker::JsonLd) {
+        match extractors::jsonld::extract_from_document(&document, base_url) {
+            Ok(objects) => result.jsonld = objects,
+            Err(e) => eprintln!("JSON-LD extraction warning: {}", e),
+        }
+    }
+
+    // Phase 4: Microdata
+    if markers.has(Marker::Microdata) {
+        match extractors::microdata::extract_from_document(&document, base_url) {
+            Ok(items) => result.microdata = items,
+            Err(e) => eprintln!("Microdata extraction warning: {}", e),
+        }
+    }
+
+    // Phase 7: Microformats
+    macro_rules! mf {
+        ($module:ident, $marker:ident) => {
+            if markers.has(Marker::$marker) {
+                extractors::microformats::$module::extract_from_document(&document, base_url)
+                    .unwrap_or_default()
+            } else {
+                Vec::new()
+            }
+        };
+    }
+    result.hcard = mf!(hcard, HCard);
+    result.hentry = mf!(hentry, HEntry);
+    result.hevent = mf!(hevent, HEvent);
+    result.hreview = mf!(hreview, HReview);
+    result.hrecipe = mf!(hrecipe, HRecipe);
+    result.hproduct = mf!(hproduct, HProduct);
+    result.hfeed = mf!(hfeed, HFeed);
+    result.hadr = mf!(hadr, HAdr);
+    result.hgeo = mf!(hgeo, HGeo);
+
+    // Phase 5: oEmbed endpoint discovery
+    if markers.has(Marker::OEmbed) {
+        match extractors::oembed::extract_from_document(&document, base_url) {
+            Ok(oembed) => result.oembed = Some(oembed).filter(|o| o.has_endpoints()),
+            Err(e) => eprintln!("oEmbed extraction warning: {}", e),
+        }
+    }
+
+    // Phase 9: Dublin Core metadata
+    match extractors::dublin_core::extract_from_document(&document) {
+        Ok(dc) => result.dublin_core = Some(dc),
+        Err(e) => eprintln!("Dublin Core extraction warning: {}", e),
+    }
+
+    // rel-* link relationships
+    match extractors::rel_links::extract_from_document(&document, base_url) {
+        Ok(rel_links) => result.rel_links = rel_links,
+        Err(e) => eprintln!("rel_links extraction warning: {}", e),
+    }
+
+    // RDFa
+    if markers.has(Marker::RdfaTypeof) || markers.has(Marker::RdfaVocab) {
+        match extractors::rdfa::extract_from_document(&document, base_url) {
+            Ok(items) => result.rdfa = items,
+            Err(e) => eprintln!("RDFa extraction warning: {}", e),
+        }
+    }
+
+    // Web App Manifest link
+    if markers.has(Marker::Manifest) {
+        match extractors::manifest::extract_link_from_document(&document, base_url) {
+            Ok(discovery) => result.manifest = Some(discovery).filter(|d| d.href.is_some()),
+            Err(e) => eprintln!("Manifest extraction warning: {}", e),
+        }
+    }
+
+    result
+}
+
+#[cfg(feature = "python")]
+impl AllResult {
+    /// Convert to the dictionary returned by `meta_oxide.extract_all()`
+    ///
+    /// Empty formats are omitted from the dictionary.
+    pub fn to_py_dict(&self, py: Python) -> PyResult<Py<PyDict>> {
+        let dict = PyDict::new_bound(py);
+        for (i, key) in KEYS.iter().enumerate() {
+            if let Some(value) = self.section_to_py(py, key)? {
+                dict.set_item(key_object(py, i), value)?;
+            }
+        }
+        Ok(dict.unbind())
+    }
+
+    /// Convert a single top-level section, or `None` if it is empty or unknown
+    pub fn section_to_py(&self, py: Python, key: &str) -> PyResult<Option<PyObject>> {
+        fn list<'a, T: 'a>(
+            py: Python,
+            items: &'a [T],
+            convert: impl Fn(&'a T) -> Py<PyDict>,
+        ) -> Option<PyObject> {
+            (!items.is_empty())
+                .then(|| PyList::new_bound(py, items.iter().map(convert)).into_any().unbind())
+        }
+
+        let value = match key {
+            "meta" => self.meta.as_ref().map(|meta| meta.to_py_dict(py).into_any()),
+            "opengraph" => self.opengraph.as_ref().map(|og| og.to_py_dict(py).into_any()),
+            "twitter" => self.twitter.as_ref().map(|twitter| twitter.to_py_dict(py).into_any()),
+            "jsonld" => list(py, &self.jsonld, |obj| obj.to_py_dict(py)),
+            "microdata" => list(py, &self.microdata, |item| item.to_py_dict(py)),
+            "microformats" if self.has_microformats() => {
+                let mf_dict = PyDict::new_bound(py);
+                macro_rules! set_mf {
+                    ($key:literal, $items:expr) => {
+                        if let Some(items) = list(py, &$items, |i| i.to_py_dict(py)) {
+                            mf_dict.set_item(intern!(py, $key), items)?;
+                        }
+                    };
+                }
+                set_mf!("h-card", self.hcard);
+                set_mf!("h-entry", self.hentry);
+                set_mf!("h-event", self.hevent);
+                set_mf!("h-review", self.hreview);
+                set_mf!("h-recipe", self.hrecipe);
+                set_mf!("h-product", self.hproduct);
+                set_mf!("h-feed", self.hfeed);
+                set_mf!("h-adr", self.hadr);
+                set_mf!("h-geo", self.hgeo);
+                Some(mf_dict.into_any().unbind())
+            }
+            "oembed" => self.oembed.as_ref().map(|oembed| oembed.to_py_dict(py).into_any()),
+            "dublin_core" => self.dublin_core.as_ref().map(|dc| dc.to_py_dict(py).into_any()),
+            "rel_links" if !self.rel_links.is_empty() => Some(self.rel_links.to_object(py)),
+            "rdfa" => list(py, &self.rdfa, |item| item.to_py_dict(py)),
+            "manifest" => self.manifest.as_ref().map(|manifest| manifest.to_py_dict(py).into_any()),
+            _ => None,
+        };
+        Ok(value)
+    }
+}
+
+/// Interned Python strings for [`KEYS`], created once per interpreter
+#[cfg(feature = "python")]
+pub fn key_object(py: Python<'_>, index: usize) -> &Bound<'_, PyString> {
+    static KEY_OBJECTS: GILOnceCell<Vec<Py<PyString>>> = GILOnceCell::new();
+    KEY_OBJECTS.get_or_init(py, || {
+        KEYS.iter().map(|key| PyString::intern_bound(py, key).unbind()).collect()
+    })[index]
+        .bind(py)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_shared_document_matches_individual_extractors() {
+        let html = r#"
+            <html><head>
+                <title>Shared Parse</title>
+                <meta name="description" content="One parse for the head">
+                <meta property="og:title" content="OG Title">
+                <meta property="og:image" content="/og.png">
+                <script type="application/ld+json">{"@type": "Article", "headline": "Hi"}</script>
+            </head><body></body></html>
+        "#;
+        let base_url = Some("https://example.com/");
+
+        let result = extract(html, base_url);
+
+        assert_eq!(result.meta, extractors::meta::extract(html, base_url).ok());
+        assert_eq!(result.opengraph, extractors::social::extract_opengraph(html, base_url).ok());
+        assert_eq!(
+            result.twitter,
+            extractors::social::extract_twitter_with_fallback(html, base_url).ok()
+        );
+        assert_eq!(result.jsonld, extractors::jsonld::extract(html, base_url).unwrap());
+        assert_eq!(result.twitter.unwrap().title.as_deref(), Some("OG Title"));
+    }
+
+    #[test]
+    fn test_body_formats_match_individual_extractors() {
+        let html = r#"
+            <html><head>
+                <meta name="DC.title" content="Dublin Title">
+                <link rel="manifest" href="/manifest.json">
+                <link rel="alternate" type="application/json+oembed" href="/oembed?url=x">
+            </head><body>
+                <div class="h-card"><span class="p-name">Jane Doe</span></div>
+                <div itemscope itemtype="https://schema.org/Person">
+                    <span itemprop="name">John</span>
+                </div>
+                <div vocab="https://schema.org/" typeof="Event">
+                    <span property="name">Launch</span>
+                </div>
+                <a rel="author" href="/about">About</a>
+            </body></html>
+        "#;
+        let base_url = Some("https://example.com/");
+
+        let result = extract(html, base_url);
+
+        let hcards = extractors::microformats::hcard::extract(html, base_url).unwrap();
+        assert_eq!(result.hcard.len(), 1);
+        assert_eq!(result.hcard[0].name, hcards[0].name);
+        assert_eq!(result.microdata, extractors::microdata::extract(html, base_url).unwrap());
+        assert_eq!(result.rdfa, extractors::rdfa::extract(html, base_url).unwrap());
+        assert_eq!(result.rel_links, extractors::rel_links::extract(html, base_url).unwrap());
+        assert_eq!(result.dublin_core, extractors::dublin_core::extract(html).ok());
+        assert_eq!(result.oembed, extractors::oembed::extract(html, base_url).ok());
+        assert_eq!(result.manifest, extractors::manifest::extract(html, base_url).ok());
+    }
+
+    #[test]
+    fn test_markers() {
+        let markers = Markers::scan(r#"<DIV ItemScope><span class="H-Card"></span></DIV>"#);
+        assert!(markers.has(Marker::Microdata));
+        assert!(markers.has(Marker::HCard));
+        assert!(!markers.has(Marker::JsonLd));
+        assert!(!markers.has(Marker::HEntry));
+
+        let all = MARKERS.join(" ");
+        assert!(Markers::scan(&all).0.iter().all(|&present| present));
+    }
+
+    #[test]
+    fn test_empty_html() {
+        let result = extract("", None);
+        assert!(result.jsonld.is_empty());
+        assert!(!result.has_microformats());
+        assert!(result.oembed.is_none());
+        assert!(result.manifest.is_none());
+    }
+}
@@ -25,14 +25,51 @@ pub trait Extractor: Debug {
 
 /// Utility functions for URL resolution
 pub mod url_utils {
+    use std::cell::RefCell;
     use url::{ParseError, Url};
 
+    thread_local! {
+        /// The most recently parsed base URL. A page resolves every href against
+        /// the same base, so it only needs to be parsed once per document.
+        static LAST_BASE: RefCell<Option<(String, Url)>> = const { RefCell::new(None) };
+    }
+
+    /// Whether `url` starts with `http://` or `https://`, ignoring ASCII case
+    ///
+    /// Compares the first eight bytes as one word; only the scheme letters are
+    /// case-folded, so the `://` must match exactly.
+    fn has_http_scheme(url: &str) -> bool {
+        const HTTP: u64 = u64::from_le_bytes(*b"http://\0");
+        const HTTPS: u64 = u64::from_le_bytes(*b"https://");
+        let bytes = url.as_bytes();
+        if bytes.len() < 7 {
+            return false;
+        }
+        let mut head = [0u8; 8];
+        let len = bytes.len().min(head.len());
+        head[..len].copy_from_slice(&bytes[..len]);
+        let head = u64::from_le_bytes(head);
+        (head | 0x0000_0000_2020_2020) & 0x00ff_ffff_ffff_ffff == HTTP
+            || head | 0x0000_0020_2020_2020 == HTTPS
+    }
+
     /// Resolve a URL (possibly relative) against a base URL
     pub fn resolve_url(base_url: Option<&str>, url: &str) -> Result<String, ParseError> {
+        // An absolute http(s) URL resolves to itself whatever the base is
+        if has_http_scheme(url) {
+            return Ok(Url::parse(url)?.into());
+        }
+
         if let Some(base) = base_url {
-            let base_parsed = Url::parse(base)?;
-            let resolved = base_parsed.join(url)?;
-            Ok(resolved.to_string())
+            LAST_BASE.with(|cell| {
+                let mut cached = cell.borrow_mut();
+                if !matches!(&*cached, Some((s, _)) if s == base) {
+                    *cached = Some((base.to_string(), Url::parse(base)?));
+                }
+                let (_, base_parsed) = cached.as_ref().expect("base URL was cached above");
+                let resolved = base_parsed.join(url)?;
+                Ok(resolved.to_string())
+            })
         } else {
             // If no base URL, try parsing as absolute
             let parsed = Url::parse(url)?;
@@ -97,6 +134,28 @@ mod tests {
         assert_eq!(result.unwrap(), "https://other.com/");
     }
 
+    #[test]
+    fn test_resolve_url_base_changes() {
+        let first = url_utils::resolve_url(Some("https://a.example/x/"), "page");
+        let second = url_utils::resolve_url(Some("https://b.example/y/"), "page");
+        assert_eq!(first.unwrap(), "https://a.example/x/page");
+        assert_eq!(second.unwrap(), "https://b.example/y/page");
+        assert!(url_utils::resolve_url(Some("not a url"), "page").is_err());
+        let again = url_utils::resolve_url(Some("https://a.example/x/"), "/root");
+        assert_eq!(again.unwrap(), "https://a.example/root");
+    }
+
+    #[test]
+    fn test_resolve_url_absolute_skips_base() {
+        let result = url_utils::resolve_url(Some("not-a-url"), "HTTPS://Other.com/a");
+        assert_eq!(result.unwrap(), "https://other.com/a");
+        let result = url_utils::resolve_url(Some("https://example.com/p/"), "http:x");
+        assert_eq!(result.unwrap(), "http://x/");
+        let result = url_utils::resolve_url(Some("https://example.com/p/"), "https:/x");
+        assert_eq!(result.unwrap(), "https://example.com/x");
+        assert!(url_utils::resolve_url(None, "http://").is_err());
+    }
+
     #[test]
     fn test_resolve_url_no_base() {
         let result = url_utils::resolve_url(None, "https://example.com/");
@@ -5,6 +5,7 @@
 use crate::errors::Result;
 use crate::extractors::common::html_utils;
 use crate::types::dublin_core::DublinCore;
+use scraper::Html;
 
 #[cfg(test)]
 mod tests;
@@ -17,7 +18,11 @@ mod tests;
 /// # Returns
 /// * `Result<DublinCore>` - Extracted Dublin Core metadata or error
 pub fn extract(html: &str) -> Result<DublinCore> {
-    let document = html_utils::parse_html(html);
+    extract_from_document(&html_utils::parse_html(html))
+}
+
+/// Extract Dublin Core metadata from an already parsed document
+pub fn extract_from_document(document: &Html) -> Result<DublinCore> {
     let mut dc = DublinCore::default();
 
     // Extract Dublin Core meta tags (both DC. and dc. prefixes)
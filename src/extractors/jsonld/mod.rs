@@ -4,9 +4,13 @@
 //! Enables Google Rich Results, AI/LLM training data, and rich metadata.
 
 use crate::errors::Result;
-use crate::extractors::common::html_utils;
+use crate::extractors::scan;
 use crate::types::jsonld::JsonLdObject;
-use scraper::Selector;
+use scraper::{Html, Selector};
+use serde::de::DeserializeOwned;
+use serde_json::Value;
+
+pub mod path;
 
 #[cfg(test)]
 mod tests;
@@ -14,51 +18,128 @@ mod tests;
 /// Extract all JSON-LD objects from HTML
 ///
 /// Finds all <script type="application/ld+json"> tags and parses their JSON content.
+/// The HTML is only tokenized, not built into a document, since nothing outside
+/// the script text is needed.
 ///
 /// # Arguments
 /// * `html` - The HTML content
-/// * `_base_url` - Optional base URL (not used for JSON-LD)
+/// * `base_url` - Optional base URL (not used for JSON-LD)
 ///
 /// # Returns
 /// * `Result<Vec<JsonLdObject>>` - All JSON-LD objects found
 pub fn extract(html: &str, _base_url: Option<&str>) -> Result<Vec<JsonLdObject>> {
-    let document = html_utils::parse_html(html);
-    let mut objects = Vec::new();
+    Ok(parse_scripts(scan::jsonld_scripts(html)))
+}
 
-    // Find all <script type="application/ld+json"> tags
-    let selector = match Selector::parse("script[type='application/ld+json']") {
-        Ok(s) => s,
-        Err(_) => return Ok(objects),
-    };
+/// Extract all JSON-LD objects from an already parsed document
+pub fn extract_from_document(
+    document: &Html,
+    _base_url: Option<&str>,
+) -> Result<Vec<JsonLdObject>> {
+    Ok(parse_scripts(script_contents(document)))
+}
 
-    for script in document.select(&selector) {
-        // Get the text content of the script tag
-        let json_text: String = script.text().collect();
-        let json_text = json_text.trim();
+/// Parse JSON-LD script texts into objects, flattened by [`script_roots`]
+///
+/// Roots that aren't JSON objects are skipped.
+fn parse_scripts(scripts: Vec<String>) -> Vec<JsonLdObject> {
+    script_roots(scripts)
+        .into_iter()
+        .filter_map(|root| match serde_json::from_value::<JsonLdObject>(root) {
+            Ok(obj) => Some(obj),
+            Err(e) => {
+                // Log parse error but continue with other objects
+                eprintln!("JSON-LD parse error: {}", e);
+                None
+            }
+        })
+        .collect()
+}
 
-        if json_text.is_empty() {
-            continue;
-        }
+/// Parse JSON-LD script texts into the page's top-level JSON-LD values
+///
+/// A script may hold a single value or an array of them; each value that is
+/// an object with an `@graph` array is replaced by the graph's members.
+/// Shared by [`extract`] and [`select`] so both see the same roots.
+fn script_roots(scripts: Vec<String>) -> Vec<Value> {
+    let mut roots = Vec::new();
 
-        // Parse JSON
-        match serde_json::from_str::<JsonLdObject>(json_text) {
-            Ok(obj) => {
-                // If object has @graph, extract all items from graph
-                if let Some(ref graph) = obj.graph {
-                    objects.extend(graph.clone());
-                } else {
-                    objects.push(obj);
+    for json_text in scripts {
+        match parse_json::<Value>(json_text) {
+            Ok(Value::Array(items)) => {
+                for item in items {
+                    push_root(&mut roots, item);
                 }
             }
+            Ok(value) => push_root(&mut roots, value),
             Err(e) => {
                 // Log parse error but continue with other scripts
                 eprintln!("JSON-LD parse error: {}", e);
-                continue;
             }
         }
     }
 
-    Ok(objects)
+    roots
+}
+
+/// Add one top-level value, or its `@graph` members in its place
+fn push_root(roots: &mut Vec<Value>, mut value: Value) {
+    match value.get_mut("@graph") {
+        Some(Value::Array(graph)) => roots.append(graph),
+        _ => roots.push(value),
+    }
+}
+
+/// Select values from the page's JSON-LD with a JSONPath expression
+///
+/// The path root (`$`) is the list of JSON-LD values on the page, flattened
+/// exactly as for [`extract`] (see [`script_roots`]). Compiled paths are cached,
+/// so repeated queries only pay for evaluation. See [`path`] for the supported syntax.
+///
+/// # Arguments
+/// * `html` - The HTML content
+/// * `path` - JSONPath expression, e.g. `$..mainEntity[?(@['@type']=='Question')]`
+///
+/// # Returns
+/// * `Result<Vec<Value>>` - Matching values, or an error if the path is invalid
+pub fn select(html: &str, path: &str) -> Result<Vec<Value>> {
+    let compiled = path::compile_cached(path)?;
+    let roots = script_roots(scan::jsonld_scripts(html));
+
+    let root = Value::Array(roots);
+    Ok(compiled.select(&root).into_iter().cloned().collect())
+}
+
+/// Deserialize one script's JSON text
+///
+/// Uses simd-json when the `simd-json` feature is enabled (it is for the
+/// Python bindings), which parses the buffer in place; serde_json otherwise.
+/// simd-json is built with `big-int-as-float`, so integers beyond 64 bits
+/// become floats as they do with serde_json instead of failing the script.
+#[cfg(feature = "simd-json")]
+fn parse_json<T: DeserializeOwned>(json_text: String) -> std::result::Result<T, String> {
+    let mut bytes = json_text.into_bytes();
+    simd_json::serde::from_slice(&mut bytes).map_err(|e| e.to_string())
+}
+
+#[cfg(not(feature = "simd-json"))]
+fn parse_json<T: DeserializeOwned>(json_text: String) -> std::result::Result<T, String> {
+    serde_json::from_str(&json_text).map_err(|e| e.to_string())
+}
+
+/// Collect the trimmed, non-empty text of every JSON-LD script tag
+fn script_contents(document: &Html) -> Vec<String> {
+    // Find all <script type="application/ld+json"> tags
+    let selector = match Selector::parse("script[type='application/ld+json']") {
+        Ok(s) => s,
+        Err(_) => return Vec::new(),
+    };
+
+    document
+        .select(&selector)
+        .map(|script| script.text().collect::<String>().trim().to_string())
+        .filter(|json_text| !json_text.is_empty())
+        .collect()
 }
 
 /// Extract JSON-LD objects of a specific type
@@ -73,22 +154,8 @@ pub fn extract(html: &str, _base_url: Option<&str>) -> Result<Vec<JsonLdObject>>
 pub fn extract_by_type(html: &str, type_name: &str) -> Result<Vec<JsonLdObject>> {
     let all_objects = extract(html, None)?;
 
-    let filtered: Vec<JsonLdObject> = all_objects
-        .into_iter()
-        .filter(|obj| {
-            if let Some(ref type_) = obj.type_ {
-                match type_ {
-                    serde_json::Value::String(s) => s == type_name,
-                    serde_json::Value::Array(arr) => {
-                        arr.iter().any(|v| v.as_str() == Some(type_name))
-                    }
-                    _ => false,
-                }
-            } else {
-                false
-            }
-        })
-        .collect();
+    let filtered: Vec<JsonLdObject> =
+        all_objects.into_iter().filter(|obj| obj.has_type(type_name)).collect();
 
     Ok(filtered)
 }
@@ -0,0 +1,323 @@
+//! Minimal compiled JSONPath for selecting values out of extracted JSON-LD
+//!
+//! Paths are compiled once into a list of steps and evaluated directly over the
+//! parsed `serde_json::Value` tree, so only matching nodes are ever handed back
+//! to callers. The supported subset covers what Schema.org documents need:
+//!
+//! - `$` - the root (the list of JSON-LD objects found on the page)
+//! - `.name` / `['name']` - child property
+//! - `..name` / `..['name']` - recursive descent to every `name` property
+//! - `.*` / `[*]` - every array element or object value
+//! - `[0]` - array index
+//! - `[?(@.key=='value')]` / `[?(@['key']=='value')]` - equality filter
+//!
+//! Filters keep array elements whose `key` equals `value`. A filter applied to a
+//! single object tests the object itself, since JSON-LD often uses a bare object
+//! where a one-element array would be expected. When `key` holds an array (as
+//! `@type` may), the filter matches if any element equals `value`.
+
+use crate::errors::{MicroformatError, Result};
+use serde_json::Value;
+use std::collections::HashMap;
+use std::sync::{Arc, Mutex, OnceLock};
+
+/// Upper bound on cached compiled paths; the cache is cleared when it fills up
+const PATH_CACHE_CAPACITY: usize = 128;
+
+#[derive(Debug, Clone, PartialEq)]
+enum Step {
+    Child(String),
+    Descendant(String),
+    Wildcard,
+    Index(usize),
+    Filter { key: String, value: String },
+}
+
+/// A compiled JSONPath expression
+#[derive(Debug, Clone, PartialEq)]
+pub struct JsonPath {
+    steps: Vec<Step>,
+}
+
+impl JsonPath {
+    /// Compile a JSONPath expression
+    ///
+    /// # Errors
+    /// Returns `MicroformatError::ExtractionFailed` if the path is malformed or
+    /// uses syntax outside the supported subset.
+    pub fn compile(path: &str) -> Result<Self> {
+        let mut rest =
+            path.trim().strip_prefix('$').ok_or_else(|| path_error(path, "must start with '$'"))?;
+        let mut steps = Vec::new();
+        while !rest.is_empty() {
+            if let Some(r) = rest.strip_prefix("..") {
+                let (step, r) = if let Some(r) = r.strip_prefix('[') {
+                    parse_bracket(path, r)?
+                } else {
+                    let (name, r) = take_name(path, r)?;
+                    (Step::Child(name), r)
+                };
+                match step {
+                    Step::Child(name) => steps.push(Step::Descendant(name)),
+                    _ => return Err(path_error(path, "'..' must be followed by a property name")),
+                }
+                rest = r;
+            } else if let Some(r) = rest.strip_prefix('.') {
+                if let Some(r) = r.strip_prefix('*') {
+                    steps.push(Step::Wildcard);
+                    rest = r;
+                } else {
+                    let (name, r) = take_name(path, r)?;
+                    steps.push(Step::Child(name));
+                    rest = r;
+                }
+            } else if let Some(r) = rest.strip_prefix('[') {
+                let (step, r) = parse_bracket(path, r)?;
+                steps.push(step);
+                rest = r;
+            } else {
+                return Err(path_error(path, "expected '.', '..' or '['"));
+            }
+        }
+
+        Ok(Self { steps })
+    }
+
+    /// Evaluate the path against `root`, returning references to every match
+    pub fn select<'a>(&self, root: &'a Value) -> Vec<&'a Value> {
+        let mut current = vec![root];
+        for step in &self.steps {
+            let mut next = Vec::new();
+            for node in current {
+                apply_step(step, node, &mut next);
+            }
+            current = next;
+        }
+        current
+    }
+}
+
+/// Compile `path`, reusing a previously compiled instance when available
+pub fn compile_cached(path: &str) -> Result<Arc<JsonPath>> {
+    static CACHE: OnceLock<Mutex<HashMap<String, Arc<JsonPath>>>> = OnceLock::new();
+    let cache = CACHE.get_or_init(|| Mutex::new(HashMap::new()));
+
+    if let Some(compiled) = cache.lock().unwrap().get(path) {
+        return Ok(Arc::clone(compiled));
+    }
+
+    let compiled = Arc::new(JsonPath::compile(path)?);
+    let mut cache = cache.lock().unwrap();
+    if cache.len() >= PATH_CACHE_CAPACITY {
+        cache.clear();
+    }
+    cache.insert(path.to_string(), Arc::clone(&compiled));
+    Ok(compiled)
+}
+
+fn apply_step<'a>(step: &Step, node: &'a Value, out: &mut Vec<&'a Value>) {
+    match step {
+        Step::Child(name) => {
+            if let Some(v) = node.get(name.as_str()) {
+                out.push(v);
+            }
+        }
+        Step::Descendant(name) => collect_descendants(name, node, out),
+        Step::Wildcard => match node {
+            Value::Array(arr) => out.extend(arr.iter()),
+            Value::Object(map) => out.extend(map.values()),
+            _ => {}
+        },
+        Step::Index(i) => {
+            if let Some(v) = node.get(*i) {
+                out.push(v);
+            }
+        }
+        Step::Filter { key, value } => match node {
+            Value::Array(arr) => out.extend(arr.iter().filter(|v| filter_matches(v, key, value))),
+            Value::Object(_) if filter_matches(node, key, value) => out.push(node),
+            _ => {}
+        },
+    }
+}
+
+fn collect_descendants<'a>(name: &str, node: &'a Value, out: &mut Vec<&'a Value>) {
+    match node {
+        Value::Object(map) => {
+            if let Some(v) = map.get(name) {
+                out.push(v);
+            }
+            for v in map.values() {
+                collect_descendants(name, v, out);
+            }
+        }
+        Value::Array(arr) => {
+            for v in arr {
+                collect_descendants(name, v, out);
+            }
+        }
+        _ => {}
+    }
+}
+
+fn filter_matches(node: &Value, key: &str, value: &str) -> bool {
+    match node.get(key) {
+        Some(Value::String(s)) => s == value,
+        Some(Value::Array(arr)) => arr.iter().any(|v| v.as_str() == Some(value)),
+        _ => false,
+    }
+}
+
+fn path_error(path: &str, reason: &str) -> MicroformatError {
+    MicroformatError::ExtractionFailed(format!("Invalid JSONPath '{}': {}", path, reason))
+}
+
+/// Take a bare property name from the start of `s`
+fn take_name<'a>(path: &str, s: &'a str) -> Result<(String, &'a str)> {
+    let end = s
+        .find(|c: char| !(c.is_alphanumeric() || matches!(c, '_' | '-' | '@' | ':')))
+        .unwrap_or(s.len());
+    if end == 0 {
+        return Err(path_error(path, "expected a property name"));
+    }
+    Ok((s[..end].to_string(), &s[end..]))
+}
+
+/// Parse a bracket expression; `s` starts just after the opening '['
+fn parse_bracket<'a>(path: &str, s: &'a str) -> Result<(Step, &'a str)> {
+    let end = find_closing_bracket(s).ok_or_else(|| path_error(path, "unclosed '['"))?;
+    let inner = s[..end].trim();
+    let rest = &s[end + 1..];
+
+    if inner == "*" {
+        return Ok((Step::Wildcard, rest));
+    }
+    if let Some(name) = unquote(inner) {
+        return Ok((Step::Child(name.to_string()), rest));
+    }
+    if let Ok(index) = inner.parse::<usize>() {
+        return Ok((Step::Index(index), rest));
+    }
+    if let Some(expr) = inner.strip_prefix("?(").and_then(|e| e.strip_suffix(')')) {
+        let (lhs, rhs) =
+            expr.split_once("==").ok_or_else(|| path_error(path, "filters must use '=='"))?;
+        let key = lhs
+            .trim()
+            .strip_prefix('@')
+            .and_then(|k| {
+                k.strip_prefix('.').or_else(|| {
+                    k.strip_prefix('[').and_then(|k| k.strip_suffix(']')).and_then(unquote)
+                })
+            })
+            .filter(|k| !k.is_empty())
+            .ok_or_else(|| path_error(path, "filter must test '@.key' or \"@['key']\""))?;
+        let value = unquote(rhs.trim())
+            .ok_or_else(|| path_error(path, "filter value must be a quoted string"))?;
+        return Ok((Step::Filter { key: key.to_string(), value: value.to_string() }, rest));
+    }
+
+    Err(path_error(path, "unsupported bracket expression"))
+}
+
+/// Find the ']' matching an already-consumed '[', skipping quoted text
+fn find_closing_bracket(s: &str) -> Option<usize> {
+    let mut depth = 0usize;
+    let mut quote = None;
+    for (i, c) in s.char_indices() {
+        match (quote, c) {
+            (Some(q), c) if c == q => quote = None,
+            (Some(_), _) => {}
+            (None, '\'' | '"') => quote = Some(c),
+            (None, '[') => depth += 1,
+            (None, ']') if depth == 0 => return Some(i),
+            (None, ']') => depth -= 1,
+            _ => {}
+        }
+    }
+    None
+}
+
+/// Strip matching single or double quotes
+fn unquote(s: &str) -> Option<&str> {
+    s.strip_prefix('\'')
+        .and_then(|s| s.strip_suffix('\''))
+        .or_else(|| s.strip_prefix('"').and_then(|s| s.strip_suffix('"')))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use serde_json::json;
+
+    fn faq_root() -> Value {
+        json!([
+            {
+                "@type": "FAQPage",
+                "name": "FAQ",
+                "mainEntity": [
+                    {"@type": "Question", "name": "Q1"},
+                    {"@type": "Question", "name": "Q2"},
+                    {"@type": "Comment", "name": "C1"}
+                ]
+            },
+            {"@type": ["Organization", "Corporation"], "name": "Acme"}
+        ])
+    }
+
+    #[test]
+    fn test_descendant_with_filter() {
+        let root = faq_root();
+        let path = JsonPath::compile("$..mainEntity[?(@['@type']=='Question')]").unwrap();
+        let names: Vec<_> = path.select(&root).iter().map(|v| v["name"].clone()).collect();
+        assert_eq!(names, vec![json!("Q1"), json!("Q2")]);
+    }
+
+    #[test]
+    fn test_filter_then_child_then_wildcard() {
+        let root = faq_root();
+        let path = JsonPath::compile("$[?(@.@type == \"FAQPage\")].mainEntity[*]").unwrap();
+        assert_eq!(path.select(&root).len(), 3);
+    }
+
+    #[test]
+    fn test_filter_matches_type_array() {
+        let root = faq_root();
+        let path = JsonPath::compile("$[?(@['@type']=='Corporation')].name").unwrap();
+        assert_eq!(path.select(&root), vec![&json!("Acme")]);
+    }
+
+    #[test]
+    fn test_filter_on_single_object() {
+        let root = json!({"author": {"@type": "Person", "name": "Jane"}});
+        let path = JsonPath::compile("$.author[?(@['@type']=='Person')].name").unwrap();
+        assert_eq!(path.select(&root), vec![&json!("Jane")]);
+    }
+
+    #[test]
+    fn test_index_and_quoted_child() {
+        let root = faq_root();
+        let path = JsonPath::compile("$[0]['mainEntity'][1].name").unwrap();
+        assert_eq!(path.select(&root), vec![&json!("Q2")]);
+    }
+
+    #[test]
+    fn test_root_only() {
+        let root = faq_root();
+        let path = JsonPath::compile("$").unwrap();
+        assert_eq!(path.select(&root), vec![&root]);
+    }
+
+    #[test]
+    fn test_invalid_paths() {
+        for path in ["", "mainEntity", "$.", "$[", "$..*", "$[?(@.a)]", "$[?(@.a==b)]", "$x"] {
+            assert!(JsonPath::compile(path).is_err(), "{} should not compile", path);
+        }
+    }
+
+    #[test]
+    fn test_compile_cached_reuses_instance() {
+        let a = compile_cached("$..name").unwrap();
+        let b = compile_cached("$..name").unwrap();
+        assert!(Arc::ptr_eq(&a, &b));
+    }
+}
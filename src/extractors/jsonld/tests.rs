@@ -1,6 +1,6 @@
 //! Tests for JSON-LD extraction
 
-use crate::extractors::jsonld::{extract, extract_by_type};
+use crate::extractors::jsonld::{extract, extract_by_type, select};
 
 #[cfg(test)]
 mod jsonld_tests {
@@ -89,6 +89,28 @@ mod jsonld_tests {
         assert_eq!(people.len(), 1);
     }
 
+    #[test]
+    fn test_has_any_type() {
+        let html = r#"
+            <script type="application/ld+json">
+            {"@type": "Recipe", "name": "Pie"}
+            </script>
+            <script type="application/ld+json">
+            {"@type": ["Article", "NewsArticle"], "headline": "News"}
+            </script>
+            <script type="application/ld+json">
+            {"name": "Untyped"}
+            </script>
+        "#;
+
+        let types: std::collections::HashSet<String> =
+            ["Recipe", "NewsArticle"].iter().map(|s| s.to_string()).collect();
+        let objects = extract(html, None).unwrap();
+        let matching: Vec<_> = objects.iter().filter(|obj| obj.has_any_type(&types)).collect();
+        assert_eq!(matching.len(), 2);
+        assert!(!objects[2].has_any_type(&types));
+    }
+
     #[test]
     fn test_extract_empty_html() {
         let html = "";
@@ -752,4 +774,31 @@ mod jsonld_tests {
         let objects = extract(html, None).unwrap();
         assert_eq!(objects.len(), 1);
     }
+
+    #[test]
+    fn test_extract_and_select_share_roots() {
+        let html = r#"
+            <script type="application/ld+json">
+            [
+                {"@type": "Organization", "name": "Acme"},
+                {"@graph": [{"@type": "WebSite"}, {"@type": "WebPage"}]},
+                "not an object"
+            ]
+            </script>
+            <script type="application/ld+json">{"@type": "Article"}</script>
+        "#;
+
+        let types: Vec<_> = extract(html, None)
+            .unwrap()
+            .into_iter()
+            .map(|obj| obj.type_.unwrap().as_str().unwrap().to_string())
+            .collect();
+        assert_eq!(types, vec!["Organization", "WebSite", "WebPage", "Article"]);
+
+        // select sees the same roots, plus the non-object value extract skips
+        let roots = select(html, "$[*]").unwrap();
+        assert_eq!(roots.len(), 5);
+        let selected: Vec<_> = roots.iter().filter_map(|root| root["@type"].as_str()).collect();
+        assert_eq!(selected, types);
+    }
 }
@@ -5,10 +5,88 @@
 use crate::errors::Result;
 use crate::extractors::common::{html_utils, url_utils};
 use crate::types::meta::{AlternateLink, FeedLink, MetaTags, RobotsDirective};
+use phf::phf_map;
+use scraper::Html;
 
 #[cfg(test)]
 mod tests;
 
+/// `<meta name>` values with a dedicated [`MetaTags`] field
+#[derive(Clone, Copy)]
+enum MetaName {
+    Description,
+    Keywords,
+    Author,
+    Generator,
+    Viewport,
+    ThemeColor,
+    ApplicationName,
+    Referrer,
+    Robots,
+    Googlebot,
+    GoogleSiteVerification,
+    GoogleSigninClientId,
+    Msvalidate01,
+    YandexVerification,
+    PDomainVerify,
+    FacebookDomainVerification,
+    GoogleAnalytics,
+    MobileWebAppCapable,
+    AppleMobileWebAppCapable,
+    AppleMobileWebAppStatusBarStyle,
+    AppleMobileWebAppTitle,
+    AppleItunesApp,
+    GooglePlayApp,
+    FormatDetection,
+    MsapplicationTileColor,
+    MsapplicationTileImage,
+    MsapplicationConfig,
+}
+
+/// Lowercased `<meta name>` value → field, resolved with a single hash lookup
+static META_NAMES: phf::Map<&'static str, MetaName> = phf_map! {
+    "description" => MetaName::Description,
+    "keywords" => MetaName::Keywords,
+    "author" => MetaName::Author,
+    "generator" => MetaName::Generator,
+    "viewport" => MetaName::Viewport,
+    "theme-color" => MetaName::ThemeColor,
+    "application-name" => MetaName::ApplicationName,
+    "referrer" => MetaName::Referrer,
+    "robots" => MetaName::Robots,
+    "googlebot" => MetaName::Googlebot,
+    "google-site-verification" => MetaName::GoogleSiteVerification,
+    "google-signin-client_id" => MetaName::GoogleSigninClientId,
+    "msvalidate.01" => MetaName::Msvalidate01,
+    "yandex-verification" => MetaName::YandexVerification,
+    "p:domain_verify" => MetaName::PDomainVerify,
+    "facebook-domain-verification" => MetaName::FacebookDomainVerification,
+    "google-analytics" => MetaName::GoogleAnalytics,
+    "mobile-web-app-capable" => MetaName::MobileWebAppCapable,
+    "apple-mobile-web-app-capable" => MetaName::AppleMobileWebAppCapable,
+    "apple-mobile-web-app-status-bar-style" => MetaName::AppleMobileWebAppStatusBarStyle,
+    "apple-mobile-web-app-title" => MetaName::AppleMobileWebAppTitle,
+    "apple-itunes-app" => MetaName::AppleItunesApp,
+    "google-play-app" => MetaName::GooglePlayApp,
+    "format-detection" => MetaName::FormatDetection,
+    "msapplication-tilecolor" => MetaName::MsapplicationTileColor,
+    "msapplication-tileimage" => MetaName::MsapplicationTileImage,
+    "msapplication-config" => MetaName::MsapplicationConfig,
+};
+
+/// Look up `name` in [`META_NAMES`], ignoring ASCII case
+///
+/// The name is lowercased in a stack buffer rather than a new `String`; the
+/// fixed-size copy and lowercase loop compile to vector code. Names longer
+/// than the buffer can't be in the map.
+fn meta_name(name: &str) -> Option<MetaName> {
+    let mut buf = [0u8; 64];
+    let lower = buf.get_mut(..name.len())?;
+    lower.copy_from_slice(name.as_bytes());
+    lower.make_ascii_lowercase();
+    META_NAMES.get(std::str::from_utf8(lower).ok()?).copied()
+}
+
 /// Extract all standard meta tags from HTML
 ///
 /// # Arguments
@@ -18,7 +96,11 @@ mod tests;
 /// # Returns
 /// * `Result<MetaTags>` - Extracted meta tags or error
 pub fn extract(html: &str, base_url: Option<&str>) -> Result<MetaTags> {
-    let document = html_utils::parse_html(html);
+    extract_from_document(&html_utils::parse_html(html), base_url)
+}
+
+/// Extract all standard meta tags from an already parsed document
+pub fn extract_from_document(document: &Html, base_url: Option<&str>) -> Result<MetaTags> {
     let mut meta = MetaTags::default();
 
     // Extract title
@@ -58,14 +140,17 @@ pub fn extract(html: &str, base_url: Option<&str>) -> Result<MetaTags> {
             if let (Some(name), Some(content)) =
                 (html_utils::get_attr(&element, "name"), html_utils::get_attr(&element, "content"))
             {
+                let Some(kind) = meta_name(&name) else {
+                    continue;
+                };
                 let content = content.trim().to_string();
                 if content.is_empty() {
                     continue;
                 }
 
-                match name.to_lowercase().as_str() {
-                    "description" => meta.description = Some(content),
-                    "keywords" => {
+                match kind {
+                    MetaName::Description => meta.description = Some(content),
+                    MetaName::Keywords => {
                         meta.keywords = Some(
                             content
                                 .split(',')
@@ -74,44 +159,51 @@ pub fn extract(html: &str, base_url: Option<&str>) -> Result<MetaTags> {
                                 .collect(),
                         );
                     }
-                    "author" => meta.author = Some(content),
-                    "generator" => meta.generator = Some(content),
-                    "viewport" => meta.viewport = Some(content),
-                    "theme-color" => meta.theme_color = Some(content),
-                    "application-name" => meta.application_name = Some(content),
-                    "referrer" => meta.referrer = Some(content),
-                    "robots" => meta.robots = Some(RobotsDirective::parse(&content)),
-                    "googlebot" => meta.googlebot = Some(RobotsDirective::parse(&content)),
+                    MetaName::Author => meta.author = Some(content),
+                    MetaName::Generator => meta.generator = Some(content),
+                    MetaName::Viewport => meta.viewport = Some(content),
+                    MetaName::ThemeColor => meta.theme_color = Some(content),
+                    MetaName::ApplicationName => meta.application_name = Some(content),
+                    MetaName::Referrer => meta.referrer = Some(content),
+                    MetaName::Robots => meta.robots = Some(RobotsDirective::parse(&content)),
+                    MetaName::Googlebot => meta.googlebot = Some(RobotsDirective::parse(&content)),
                     // Site verification tags (Phase 6)
-                    "google-site-verification" => meta.google_site_verification = Some(content),
-                    "google-signin-client_id" => meta.google_signin_client_id = Some(content),
-                    "msvalidate.01" => meta.msvalidate_01 = Some(content),
-                    "yandex-verification" => meta.yandex_verification = Some(content),
-                    "p:domain_verify" => meta.p_domain_verify = Some(content),
-                    "facebook-domain-verification" => {
+                    MetaName::GoogleSiteVerification => {
+                        meta.google_site_verification = Some(content)
+                    }
+                    MetaName::GoogleSigninClientId => meta.google_signin_client_id = Some(content),
+                    MetaName::Msvalidate01 => meta.msvalidate_01 = Some(content),
+                    MetaName::YandexVerification => meta.yandex_verification = Some(content),
+                    MetaName::PDomainVerify => meta.p_domain_verify = Some(content),
+                    MetaName::FacebookDomainVerification => {
                         meta.facebook_domain_verification = Some(content)
                     }
                     // Analytics tags (Phase 6)
-                    "google-analytics" => meta.google_analytics = Some(content),
+                    MetaName::GoogleAnalytics => meta.google_analytics = Some(content),
                     // PWA meta tags (Phase 8)
-                    "mobile-web-app-capable" => meta.mobile_web_app_capable = Some(content),
+                    MetaName::MobileWebAppCapable => meta.mobile_web_app_capable = Some(content),
                     // Apple mobile meta tags (Phase 8)
-                    "apple-mobile-web-app-capable" => {
+                    MetaName::AppleMobileWebAppCapable => {
                         meta.apple_mobile_web_app_capable = Some(content)
                     }
-                    "apple-mobile-web-app-status-bar-style" => {
+                    MetaName::AppleMobileWebAppStatusBarStyle => {
                         meta.apple_mobile_web_app_status_bar_style = Some(content)
                     }
-                    "apple-mobile-web-app-title" => meta.apple_mobile_web_app_title = Some(content),
+                    MetaName::AppleMobileWebAppTitle => {
+                        meta.apple_mobile_web_app_title = Some(content)
+                    }
                     // Mobile App Links (Phase 8)
-                    "apple-itunes-app" => meta.apple_itunes_app = Some(content),
-                    "google-play-app" => meta.google_play_app = Some(content),
-                    "format-detection" => meta.format_detection = Some(content),
+                    MetaName::AppleItunesApp => meta.apple_itunes_app = Some(content),
+                    MetaName::GooglePlayApp => meta.google_play_app = Some(content),
+                    MetaName::FormatDetection => meta.format_detection = Some(content),
                     // Microsoft/Windows meta tags (Phase 8)
-                    "msapplication-tilecolor" => meta.msapplication_tile_color = Some(content),
-                    "msapplication-tileimage" => meta.msapplication_tile_image = Some(content),
-                    "msapplication-config" => meta.msapplication_config = Some(content),
-                    _ => {}
+                    MetaName::MsapplicationTileColor => {
+                        meta.msapplication_tile_color = Some(content)
+                    }
+                    MetaName::MsapplicationTileImage => {
+                        meta.msapplication_tile_image = Some(content)
+                    }
+                    MetaName::MsapplicationConfig => meta.msapplication_config = Some(content),
                 }
             }
         }
@@ -234,6 +234,19 @@ mod meta_extraction_tests {
         assert_eq!(meta.description, Some("Test".to_string()));
     }
 
+    #[test]
+    fn test_meta_name_lookup_edge_cases() {
+        let long_name = "x".repeat(100);
+        let html = format!(
+            r#"<meta name="Apple-Mobile-Web-App-Status-Bar-Style" content="black">
+               <meta name="{long_name}" content="ignored">
+               <meta name="déscription" content="ignored">"#
+        );
+        let meta = extract(&html, None).unwrap();
+        assert_eq!(meta.apple_mobile_web_app_status_bar_style, Some("black".to_string()));
+        assert_eq!(meta.description, None);
+    }
+
     // ========== COMPLEX REAL-WORLD EXAMPLES ==========
 
     #[test]
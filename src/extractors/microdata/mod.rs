@@ -6,7 +6,7 @@
 use crate::errors::Result;
 use crate::extractors::common::{html_utils, url_utils};
 use crate::types::microdata::MicrodataItem;
-use scraper::{ElementRef, Selector};
+use scraper::{ElementRef, Html, Selector};
 
 #[cfg(test)]
 mod tests;
@@ -22,7 +22,14 @@ mod tests;
 /// # Returns
 /// * `Result<Vec<MicrodataItem>>` - All microdata items found
 pub fn extract(html: &str, base_url: Option<&str>) -> Result<Vec<MicrodataItem>> {
-    let document = html_utils::parse_html(html);
+    extract_from_document(&html_utils::parse_html(html), base_url)
+}
+
+/// Extract all microdata items from an already parsed document
+pub fn extract_from_document(
+    document: &Html,
+    base_url: Option<&str>,
+) -> Result<Vec<MicrodataItem>> {
     let mut items = Vec::new();
 
     // Find all top-level itemscope elements (not nested)
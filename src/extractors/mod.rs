@@ -11,6 +11,12 @@
 
 pub mod common;
 
+// Streaming tag scans shared by the head-level extractors
+pub(crate) mod scan;
+
+// All formats at once, collected without touching Python
+pub mod all;
+
 // Phase 1: Standard Meta Tags (100% adoption) - IMPLEMENTED
 pub mod meta;
 
@@ -6,6 +6,7 @@
 use crate::errors::Result;
 use crate::extractors::common::{html_utils, url_utils};
 use crate::types::oembed::{OEmbedDiscovery, OEmbedEndpoint, OEmbedFormat};
+use scraper::Html;
 
 #[cfg(test)]
 mod tests;
@@ -19,7 +20,11 @@ mod tests;
 /// # Returns
 /// * `Result<OEmbedDiscovery>` - Discovered oEmbed endpoints or error
 pub fn extract(html: &str, base_url: Option<&str>) -> Result<OEmbedDiscovery> {
-    let document = html_utils::parse_html(html);
+    extract_from_document(&html_utils::parse_html(html), base_url)
+}
+
+/// Discover oEmbed endpoints from an already parsed document
+pub fn extract_from_document(document: &Html, base_url: Option<&str>) -> Result<OEmbedDiscovery> {
     let mut discovery = OEmbedDiscovery::default();
 
     // Look for link tags with rel="alternate" and type containing "oembed"
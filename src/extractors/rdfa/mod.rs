@@ -100,7 +100,11 @@ impl PrefixContext {
 /// assert_eq!(items.len(), 1);
 /// ```
 pub fn extract(html: &str, base_url: Option<&str>) -> Result<Vec<RdfaItem>> {
-    let doc = html_utils::parse_html(html);
+    extract_from_document(&html_utils::parse_html(html), base_url)
+}
+
+/// Extract RDFa items from an already parsed document
+pub fn extract_from_document(doc: &Html, base_url: Option<&str>) -> Result<Vec<RdfaItem>> {
     let mut items = Vec::new();
 
     // Create prefix context with default prefixes
@@ -115,7 +119,7 @@ pub fn extract(html: &str, base_url: Option<&str>) -> Result<Vec<RdfaItem>> {
     }
 
     // Find all RDFa root elements (elements with typeof or vocab)
-    let roots = find_rdfa_roots(&doc)?;
+    let roots = find_rdfa_roots(doc)?;
 
     for root in roots {
         let item = extract_item_with_context(&root, base_url, &prefix_ctx)?;
@@ -18,6 +18,7 @@
 
 use crate::errors::Result;
 use crate::extractors::common::{html_utils, url_utils};
+use scraper::Html;
 use std::collections::HashMap;
 
 /// Extract rel-* link relationships from HTML
@@ -31,7 +32,14 @@ use std::collections::HashMap;
 /// # Returns
 /// * `Result<HashMap<String, Vec<String>>>` - Map of rel type to URLs
 pub fn extract(html: &str, base_url: Option<&str>) -> Result<HashMap<String, Vec<String>>> {
-    let document = html_utils::parse_html(html);
+    extract_from_document(&html_utils::parse_html(html), base_url)
+}
+
+/// Extract rel-* link relationships from an already parsed document
+pub fn extract_from_document(
+    document: &Html,
+    base_url: Option<&str>,
+) -> Result<HashMap<String, Vec<String>>> {
     let mut rel_links: HashMap<String, Vec<String>> = HashMap::new();
 
     // Find all elements with rel and href attributes (link and a tags)
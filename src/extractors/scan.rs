@@ -0,0 +1,180 @@
+//! Streaming tag scans for the head-level extractors
+//!
+//! Open Graph, Twitter Cards and JSON-LD only look at `<meta>` attributes and
+//! `<script type="application/ld+json">` text, so their standalone extractors
+//! don't need a DOM at all. This drives the html5ever tokenizer directly and
+//! only keeps what was asked for; nothing else on the page is allocated as a
+//! node.
+//!
+//! The tree builder normally tells the tokenizer when to switch into raw text
+//! modes. Without it, the sink does so itself for the elements whose content
+//! is never markup, so e.g. a `<meta>` or `<script>` mentioned inside a
+//! `<style>` or a `<textarea>` is not mistaken for a real tag.
+
+use html5ever::tendril::StrTendril;
+use html5ever::tokenizer::states::RawKind;
+use html5ever::tokenizer::{
+    BufferQueue, TagKind, Token, TokenSink, TokenSinkResult, Tokenizer, TokenizerOpts,
+};
+
+const JSONLD_TYPE: &str = "application/ld+json";
+
+/// Attributes of a start tag, in source order
+#[derive(Debug, Default)]
+pub(crate) struct StartTag {
+    attrs: Vec<(String, String)>,
+}
+
+impl StartTag {
+    /// Value of the attribute `name`, if present
+    pub(crate) fn attr(&self, name: &str) -> Option<&str> {
+        self.attrs.iter().find(|(n, _)| n == name).map(|(_, v)| v.as_str())
+    }
+}
+
+#[derive(Default)]
+struct ScanSink {
+    collect_meta: bool,
+    collect_jsonld: bool,
+    meta: Vec<StartTag>,
+    in_jsonld: bool,
+    buffer: String,
+    scripts: Vec<String>,
+}
+
+impl ScanSink {
+    fn finish_script(&mut self) {
+        self.in_jsonld = false;
+        let text = self.buffer.trim();
+        if !text.is_empty() {
+            self.scripts.push(text.to_string());
+        }
+        self.buffer.clear();
+    }
+}
+
+impl TokenSink for ScanSink {
+    type Handle = ();
+
+    fn process_token(&mut self, token: Token, _line_number: u64) -> TokenSinkResult<()> {
+        match token {
+            Token::TagToken(tag) if tag.kind == TagKind::StartTag => match &*tag.name {
+                "meta" if self.collect_meta => {
+                    let attrs = tag
+                        .attrs
+                        .into_iter()
+                        .map(|attr| (attr.name.local.to_string(), attr.value.to_string()))
+                        .collect();
+                    self.meta.push(StartTag { attrs });
+                }
+                "script" => {
+                    self.in_jsonld = self.collect_jsonld
+                        && tag.attrs.iter().any(|attr| {
+                            &*attr.name.local == "type"
+                                && attr.value.eq_ignore_ascii_case(JSONLD_TYPE)
+                        });
+                    return TokenSinkResult::RawData(RawKind::ScriptData);
+                }
+                "style" | "xmp" | "iframe" | "noembed" | "noframes" | "noscript" => {
+                    return TokenSinkResult::RawData(RawKind::Rawtext);
+                }
+                "title" | "textarea" => return TokenSinkResult::RawData(RawKind::Rcdata),
+                "plaintext" => return TokenSinkResult::Plaintext,
+                _ => {}
+            },
+            Token::TagToken(tag) if self.in_jsonld && &*tag.name == "script" => {
+                self.finish_script();
+            }
+            Token::CharacterTokens(text) if self.in_jsonld => self.buffer.push_str(&text),
+            // An unclosed script runs to the end of the document
+            Token::EOFToken if self.in_jsonld => self.finish_script(),
+            _ => {}
+        }
+        TokenSinkResult::Continue
+    }
+}
+
+fn run(html: &str, sink: ScanSink) -> ScanSink {
+    let mut tokenizer = Tokenizer::new(sink, TokenizerOpts::default());
+    let mut queue = BufferQueue::default();
+    queue.push_back(StrTendril::from_slice(html));
+    let _ = tokenizer.feed(&mut queue);
+    tokenizer.end();
+    tokenizer.sink
+}
+
+/// Collect every `<meta>` start tag in `html`, in document order
+pub(crate) fn meta_tags(html: &str) -> Vec<StartTag> {
+    run(html, ScanSink { collect_meta: true, ..Default::default() }).meta
+}
+
+/// `(key, content)` pairs of the meta tags that carry both attributes
+///
+/// `key` is the attribute naming the property, e.g. `property` for Open Graph
+/// or `name` for Twitter Cards.
+pub(crate) fn meta_content<'a>(
+    tags: &'a [StartTag],
+    key: &'a str,
+) -> impl Iterator<Item = (&'a str, &'a str)> {
+    tags.iter().filter_map(move |tag| Some((tag.attr(key)?, tag.attr("content")?)))
+}
+
+/// Collect the trimmed, non-empty text of every JSON-LD script tag in `html`
+pub(crate) fn jsonld_scripts(html: &str) -> Vec<String> {
+    run(html, ScanSink { collect_jsonld: true, ..Default::default() }).scripts
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_collects_only_jsonld_scripts() {
+        let html = r#"
+            <script>var x = "<script type='application/ld+json'>";</script>
+            <script type="application/ld+json"> {"@type": "A"} </script>
+            <script type="Application/LD+JSON">{"@type": "B"}</script>
+            <script type="application/ld+json">   </script>
+        "#;
+        assert_eq!(jsonld_scripts(html), vec![r#"{"@type": "A"}"#, r#"{"@type": "B"}"#]);
+    }
+
+    #[test]
+    fn test_script_text_is_raw() {
+        let html = r#"<script type="application/ld+json">{"html": "<b>bold</b>"}</script>"#;
+        assert_eq!(jsonld_scripts(html), vec![r#"{"html": "<b>bold</b>"}"#]);
+    }
+
+    #[test]
+    fn test_ignores_markup_inside_raw_text_elements() {
+        let html = r#"
+            <textarea><script type="application/ld+json">{"@type": "A"}</script></textarea>
+            <style>/* <script type="application/ld+json">{}</script> */</style>
+            <title><meta property="og:title" content="Not a tag"></title>
+        "#;
+        assert!(jsonld_scripts(html).is_empty());
+        assert!(meta_tags(html).is_empty());
+    }
+
+    #[test]
+    fn test_unclosed_script() {
+        let html = r#"<script type="application/ld+json">{"@type": "A"}"#;
+        assert_eq!(jsonld_scripts(html), vec![r#"{"@type": "A"}"#]);
+    }
+
+    #[test]
+    fn test_meta_content_pairs() {
+        let html = r#"
+            <meta property="og:title" content="A &amp; B">
+            <META NAME="twitter:card" CONTENT="summary">
+            <meta property="og:image">
+            <body><meta property="og:type" content="article"></body>
+        "#;
+        let tags = meta_tags(html);
+        assert_eq!(tags.len(), 4);
+        let properties: Vec<_> = meta_content(&tags, "property").collect();
+        assert_eq!(properties, vec![("og:title", "A & B"), ("og:type", "article")]);
+        let names: Vec<_> = meta_content(&tags, "name").collect();
+        assert_eq!(names, vec![("twitter:card", "summary")]);
+    }
+}
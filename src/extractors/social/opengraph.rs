@@ -5,7 +5,9 @@
 
 use crate::errors::Result;
 use crate::extractors::common::{html_utils, url_utils};
+use crate::extractors::scan;
 use crate::types::social::{OgArticle, OgAudio, OgBook, OgImage, OgProfile, OgVideo, OpenGraph};
+use scraper::Html;
 
 /// Extract Open Graph metadata from HTML
 ///
@@ -16,7 +18,24 @@ use crate::types::social::{OgArticle, OgAudio, OgBook, OgImage, OgProfile, OgVid
 /// # Returns
 /// * `Result<OpenGraph>` - Extracted Open Graph data
 pub fn extract(html: &str, base_url: Option<&str>) -> Result<OpenGraph> {
-    let document = html_utils::parse_html(html);
+    let tags = scan::meta_tags(html);
+    Ok(from_properties(scan::meta_content(&tags, "property"), base_url))
+}
+
+/// Extract Open Graph metadata from an already parsed document
+pub fn extract_from_document(document: &Html, base_url: Option<&str>) -> Result<OpenGraph> {
+    let selector = html_utils::create_selector("meta[property]")?;
+    let properties = document.select(&selector).filter_map(|element| {
+        Some((element.value().attr("property")?, element.value().attr("content")?))
+    });
+    Ok(from_properties(properties, base_url))
+}
+
+/// Build Open Graph metadata from `(property, content)` pairs in document order
+pub(super) fn from_properties<'a>(
+    properties: impl IntoIterator<Item = (&'a str, &'a str)>,
+    base_url: Option<&str>,
+) -> OpenGraph {
     let mut og = OpenGraph::default();
 
     // Track current image/video/audio for structured properties
@@ -36,168 +55,157 @@ pub fn extract(html: &str, base_url: Option<&str>) -> Result<OpenGraph> {
     let mut profile_data = OgProfile::default();
     let mut has_profile_data = false;
 
-    // Extract meta tags with property="og:*" or property="article:*" etc.
-    if let Ok(selector) = html_utils::create_selector("meta[property]") {
-        for element in document.select(&selector) {
-            if let (Some(property), Some(content)) = (
-                html_utils::get_attr(&element, "property"),
-                html_utils::get_attr(&element, "content"),
-            ) {
-                let content = content.trim().to_string();
-                if content.is_empty() {
-                    continue;
+    // Meta tags with property="og:*" or property="article:*" etc.
+    for (property, content) in properties {
+        let content = content.trim().to_string();
+        if content.is_empty() {
+            continue;
+        }
+
+        // Parse property name
+        if let Some(prop) = property.strip_prefix("og:") {
+            match prop {
+                "title" => og.title = Some(content),
+                "type" => og.r#type = Some(content),
+                "url" => {
+                    og.url = Some(url_utils::resolve_url(base_url, &content).unwrap_or(content))
                 }
+                "image" => {
+                    // Save previous image if exists
+                    if let Some(img) = current_image.take() {
+                        og.images.push(img);
+                    }
 
-                // Parse property name
-                if let Some(prop) = property.strip_prefix("og:") {
-                    match prop {
-                        "title" => og.title = Some(content),
-                        "type" => og.r#type = Some(content),
-                        "url" => {
-                            og.url =
-                                Some(url_utils::resolve_url(base_url, &content).unwrap_or(content))
-                        }
-                        "image" => {
-                            // Save previous image if exists
-                            if let Some(img) = current_image.take() {
-                                og.images.push(img);
-                            }
+                    let resolved_url =
+                        url_utils::resolve_url(base_url, &content).unwrap_or(content.clone());
 
-                            let resolved_url = url_utils::resolve_url(base_url, &content)
-                                .unwrap_or(content.clone());
+                    // First image becomes the primary image
+                    if og.image.is_none() {
+                        og.image = Some(resolved_url.clone());
+                    }
 
-                            // First image becomes the primary image
-                            if og.image.is_none() {
-                                og.image = Some(resolved_url.clone());
-                            }
+                    // Start new image
+                    current_image = Some(OgImage { url: resolved_url, ..Default::default() });
+                }
+                "description" => og.description = Some(content),
+                "site_name" => og.site_name = Some(content),
+                "locale" => og.locale = Some(content),
 
-                            // Start new image
-                            current_image =
-                                Some(OgImage { url: resolved_url, ..Default::default() });
+                // Handle nested properties
+                _ if prop.starts_with("image:") => {
+                    if let Some(ref mut img) = current_image {
+                        match &prop[6..] {
+                            "secure_url" => img.secure_url = Some(content),
+                            "type" => img.r#type = Some(content),
+                            "width" => img.width = content.parse().ok(),
+                            "height" => img.height = content.parse().ok(),
+                            "alt" => img.alt = Some(content),
+                            _ => {}
                         }
-                        "description" => og.description = Some(content),
-                        "site_name" => og.site_name = Some(content),
-                        "locale" => og.locale = Some(content),
-
-                        // Handle nested properties
-                        _ if prop.starts_with("image:") => {
-                            if let Some(ref mut img) = current_image {
-                                match &prop[6..] {
-                                    "secure_url" => img.secure_url = Some(content),
-                                    "type" => img.r#type = Some(content),
-                                    "width" => img.width = content.parse().ok(),
-                                    "height" => img.height = content.parse().ok(),
-                                    "alt" => img.alt = Some(content),
-                                    _ => {}
-                                }
-                            }
+                    }
+                }
+                _ if prop.starts_with("video:") => match &prop[6..] {
+                    "secure_url" => {
+                        if let Some(ref mut video) = current_video {
+                            video.secure_url = Some(content);
                         }
-                        _ if prop.starts_with("video:") => match &prop[6..] {
-                            "secure_url" => {
-                                if let Some(ref mut video) = current_video {
-                                    video.secure_url = Some(content);
-                                }
-                            }
-                            "type" => {
-                                if let Some(ref mut video) = current_video {
-                                    video.r#type = Some(content);
-                                }
-                            }
-                            "width" => {
-                                if let Some(ref mut video) = current_video {
-                                    video.width = content.parse().ok();
-                                }
-                            }
-                            "height" => {
-                                if let Some(ref mut video) = current_video {
-                                    video.height = content.parse().ok();
-                                }
-                            }
-                            _ => {}
-                        },
-                        _ if prop.starts_with("audio:") => match &prop[6..] {
-                            "secure_url" => {
-                                if let Some(ref mut audio) = current_audio {
-                                    audio.secure_url = Some(content);
-                                }
-                            }
-                            "type" => {
-                                if let Some(ref mut audio) = current_audio {
-                                    audio.r#type = Some(content);
-                                }
-                            }
-                            _ => {}
-                        },
-                        _ if prop.starts_with("locale:") => {
-                            if &prop[7..] == "alternate" {
-                                og.locale_alternate.push(content);
-                            }
+                    }
+                    "type" => {
+                        if let Some(ref mut video) = current_video {
+                            video.r#type = Some(content);
                         }
-                        "video" => {
-                            // Save previous video if exists
-                            if let Some(video) = current_video.take() {
-                                og.videos.push(video);
-                            }
-
-                            let resolved_url =
-                                url_utils::resolve_url(base_url, &content).unwrap_or(content);
-
-                            // Start new video
-                            current_video =
-                                Some(OgVideo { url: resolved_url, ..Default::default() });
+                    }
+                    "width" => {
+                        if let Some(ref mut video) = current_video {
+                            video.width = content.parse().ok();
                         }
-                        "audio" => {
-                            // Save previous audio if exists
-                            if let Some(audio) = current_audio.take() {
-                                og.audios.push(audio);
-                            }
-
-                            let resolved_url =
-                                url_utils::resolve_url(base_url, &content).unwrap_or(content);
-
-                            // Start new audio
-                            current_audio =
-                                Some(OgAudio { url: resolved_url, ..Default::default() });
+                    }
+                    "height" => {
+                        if let Some(ref mut video) = current_video {
+                            video.height = content.parse().ok();
                         }
-                        _ => {}
                     }
-                } else if let Some(prop) = property.strip_prefix("article:") {
-                    has_article_data = true;
-                    match prop {
-                        "published_time" => article_data.published_time = Some(content),
-                        "modified_time" => article_data.modified_time = Some(content),
-                        "expiration_time" => article_data.expiration_time = Some(content),
-                        "author" => article_data.author.push(content),
-                        "section" => article_data.section = Some(content),
-                        "tag" => article_data.tag.push(content),
-                        _ => {}
+                    _ => {}
+                },
+                _ if prop.starts_with("audio:") => match &prop[6..] {
+                    "secure_url" => {
+                        if let Some(ref mut audio) = current_audio {
+                            audio.secure_url = Some(content);
+                        }
+                    }
+                    "type" => {
+                        if let Some(ref mut audio) = current_audio {
+                            audio.r#type = Some(content);
+                        }
                     }
-                } else if let Some(prop) = property.strip_prefix("book:") {
-                    has_book_data = true;
-                    match prop {
-                        "author" => book_data.author.push(content),
-                        "isbn" => book_data.isbn = Some(content),
-                        "release_date" => book_data.release_date = Some(content),
-                        "tag" => book_data.tag.push(content),
-                        _ => {}
+                    _ => {}
+                },
+                _ if prop.starts_with("locale:") => {
+                    if &prop[7..] == "alternate" {
+                        og.locale_alternate.push(content);
                     }
-                } else if let Some(prop) = property.strip_prefix("profile:") {
-                    has_profile_data = true;
-                    match prop {
-                        "first_name" => profile_data.first_name = Some(content),
-                        "last_name" => profile_data.last_name = Some(content),
-                        "username" => profile_data.username = Some(content),
-                        "gender" => profile_data.gender = Some(content),
-                        _ => {}
+                }
+                "video" => {
+                    // Save previous video if exists
+                    if let Some(video) = current_video.take() {
+                        og.videos.push(video);
                     }
-                } else if let Some(prop) = property.strip_prefix("fb:") {
-                    // Phase 6: Facebook platform integration
-                    match prop {
-                        "app_id" => og.fb_app_id = Some(content),
-                        "admins" => og.fb_admins = Some(content),
-                        _ => {}
+
+                    let resolved_url =
+                        url_utils::resolve_url(base_url, &content).unwrap_or(content);
+
+                    // Start new video
+                    current_video = Some(OgVideo { url: resolved_url, ..Default::default() });
+                }
+                "audio" => {
+                    // Save previous audio if exists
+                    if let Some(audio) = current_audio.take() {
+                        og.audios.push(audio);
                     }
+
+                    let resolved_url =
+                        url_utils::resolve_url(base_url, &content).unwrap_or(content);
+
+                    // Start new audio
+                    current_audio = Some(OgAudio { url: resolved_url, ..Default::default() });
                 }
+                _ => {}
+            }
+        } else if let Some(prop) = property.strip_prefix("article:") {
+            has_article_data = true;
+            match prop {
+                "published_time" => article_data.published_time = Some(content),
+                "modified_time" => article_data.modified_time = Some(content),
+                "expiration_time" => article_data.expiration_time = Some(content),
+                "author" => article_data.author.push(content),
+                "section" => article_data.section = Some(content),
+                "tag" => article_data.tag.push(content),
+                _ => {}
+            }
+        } else if let Some(prop) = property.strip_prefix("book:") {
+            has_book_data = true;
+            match prop {
+                "author" => book_data.author.push(content),
+                "isbn" => book_data.isbn = Some(content),
+                "release_date" => book_data.release_date = Some(content),
+                "tag" => book_data.tag.push(content),
+                _ => {}
+            }
+        } else if let Some(prop) = property.strip_prefix("profile:") {
+            has_profile_data = true;
+            match prop {
+                "first_name" => profile_data.first_name = Some(content),
+                "last_name" => profile_data.last_name = Some(content),
+                "username" => profile_data.username = Some(content),
+                "gender" => profile_data.gender = Some(content),
+                _ => {}
+            }
+        } else if let Some(prop) = property.strip_prefix("fb:") {
+            // Phase 6: Facebook platform integration
+            match prop {
+                "app_id" => og.fb_app_id = Some(content),
+                "admins" => og.fb_admins = Some(content),
+                _ => {}
             }
         }
     }
@@ -224,7 +232,7 @@ pub fn extract(html: &str, base_url: Option<&str>) -> Result<OpenGraph> {
         og.profile = Some(profile_data);
     }
 
-    Ok(og)
+    og
 }
 
 #[cfg(test)]
@@ -5,7 +5,9 @@
 
 use crate::errors::Result;
 use crate::extractors::common::{html_utils, url_utils};
-use crate::types::social::{TwitterApp, TwitterCard, TwitterPlayer};
+use crate::extractors::scan;
+use crate::types::social::{OpenGraph, TwitterApp, TwitterCard, TwitterPlayer};
+use scraper::Html;
 
 /// Extract Twitter Card metadata from HTML
 ///
@@ -16,7 +18,24 @@ use crate::types::social::{TwitterApp, TwitterCard, TwitterPlayer};
 /// # Returns
 /// * `Result<TwitterCard>` - Extracted Twitter Card data
 pub fn extract(html: &str, base_url: Option<&str>) -> Result<TwitterCard> {
-    let document = html_utils::parse_html(html);
+    let tags = scan::meta_tags(html);
+    Ok(from_names(scan::meta_content(&tags, "name"), base_url))
+}
+
+/// Extract Twitter Card metadata from an already parsed document
+pub fn extract_from_document(document: &Html, base_url: Option<&str>) -> Result<TwitterCard> {
+    let selector = html_utils::create_selector("meta[name]")?;
+    let names = document.select(&selector).filter_map(|element| {
+        Some((element.value().attr("name")?, element.value().attr("content")?))
+    });
+    Ok(from_names(names, base_url))
+}
+
+/// Build Twitter Card metadata from `(name, content)` pairs in document order
+fn from_names<'a>(
+    names: impl IntoIterator<Item = (&'a str, &'a str)>,
+    base_url: Option<&str>,
+) -> TwitterCard {
     let mut card = TwitterCard::default();
 
     // Track player/app metadata
@@ -28,97 +47,88 @@ pub fn extract(html: &str, base_url: Option<&str>) -> Result<TwitterCard> {
     let mut app_data = TwitterApp::default();
     let mut has_app_data = false;
 
-    // Extract meta tags with name="twitter:*"
-    if let Ok(selector) = html_utils::create_selector("meta[name]") {
-        for element in document.select(&selector) {
-            if let (Some(name), Some(content)) =
-                (html_utils::get_attr(&element, "name"), html_utils::get_attr(&element, "content"))
-            {
-                let content = content.trim().to_string();
-                if content.is_empty() {
-                    continue;
-                }
+    // Meta tags with name="twitter:*"
+    for (name, content) in names {
+        let content = content.trim().to_string();
+        if content.is_empty() {
+            continue;
+        }
 
-                // Parse name attribute
-                if let Some(prop) = name.strip_prefix("twitter:") {
-                    match prop {
-                        "card" => card.card = Some(content),
-                        "title" => card.title = Some(content),
-                        "description" => card.description = Some(content),
-                        "image" => {
-                            card.image =
-                                Some(url_utils::resolve_url(base_url, &content).unwrap_or(content))
-                        }
-                        "site" => card.site = Some(content),
-                        "creator" => card.creator = Some(content),
+        // Parse name attribute
+        if let Some(prop) = name.strip_prefix("twitter:") {
+            match prop {
+                "card" => card.card = Some(content),
+                "title" => card.title = Some(content),
+                "description" => card.description = Some(content),
+                "image" => {
+                    card.image = Some(url_utils::resolve_url(base_url, &content).unwrap_or(content))
+                }
+                "site" => card.site = Some(content),
+                "creator" => card.creator = Some(content),
 
-                        // Handle nested properties
-                        _ if prop.starts_with("image:") => {
-                            if &prop[6..] == "alt" {
-                                card.image_alt = Some(content);
-                            }
-                        }
-                        _ if prop.starts_with("site:") => {
-                            if &prop[5..] == "id" {
-                                card.site_id = Some(content);
+                // Handle nested properties
+                _ if prop.starts_with("image:") => {
+                    if &prop[6..] == "alt" {
+                        card.image_alt = Some(content);
+                    }
+                }
+                _ if prop.starts_with("site:") => {
+                    if &prop[5..] == "id" {
+                        card.site_id = Some(content);
+                    }
+                }
+                _ if prop.starts_with("creator:") => {
+                    if &prop[8..] == "id" {
+                        card.creator_id = Some(content);
+                    }
+                }
+                _ if prop.starts_with("player") => {
+                    if prop == "player" {
+                        player_url =
+                            Some(url_utils::resolve_url(base_url, &content).unwrap_or(content));
+                    } else if let Some(subprop) = prop.strip_prefix("player:") {
+                        match subprop {
+                            "width" => player_width = content.parse().ok(),
+                            "height" => player_height = content.parse().ok(),
+                            "stream" => {
+                                player_stream = Some(
+                                    url_utils::resolve_url(base_url, &content).unwrap_or(content),
+                                )
                             }
+                            _ => {}
                         }
-                        _ if prop.starts_with("creator:") => {
-                            if &prop[8..] == "id" {
-                                card.creator_id = Some(content);
-                            }
+                    }
+                }
+                _ if prop.starts_with("app:") => {
+                    has_app_data = true;
+                    let subprop = &prop[4..];
+
+                    if let Some(platform_prop) = subprop.strip_prefix("name:") {
+                        match platform_prop {
+                            "iphone" => app_data.name_iphone = Some(content),
+                            "ipad" => app_data.name_ipad = Some(content),
+                            "googleplay" => app_data.name_googleplay = Some(content),
+                            _ => {}
                         }
-                        _ if prop.starts_with("player") => {
-                            if prop == "player" {
-                                player_url = Some(
-                                    url_utils::resolve_url(base_url, &content).unwrap_or(content),
-                                );
-                            } else if let Some(subprop) = prop.strip_prefix("player:") {
-                                match subprop {
-                                    "width" => player_width = content.parse().ok(),
-                                    "height" => player_height = content.parse().ok(),
-                                    "stream" => {
-                                        player_stream = Some(
-                                            url_utils::resolve_url(base_url, &content)
-                                                .unwrap_or(content),
-                                        )
-                                    }
-                                    _ => {}
-                                }
-                            }
+                    } else if let Some(platform_prop) = subprop.strip_prefix("id:") {
+                        match platform_prop {
+                            "iphone" => app_data.id_iphone = Some(content),
+                            "ipad" => app_data.id_ipad = Some(content),
+                            "googleplay" => app_data.id_googleplay = Some(content),
+                            _ => {}
                         }
-                        _ if prop.starts_with("app:") => {
-                            has_app_data = true;
-                            let subprop = &prop[4..];
-
-                            if let Some(platform_prop) = subprop.strip_prefix("name:") {
-                                match platform_prop {
-                                    "iphone" => app_data.name_iphone = Some(content),
-                                    "ipad" => app_data.name_ipad = Some(content),
-                                    "googleplay" => app_data.name_googleplay = Some(content),
-                                    _ => {}
-                                }
-                            } else if let Some(platform_prop) = subprop.strip_prefix("id:") {
-                                match platform_prop {
-                                    "iphone" => app_data.id_iphone = Some(content),
-                                    "ipad" => app_data.id_ipad = Some(content),
-                                    "googleplay" => app_data.id_googleplay = Some(content),
-                                    _ => {}
-                                }
-                            } else if let Some(platform_prop) = subprop.strip_prefix("url:") {
-                                match platform_prop {
-                                    "iphone" => app_data.url_iphone = Some(content),
-                                    "ipad" => app_data.url_ipad = Some(content),
-                                    "googleplay" => app_data.url_googleplay = Some(content),
-                                    _ => {}
-                                }
-                            } else if subprop == "country" {
-                                app_data.country = Some(content);
-                            }
+                    } else if let Some(platform_prop) = subprop.strip_prefix("url:") {
+                        match platform_prop {
+                            "iphone" => app_data.url_iphone = Some(content),
+                            "ipad" => app_data.url_ipad = Some(content),
+                            "googleplay" => app_data.url_googleplay = Some(content),
+                            _ => {}
                         }
-                        _ => {}
+                    } else if subprop == "country" {
+                        app_data.country = Some(content);
                     }
                 }
+                _ => {}
             }
         }
     }
@@ -138,7 +148,7 @@ pub fn extract(html: &str, base_url: Option<&str>) -> Result<TwitterCard> {
         card.app = Some(app_data);
     }
 
-    Ok(card)
+    card
 }
 
 /// Extract Twitter Card with fallback to Open Graph
@@ -153,26 +163,50 @@ pub fn extract(html: &str, base_url: Option<&str>) -> Result<TwitterCard> {
 /// # Returns
 /// * `Result<TwitterCard>` - Extracted Twitter Card data with OG fallback
 pub fn extract_with_fallback(html: &str, base_url: Option<&str>) -> Result<TwitterCard> {
-    let mut card = extract(html, base_url)?;
+    let tags = scan::meta_tags(html);
+    let mut card = from_names(scan::meta_content(&tags, "name"), base_url);
 
-    // If critical Twitter fields are missing, try Open Graph
-    if card.title.is_none() || card.description.is_none() || card.image.is_none() {
-        let og = super::opengraph::extract(html, base_url)?;
+    if needs_og_fallback(&card) {
+        let og = super::opengraph::from_properties(scan::meta_content(&tags, "property"), base_url);
+        fill_from_og(&mut card, og);
+    }
 
-        if card.title.is_none() {
-            card.title = og.title;
-        }
-        if card.description.is_none() {
-            card.description = og.description;
-        }
-        if card.image.is_none() {
-            card.image = og.image;
-        }
+    Ok(card)
+}
+
+/// Extract Twitter Card with fallback to Open Graph from an already parsed document
+pub fn extract_with_fallback_from_document(
+    document: &Html,
+    base_url: Option<&str>,
+) -> Result<TwitterCard> {
+    let mut card = extract_from_document(document, base_url)?;
+
+    if needs_og_fallback(&card) {
+        let og = super::opengraph::extract_from_document(document, base_url)?;
+        fill_from_og(&mut card, og);
     }
 
     Ok(card)
 }
 
+/// Whether any of the critical Twitter fields is missing
+fn needs_og_fallback(card: &TwitterCard) -> bool {
+    card.title.is_none() || card.description.is_none() || card.image.is_none()
+}
+
+/// Fill missing critical Twitter fields from Open Graph
+fn fill_from_og(card: &mut TwitterCard, og: OpenGraph) {
+    if card.title.is_none() {
+        card.title = og.title;
+    }
+    if card.description.is_none() {
+        card.description = og.description;
+    }
+    if card.image.is_none() {
+        card.image = og.image;
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
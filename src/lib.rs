@@ -1,15 +1,29 @@
 // PyO3 macro expansions can trigger false positive clippy warnings
 #![allow(clippy::useless_conversion)]
 
+#[cfg(feature = "python")]
+use pyo3::buffer::PyBuffer;
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
+use pyo3::pybacked::{PyBackedBytes, PyBackedStr};
+#[cfg(feature = "python")]
+use pyo3::sync::GILOnceCell;
+#[cfg(feature = "python")]
 use pyo3::types::{PyDict, PyList};
 #[cfg(feature = "python")]
-use std::collections::HashMap;
+use rayon::prelude::*;
+#[cfg(feature = "python")]
+use std::cell::RefCell;
+#[cfg(feature = "python")]
+use std::collections::{HashMap, HashSet};
 
 mod errors;
-mod extractors;
+/// Per-format extractors, usable from Rust without the `python` feature
+///
+/// `extractors::all::extract` parses a page once and returns every format as
+/// typed structs in an [`AllResult`].
+pub mod extractors;
 pub mod ffi;
 #[macro_use]
 mod macros;
@@ -17,11 +31,62 @@ mod parser;
 mod types;
 
 pub use errors::{MicroformatError, Result};
+pub use extractors::all::AllResult;
 pub use types::*;
 
 // Re-export utilities needed by macros (required for macro expansion, not Python-specific)
 #[doc(hidden)]
 pub use extractors::common::{html_utils, url_utils};
+// Referenced by the exported macros so downstream users don't need their own
+// scraper dependency
+#[doc(hidden)]
+pub use scraper;
+
+/// HTML passed from Python as `str`, `bytes`, `bytearray` or `memoryview`
+///
+/// `str` and `bytes` are borrowed from the Python object without copying;
+/// other buffers are copied once. Byte input must be UTF-8 encoded.
+#[cfg(feature = "python")]
+enum HtmlInput {
+    Str(PyBackedStr),
+    Bytes(PyBackedBytes),
+    Buffer(Vec<u8>),
+}
+
+#[cfg(feature = "python")]
+impl<'py> FromPyObject<'py> for HtmlInput {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        if let Ok(s) = ob.extract::<PyBackedStr>() {
+            return Ok(Self::Str(s));
+        }
+        if let Ok(b) = ob.extract::<PyBackedBytes>() {
+            return Ok(Self::Bytes(b));
+        }
+        if let Ok(buffer) = PyBuffer::<u8>::get_bound(ob) {
+            return Ok(Self::Buffer(buffer.to_vec(ob.py())?));
+        }
+        Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
+            "html must be str, bytes, bytearray or memoryview",
+        ))
+    }
+}
+
+#[cfg(feature = "python")]
+impl HtmlInput {
+    fn as_str(&self) -> PyResult<&str> {
+        let bytes = match self {
+            Self::Str(s) => return Ok(&**s),
+            Self::Bytes(b) => &b[..],
+            Self::Buffer(v) => v.as_slice(),
+        };
+        std::str::from_utf8(bytes).map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                "HTML is not valid UTF-8: {}",
+                e
+            ))
+        })
+    }
+}
 
 #[cfg(feature = "python")]
 /// Extract microformats data from HTML content
@@ -184,11 +249,16 @@ fn extract_twitter_with_fallback(
 /// Extract JSON-LD structured data
 ///
 /// Args:
-///     html (str): HTML content to extract from
+///     html (str | bytes | bytearray | memoryview): HTML content to extract from.
+///         `bytes` must be UTF-8 encoded and are parsed without an intermediate copy.
 ///     base_url (str, optional): Base URL (not used for JSON-LD but included for consistency)
+///     types (set[str], optional): Only return objects whose @type is in this set.
+///         Filtering happens before conversion, so skipped objects cost no Python allocations.
+///     schema (type, optional): Convert each object with `msgspec.convert(obj, type=schema)`,
+///         e.g. a `msgspec.Struct` subclass. Requires the optional `msgspec` dependency.
 ///
 /// Returns:
-///     list: List of JSON-LD objects (dicts) found in the HTML
+///     list: List of JSON-LD objects (dicts, or `schema` instances) found in the HTML
 ///
 /// Example:
 ///     >>> import meta_oxide
@@ -196,16 +266,87 @@ fn extract_twitter_with_fallback(
 ///     >>> for obj in jsonld:
 ///     ...     print(obj.get('@type'))
 ///     ...     print(obj.get('headline'))
+///     >>> recipes = meta_oxide.extract_jsonld(html, types={"Recipe"})
 #[cfg(feature = "python")]
 #[pyfunction]
-#[pyo3(signature = (html, base_url=None))]
-fn extract_jsonld(py: Python, html: &str, base_url: Option<&str>) -> PyResult<Py<PyList>> {
-    let objects = extractors::jsonld::extract(html, base_url)
+#[pyo3(signature = (html, base_url=None, types=None, schema=None))]
+fn extract_jsonld<'py>(
+    py: Python<'py>,
+    html: HtmlInput,
+    base_url: Option<&str>,
+    types: Option<HashSet<String>>,
+    schema: Option<&Bound<'py, PyAny>>,
+) -> PyResult<Py<PyList>> {
+    let objects = extractors::jsonld::extract(html.as_str()?, base_url)
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
 
     let list = PyList::empty_bound(py);
     for obj in objects {
-        list.append(obj.to_py_dict(py)).unwrap();
+        if types.as_ref().map_or(true, |t| obj.has_any_type(t)) {
+            let dict = obj.to_py_dict(py);
+            match schema {
+                Some(schema) => list.append(convert_to_schema(py, dict, schema)?)?,
+                None => list.append(dict)?,
+            }
+        }
+    }
+    Ok(list.unbind())
+}
+
+#[cfg(feature = "python")]
+static MSGSPEC_CONVERT: GILOnceCell<PyObject> = GILOnceCell::new();
+
+/// Convert an extracted dict into `schema` via `msgspec.convert`
+///
+/// The `msgspec.convert` function is imported on first use and cached for the
+/// lifetime of the interpreter, so msgspec stays an optional dependency.
+#[cfg(feature = "python")]
+fn convert_to_schema<'py>(
+    py: Python<'py>,
+    dict: Py<PyDict>,
+    schema: &Bound<'py, PyAny>,
+) -> PyResult<Bound<'py, PyAny>> {
+    let convert = MSGSPEC_CONVERT.get_or_try_init(py, || {
+        py.import_bound("msgspec")?.getattr("convert").map(Bound::unbind)
+    })?;
+    let kwargs = PyDict::new_bound(py);
+    kwargs.set_item("type", schema)?;
+    convert.bind(py).call((dict,), Some(&kwargs))
+}
+
+/// Select values from JSON-LD structured data with a JSONPath expression
+///
+/// The root (`$`) is the list of JSON-LD objects on the page, with @graph members
+/// flattened. Matching runs over the parsed JSON in Rust, so only matched values
+/// are converted to Python objects. Compiled paths are cached between calls.
+///
+/// Supported syntax: `.name`, `['name']`, `..name`, `[*]`, `[0]`, and equality
+/// filters such as `[?(@['@type']=='Question')]`.
+///
+/// Args:
+///     html (str): HTML content to extract from
+///     path (str): JSONPath expression
+///
+/// Returns:
+///     list: Matching values (dicts, lists, or scalars)
+///
+/// Raises:
+///     ValueError: If the path is malformed or uses unsupported syntax
+///
+/// Example:
+///     >>> import meta_oxide
+///     >>> questions = meta_oxide.select(html, "$..mainEntity[?(@['@type']=='Question')]")
+///     >>> print(len(questions))
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(signature = (html, path))]
+fn select(py: Python, html: &str, path: &str) -> PyResult<Py<PyList>> {
+    let values = extractors::jsonld::select(html, path)
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+
+    let list = PyList::empty_bound(py);
+    for value in &values {
+        list.append(types::jsonld::json_value_to_py(py, value))?;
     }
     Ok(list.unbind())
 }
@@ -437,225 +578,192 @@ fn parse_manifest(py: Python, json: &str, base_url: Option<&str>) -> PyResult<Py
 #[pyfunction]
 #[pyo3(signature = (html, base_url=None))]
 fn extract_all(py: Python, html: &str, base_url: Option<&str>) -> PyResult<Py<PyDict>> {
-    let dict = PyDict::new_bound(py);
-
-    // Extract Phase 1: Standard Meta Tags
-    match extractors::meta::extract(html, base_url) {
-        Ok(meta_tags) => {
-            dict.set_item("meta", meta_tags.to_py_dict(py))?;
-        }
-        Err(e) => {
-            // Log error but continue with other extractors
-            eprintln!("Meta extraction warning: {}", e);
-        }
-    }
-
-    // Extract Phase 2: Open Graph
-    match extractors::social::extract_opengraph(html, base_url) {
-        Ok(og) => {
-            dict.set_item("opengraph", og.to_py_dict(py))?;
-        }
-        Err(e) => {
-            eprintln!("OpenGraph extraction warning: {}", e);
-        }
-    }
-
-    // Extract Phase 2: Twitter Cards (with fallback to OG)
-    match extractors::social::extract_twitter_with_fallback(html, base_url) {
-        Ok(twitter) => {
-            dict.set_item("twitter", twitter.to_py_dict(py))?;
-        }
-        Err(e) => {
-            eprintln!("Twitter extraction warning: {}", e);
-        }
-    }
-
-    // Extract Phase 3: JSON-LD (41% adoption, HIGHEST IMPACT)
-    match extractors::jsonld::extract(html, base_url) {
-        Ok(objects) => {
-            if !objects.is_empty() {
-                let list = PyList::empty_bound(py);
-                for obj in objects {
-                    list.append(obj.to_py_dict(py)).unwrap();
-                }
-                dict.set_item("jsonld", list)?;
-            }
-        }
-        Err(e) => {
-            eprintln!("JSON-LD extraction warning: {}", e);
-        }
-    }
-
-    // Extract Phase 4: Microdata (26% adoption)
-    match extractors::microdata::extract(html, base_url) {
-        Ok(items) => {
-            if !items.is_empty() {
-                let list = PyList::empty_bound(py);
-                for item in items {
-                    list.append(item.to_py_dict(py)).unwrap();
-                }
-                dict.set_item("microdata", list)?;
-            }
-        }
-        Err(e) => {
-            eprintln!("Microdata extraction warning: {}", e);
-        }
-    }
+    py.allow_threads(|| extractors::all::extract(html, base_url)).to_py_dict(py)
+}
 
-    // Extract Phase 7: Microformats (already implemented)
-    let mf_dict = PyDict::new_bound(py);
-    let mut has_microformats = false;
+/// Read-only mapping returned by `extract_all_lazy()`
+///
+/// Holds the extracted data on the Rust side and converts each top-level
+/// section (`"meta"`, `"jsonld"`, ...) to Python objects the first time it is
+/// read. Keys and values match `extract_all()`; sections that are never read
+/// are never converted.
+#[cfg(feature = "python")]
+#[pyclass(mapping, module = "meta_oxide")]
+struct ExtractionResult {
+    inner: extractors::all::AllResult,
+    cache: RefCell<HashMap<&'static str, PyObject>>,
+}
 
-    // Extract h-card
-    if let Ok(hcards) = extractors::microformats::hcard::extract(html, base_url) {
-        if !hcards.is_empty() {
-            let cards: Vec<_> = hcards.iter().map(|card| card.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-card", cards)?;
-            has_microformats = true;
-        }
+#[cfg(feature = "python")]
+impl ExtractionResult {
+    /// The static key matching `key`, if that section has data
+    fn present_key(&self, key: &str) -> Option<&'static str> {
+        extractors::all::KEYS.iter().copied().find(|k| *k == key && self.inner.has_section(k))
     }
 
-    // Extract h-entry
-    if let Ok(entries) = extractors::microformats::hentry::extract(html, base_url) {
-        if !entries.is_empty() {
-            let entries_py: Vec<_> = entries.iter().map(|e| e.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-entry", entries_py)?;
-            has_microformats = true;
-        }
+    fn present_keys(&self) -> Vec<&'static str> {
+        extractors::all::KEYS.iter().copied().filter(|k| self.inner.has_section(k)).collect()
     }
 
-    // Extract h-event
-    if let Ok(events) = extractors::microformats::hevent::extract(html, base_url) {
-        if !events.is_empty() {
-            let events_py: Vec<_> = events.iter().map(|e| e.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-event", events_py)?;
-            has_microformats = true;
+    fn section(&self, py: Python, key: &'static str) -> PyResult<PyObject> {
+        if let Some(value) = self.cache.borrow().get(key) {
+            return Ok(value.clone_ref(py));
         }
+        let value = self.inner.section_to_py(py, key)?.unwrap_or_else(|| py.None());
+        self.cache.borrow_mut().insert(key, value.clone_ref(py));
+        Ok(value)
     }
+}
 
-    // Extract h-review
-    if let Ok(reviews) = extractors::microformats::hreview::extract(html, base_url) {
-        if !reviews.is_empty() {
-            let reviews_py: Vec<_> = reviews.iter().map(|r| r.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-review", reviews_py)?;
-            has_microformats = true;
+#[cfg(feature = "python")]
+#[pymethods]
+impl ExtractionResult {
+    fn __getitem__(&self, py: Python, key: &str) -> PyResult<PyObject> {
+        match self.present_key(key) {
+            Some(key) => self.section(py, key),
+            None => Err(PyErr::new::<pyo3::exceptions::PyKeyError, _>(key.to_string())),
         }
     }
 
-    // Extract h-recipe
-    if let Ok(recipes) = extractors::microformats::hrecipe::extract(html, base_url) {
-        if !recipes.is_empty() {
-            let recipes_py: Vec<_> = recipes.iter().map(|r| r.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-recipe", recipes_py)?;
-            has_microformats = true;
-        }
+    fn __contains__(&self, key: &Bound<'_, PyAny>) -> bool {
+        key.extract::<PyBackedStr>().is_ok_and(|key| self.present_key(&key).is_some())
     }
 
-    // Extract h-product
-    if let Ok(products) = extractors::microformats::hproduct::extract(html, base_url) {
-        if !products.is_empty() {
-            let products_py: Vec<_> =
-                products.iter().map(|p| p.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-product", products_py)?;
-            has_microformats = true;
-        }
+    fn __len__(&self) -> usize {
+        self.present_keys().len()
     }
 
-    // Extract h-feed
-    if let Ok(feeds) = extractors::microformats::hfeed::extract(html, base_url) {
-        if !feeds.is_empty() {
-            let feeds_py: Vec<_> = feeds.iter().map(|f| f.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-feed", feeds_py)?;
-            has_microformats = true;
-        }
+    fn __iter__(&self, py: Python) -> PyResult<PyObject> {
+        let keys = PyList::new_bound(py, self.present_keys());
+        Ok(keys.as_any().iter()?.into_any().unbind())
     }
 
-    // Extract h-adr
-    if let Ok(addresses) = extractors::microformats::hadr::extract(html, base_url) {
-        if !addresses.is_empty() {
-            let addresses_py: Vec<_> =
-                addresses.iter().map(|a| a.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-adr", addresses_py)?;
-            has_microformats = true;
-        }
+    fn __repr__(&self) -> String {
+        format!("ExtractionResult(keys={:?})", self.present_keys())
     }
 
-    // Extract h-geo
-    if let Ok(geos) = extractors::microformats::hgeo::extract(html, base_url) {
-        if !geos.is_empty() {
-            let geos_py: Vec<_> = geos.iter().map(|g| g.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-geo", geos_py)?;
-            has_microformats = true;
+    /// Return the section `key`, or `default` if it is absent
+    #[pyo3(signature = (key, default=None))]
+    fn get(&self, py: Python, key: &str, default: Option<PyObject>) -> PyResult<PyObject> {
+        match self.present_key(key) {
+            Some(key) => self.section(py, key),
+            None => Ok(default.unwrap_or_else(|| py.None())),
         }
     }
 
-    if has_microformats {
-        dict.set_item("microformats", mf_dict)?;
+    /// Return the keys of the sections that have data
+    fn keys(&self) -> Vec<&'static str> {
+        self.present_keys()
     }
 
-    // Extract Phase 5: oEmbed endpoint discovery
-    match extractors::oembed::extract(html, base_url) {
-        Ok(oembed) => {
-            if oembed.has_endpoints() {
-                dict.set_item("oembed", oembed.to_py_dict(py))?;
-            }
-        }
-        Err(e) => {
-            eprintln!("oEmbed extraction warning: {}", e);
-        }
-    }
-
-    // Extract Phase 9: Dublin Core metadata
-    match extractors::dublin_core::extract(html) {
-        Ok(dc) => {
-            dict.set_item("dublin_core", dc.to_py_dict(py))?;
-        }
-        Err(e) => {
-            eprintln!("Dublin Core extraction warning: {}", e);
+    /// Convert every section and return a plain dict, as `extract_all()` would
+    fn to_dict(&self, py: Python) -> PyResult<Py<PyDict>> {
+        let dict = PyDict::new_bound(py);
+        for key in self.present_keys() {
+            dict.set_item(key, self.section(py, key)?)?;
         }
+        Ok(dict.unbind())
     }
+}
 
-    // Extract rel-* link relationships
-    match extractors::rel_links::extract(html, base_url) {
-        Ok(rel_links) => {
-            if !rel_links.is_empty() {
-                dict.set_item("rel_links", rel_links)?;
-            }
-        }
-        Err(e) => {
-            eprintln!("rel_links extraction warning: {}", e);
-        }
-    }
+/// Extract all metadata, converting each section to Python only when read
+///
+/// Same extraction as `extract_all()`, but returns an `ExtractionResult`
+/// mapping instead of a dict. Pipelines that only look at a few sections skip
+/// building Python objects for the rest, which matters for pages with large
+/// JSON-LD or microdata payloads. Use `to_dict()` when a real dict is needed.
+///
+/// Args:
+///     html (str): HTML content to parse
+///     base_url (str, optional): Base URL for resolving relative URLs
+///
+/// Returns:
+///     ExtractionResult: Mapping with the same keys and values as `extract_all()`
+///
+/// Example:
+///     >>> import meta_oxide
+///     >>> data = meta_oxide.extract_all_lazy(html)
+///     >>> if "jsonld" in data:
+///     ...     print(data["jsonld"][0].get("@type"))
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(signature = (html, base_url=None))]
+fn extract_all_lazy(py: Python, html: &str, base_url: Option<&str>) -> ExtractionResult {
+    let inner = py.allow_threads(|| extractors::all::extract(html, base_url));
+    ExtractionResult { inner, cache: RefCell::new(HashMap::new()) }
+}
 
-    // Extract RDFa (W3C standard with 62% adoption)
-    match extractors::rdfa::extract(html, base_url) {
-        Ok(rdfa_items) => {
-            if !rdfa_items.is_empty() {
-                let list = PyList::empty_bound(py);
-                for item in rdfa_items {
-                    list.append(item.to_py_dict(py)).unwrap();
-                }
-                dict.set_item("rdfa", list)?;
-            }
-        }
-        Err(e) => {
-            eprintln!("RDFa extraction warning: {}", e);
+/// Extract all metadata from many HTML documents in parallel
+///
+/// Parsing runs on a pool of worker threads with the GIL released, so a batch
+/// scales with the number of cores instead of being serialized on the
+/// interpreter. Each result has the same shape as `extract_all()`.
+///
+/// Args:
+///     htmls (list[str]): HTML documents to parse
+///     base_url (str, optional): Base URL for resolving relative URLs in every document
+///     base_urls (list[str | None], optional): Per-document base URLs, one per entry in
+///         `htmls`. A `None` entry falls back to `base_url`.
+///
+/// Returns:
+///     list[dict]: One `extract_all()` result per document, in input order
+///
+/// Raises:
+///     ValueError: If `base_urls` and `htmls` differ in length
+///
+/// Example:
+///     >>> import meta_oxide
+///     >>> results = meta_oxide.extract_all_batch([page_one, page_two])
+///     >>> titles = [r.get('meta', {}).get('title') for r in results]
+///     >>> results = meta_oxide.extract_all_batch(pages, base_urls=urls)
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(signature = (htmls, base_url=None, base_urls=None))]
+fn extract_all_batch(
+    py: Python,
+    htmls: Vec<PyBackedStr>,
+    base_url: Option<&str>,
+    base_urls: Option<Vec<Option<String>>>,
+) -> PyResult<Vec<Py<PyDict>>> {
+    if let Some(urls) = &base_urls {
+        if urls.len() != htmls.len() {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                "base_urls has {} entries but htmls has {}",
+                urls.len(),
+                htmls.len()
+            )));
         }
     }
 
-    // Extract Web App Manifest link
-    match extractors::manifest::extract(html, base_url) {
-        Ok(discovery) => {
-            if discovery.href.is_some() {
-                dict.set_item("manifest", discovery.to_py_dict(py))?;
-            }
-        }
-        Err(e) => {
-            eprintln!("Manifest extraction warning: {}", e);
-        }
-    }
+    let results: Vec<_> = py.allow_threads(|| {
+        htmls
+            .par_iter()
+            .enumerate()
+            .map(|(i, html)| {
+                let url = base_urls.as_ref().and_then(|urls| urls[i].as_deref()).or(base_url);
+                extractors::all::extract(html, url)
+            })
+            .collect()
+    });
+    results.iter().map(|result| result.to_py_dict(py)).collect()
+}
 
-    Ok(dict.unbind())
+/// Initialize the extension's one-time state ahead of the first real call
+///
+/// Runs every extractor over a minimal document and starts the worker pool
+/// used by `extract_all_batch()`, so that the first user-visible extraction
+/// does not pay for lazy initialization. Calling it is optional.
+///
+/// Example:
+///     >>> import meta_oxide
+///     >>> meta_oxide.warmup()
+#[cfg(feature = "python")]
+#[pyfunction]
+fn warmup(py: Python) {
+    py.allow_threads(|| {
+        extractors::all::extract("<html><head></head><body></body></html>", None);
+        rayon::current_num_threads();
+    });
 }
 
 #[cfg(feature = "python")]
@@ -672,6 +780,7 @@ fn meta_oxide(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     // Phase 3: JSON-LD
     m.add_function(wrap_pyfunction!(extract_jsonld, m)?)?;
+    m.add_function(wrap_pyfunction!(select, m)?)?;
 
     // Phase 4: Microdata
     m.add_function(wrap_pyfunction!(extract_microdata, m)?)?;
@@ -706,6 +815,10 @@ fn meta_oxide(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     // Main convenience function
     m.add_function(wrap_pyfunction!(extract_all, m)?)?;
+    m.add_function(wrap_pyfunction!(extract_all_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(extract_all_lazy, m)?)?;
+    m.add_class::<ExtractionResult>()?;
+    m.add_function(wrap_pyfunction!(warmup, m)?)?;
 
     // Add version
     m.add("__version__", env!("CARGO_PKG_VERSION"))?;
@@ -845,6 +958,16 @@ mod integration_tests {
             "#;
             let result = extract_all(py, html, Some("https://example.com"));
             assert!(result.is_ok());
+
+            let htmls: Vec<PyBackedStr> = (0..100)
+                .map(|_| pyo3::types::PyString::new_bound(py, html).extract().unwrap())
+                .collect();
+            let batch = extract_all_batch(py, htmls, Some("https://example.com"), None).unwrap();
+            assert_eq!(batch.len(), 100);
+            let expected = result.unwrap();
+            for dict in &batch {
+                assert!(dict.bind(py).eq(expected.bind(py)).unwrap());
+            }
         });
     }
 
@@ -47,10 +47,15 @@
 ///
 /// # Generated Code
 ///
-/// The macro generates a function with this signature:
+/// The macro generates these functions:
 /// ```ignore
 /// pub fn extract(html: &str, base_url: Option<&str>) -> Result<Vec<TypeName>>
+/// pub fn extract_from_document(document: &Html, base_url: Option<&str>) -> Result<Vec<TypeName>>
+/// pub fn extract_from_element(element: ElementRef, base_url: Option<&str>) -> Result<Vec<TypeName>>
 /// ```
+///
+/// Nested microformat properties use `extract_from_element` on the matched
+/// child element directly, rather than re-serializing and re-parsing it.
 #[macro_export]
 macro_rules! microformat_extractor {
     // Main entry point: TypeName, root_selector { field: type(selector), ... }
@@ -61,33 +66,24 @@ macro_rules! microformat_extractor {
             ),* $(,)?
         }
     ) => {
-        #[allow(unused_variables)]
-        pub fn extract(html: &str, base_url: Option<&str>) -> $crate::Result<Vec<$type_name>> {
-            use $crate::html_utils;
-
-            let document = html_utils::parse_html(html);
-            let mut items = Vec::new();
-
-            let root_selector = html_utils::create_selector($root_selector)?;
-
-            for element in document.select(&root_selector) {
-                let mut item = <$type_name>::default();
+        microformat_extractor!(@entry_points $type_name, $root_selector);
 
-                $(
-                    microformat_extractor!(@extract_property
-                        element,
-                        item,
-                        $field,
-                        $prop_type,
-                        $selector,
-                        base_url
-                    );
-                )*
-
-                items.push(item);
-            }
+        #[allow(unused_variables)]
+        fn extract_item(element: $crate::scraper::ElementRef<'_>, base_url: Option<&str>) -> $type_name {
+            let mut item = <$type_name>::default();
 
-            Ok(items)
+            $(
+                microformat_extractor!(@extract_property
+                    element,
+                    item,
+                    $field,
+                    $prop_type,
+                    $selector,
+                    base_url
+                );
+            )*
+
+            item
         }
     };
 
@@ -103,54 +99,74 @@ macro_rules! microformat_extractor {
             ),* $(,)?
         }
     ) => {
+        microformat_extractor!(@entry_points $type_name, $root_selector);
+
         #[allow(unused_variables)]
+        fn extract_item(element: $crate::scraper::ElementRef<'_>, base_url: Option<&str>) -> $type_name {
+            let mut item = <$type_name>::default();
+
+            // Extract regular properties
+            $(
+                microformat_extractor!(@extract_property
+                    element,
+                    item,
+                    $field,
+                    $prop_type,
+                    $($selector),+,
+                    base_url
+                );
+            )*
+
+            // Extract dual-field properties
+            $(
+                microformat_extractor!(@extract_dual_property
+                    element,
+                    item,
+                    $text_field,
+                    $nested_field,
+                    $dual_prop_type,
+                    $nested_sel,
+                    $text_sel,
+                    base_url
+                );
+            )*
+
+            item
+        }
+    };
+
+    // Public entry points shared by both forms; each root element is handed
+    // to the `extract_item` function generated alongside them
+    (@entry_points $type_name:ty, $root_selector:literal) => {
         pub fn extract(html: &str, base_url: Option<&str>) -> $crate::Result<Vec<$type_name>> {
-            use $crate::html_utils;
-
-            let document = html_utils::parse_html(html);
-            let mut items = Vec::new();
-
-            let root_selector = html_utils::create_selector($root_selector)?;
-
-            for element in document.select(&root_selector) {
-                let mut item = <$type_name>::default();
-
-                // Extract regular properties
-                $(
-                    microformat_extractor!(@extract_property
-                        element,
-                        item,
-                        $field,
-                        $prop_type,
-                        $($selector),+,
-                        base_url
-                    );
-                )*
-
-                // Extract dual-field properties
-                $(
-                    microformat_extractor!(@extract_dual_property
-                        element,
-                        item,
-                        $text_field,
-                        $nested_field,
-                        $dual_prop_type,
-                        $nested_sel,
-                        $text_sel,
-                        base_url
-                    );
-                )*
-
-                items.push(item);
-            }
+            extract_from_document(&$crate::html_utils::parse_html(html), base_url)
+        }
+
+        pub fn extract_from_document(
+            document: &$crate::scraper::Html,
+            base_url: Option<&str>,
+        ) -> $crate::Result<Vec<$type_name>> {
+            let root_selector = $crate::cached_selector!($root_selector)?;
+            Ok(document.select(root_selector).map(|element| extract_item(element, base_url)).collect())
+        }
 
-            Ok(items)
+        /// Extract items rooted at `element` itself or any of its descendants
+        pub fn extract_from_element(
+            element: $crate::scraper::ElementRef<'_>,
+            base_url: Option<&str>,
+        ) -> $crate::Result<Vec<$type_name>> {
+            let root_selector = $crate::cached_selector!($root_selector)?;
+            Ok(::std::iter::once(element)
+                .filter(|element| root_selector.matches(element))
+                .chain(element.select(root_selector))
+                .map(|element| extract_item(element, base_url))
+                .collect())
         }
     };
 
     // Extract a single text property
     (@extract_property $element:ident, $item:ident, $field:ident, text, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
+        if let Ok(sel) = $crate::cached_selector!($selector) {
             if let Some(elem) = $element.select(&sel).next() {
                 $item.$field = $crate::html_utils::extract_text(&elem);
             }
@@ -159,7 +175,7 @@ macro_rules! microformat_extractor {
 
     // Extract a URL property (from href or src attribute)
     (@extract_property $element:ident, $item:ident, $field:ident, url, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
+        if let Ok(sel) = $crate::cached_selector!($selector) {
             if let Some(elem) = $element.select(&sel).next() {
                 let url = $crate::html_utils::get_attr(&elem, "href")
                     .or_else(|| $crate::html_utils::get_attr(&elem, "src"));
@@ -184,7 +200,7 @@ macro_rules! microformat_extractor {
 
     // Extract HTML content (inner HTML)
     (@extract_property $element:ident, $item:ident, $field:ident, html, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
+        if let Ok(sel) = $crate::cached_selector!($selector) {
             if let Some(elem) = $element.select(&sel).next() {
                 let html_content = elem.inner_html().trim().to_string();
                 if !html_content.is_empty() {
@@ -196,7 +212,7 @@ macro_rules! microformat_extractor {
 
     // Extract datetime (from datetime attribute or text)
     (@extract_property $element:ident, $item:ident, $field:ident, date, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
+        if let Ok(sel) = $crate::cached_selector!($selector) {
             if let Some(elem) = $element.select(&sel).next() {
                 $item.$field = $crate::html_utils::get_attr(&elem, "datetime")
                     .or_else(|| $crate::html_utils::extract_text(&elem));
@@ -206,7 +222,7 @@ macro_rules! microformat_extractor {
 
     // Extract multiple text values (Vec<String>)
     (@extract_property $element:ident, $item:ident, $field:ident, multi_text, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
+        if let Ok(sel) = $crate::cached_selector!($selector) {
             for elem in $element.select(&sel) {
                 if let Some(text) = $crate::html_utils::extract_text(&elem) {
                     $item.$field.push(text);
@@ -217,7 +233,7 @@ macro_rules! microformat_extractor {
 
     // Extract multiple URLs (Vec<String>)
     (@extract_property $element:ident, $item:ident, $field:ident, multi_url, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
+        if let Ok(sel) = $crate::cached_selector!($selector) {
             for elem in $element.select(&sel) {
                 if let Some(url) = $crate::html_utils::get_attr(&elem, "href")
                     .or_else(|| $crate::html_utils::get_attr(&elem, "src")) {
@@ -239,7 +255,7 @@ macro_rules! microformat_extractor {
 
     // Extract numeric value (f32)
     (@extract_property $element:ident, $item:ident, $field:ident, number, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
+        if let Ok(sel) = $crate::cached_selector!($selector) {
             if let Some(elem) = $element.select(&sel).next() {
                 if let Some(text) = $crate::html_utils::extract_text(&elem) {
                     // Try to parse as f32
@@ -253,7 +269,7 @@ macro_rules! microformat_extractor {
 
     // Extract numeric value (f64)
     (@extract_property $element:ident, $item:ident, $field:ident, f64_number, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
+        if let Ok(sel) = $crate::cached_selector!($selector) {
             if let Some(elem) = $element.select(&sel).next() {
                 if let Some(text) = $crate::html_utils::extract_text(&elem) {
                     // Try to parse as f64
@@ -267,7 +283,7 @@ macro_rules! microformat_extractor {
 
     // Extract email (special handling for mailto: links)
     (@extract_property $element:ident, $item:ident, $field:ident, email, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
+        if let Ok(sel) = $crate::cached_selector!($selector) {
             if let Some(elem) = $element.select(&sel).next() {
                 $item.$field = $crate::html_utils::get_attr(&elem, "href")
                     .map(|s| s.trim_start_matches("mailto:").to_string())
@@ -278,10 +294,9 @@ macro_rules! microformat_extractor {
 
     // Extract nested h-card microformat (Option<Box<HCard>>)
     (@extract_property $element:ident, $item:ident, $field:ident, nested_hcard, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
+        if let Ok(sel) = $crate::cached_selector!($selector) {
             if let Some(elem) = $element.select(&sel).next() {
-                let nested_html = elem.html();
-                if let Ok(items) = $crate::extractors::microformats::hcard::extract(&nested_html, $base_url) {
+                if let Ok(items) = $crate::extractors::microformats::hcard::extract_from_element(elem, $base_url) {
                     if let Some(item) = items.first() {
                         $item.$field = Some(Box::new(item.clone()));
                     }
@@ -292,10 +307,9 @@ macro_rules! microformat_extractor {
 
     // Extract nested h-product microformat (Option<Box<HProduct>>)
     (@extract_property $element:ident, $item:ident, $field:ident, nested_hproduct, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
+        if let Ok(sel) = $crate::cached_selector!($selector) {
             if let Some(elem) = $element.select(&sel).next() {
-                let nested_html = elem.html();
-                if let Ok(items) = $crate::extractors::microformats::hproduct::extract(&nested_html, $base_url) {
+                if let Ok(items) = $crate::extractors::microformats::hproduct::extract_from_element(elem, $base_url) {
                     if let Some(item) = items.first() {
                         $item.$field = Some(Box::new(item.clone()));
                     }
@@ -309,10 +323,9 @@ macro_rules! microformat_extractor {
     (@extract_dual_property $element:ident, $item:ident, $text_field:ident, $nested_field:ident,
      nested_hcard_or_text, $nested_sel:expr, $text_sel:expr, $base_url:ident) => {
         let mut found_nested = false;
-        if let Ok(sel) = $crate::html_utils::create_selector($nested_sel) {
+        if let Ok(sel) = $crate::cached_selector!($nested_sel) {
             if let Some(elem) = $element.select(&sel).next() {
-                let nested_html = elem.html();
-                if let Ok(items) = $crate::extractors::microformats::hcard::extract(&nested_html, $base_url) {
+                if let Ok(items) = $crate::extractors::microformats::hcard::extract_from_element(elem, $base_url) {
                     if let Some(item) = items.first() {
                         $item.$nested_field = Some(Box::new(item.clone()));
                         found_nested = true;
@@ -321,7 +334,7 @@ macro_rules! microformat_extractor {
             }
         }
         if !found_nested {
-            if let Ok(sel) = $crate::html_utils::create_selector($text_sel) {
+            if let Ok(sel) = $crate::cached_selector!($text_sel) {
                 if let Some(elem) = $element.select(&sel).next() {
                     $item.$text_field = $crate::html_utils::extract_text(&elem);
                 }
@@ -334,10 +347,9 @@ macro_rules! microformat_extractor {
     (@extract_dual_property $element:ident, $item:ident, $text_field:ident, $nested_field:ident,
      nested_hproduct_or_text, $nested_sel:expr, $text_sel:expr, $base_url:ident) => {
         let mut found_nested = false;
-        if let Ok(sel) = $crate::html_utils::create_selector($nested_sel) {
+        if let Ok(sel) = $crate::cached_selector!($nested_sel) {
             if let Some(elem) = $element.select(&sel).next() {
-                let nested_html = elem.html();
-                if let Ok(items) = $crate::extractors::microformats::hproduct::extract(&nested_html, $base_url) {
+                if let Ok(items) = $crate::extractors::microformats::hproduct::extract_from_element(elem, $base_url) {
                     if let Some(item) = items.first() {
                         $item.$nested_field = Some(Box::new(item.clone()));
                         found_nested = true;
@@ -346,7 +358,7 @@ macro_rules! microformat_extractor {
             }
         }
         if !found_nested {
-            if let Ok(sel) = $crate::html_utils::create_selector($text_sel) {
+            if let Ok(sel) = $crate::cached_selector!($text_sel) {
                 if let Some(elem) = $element.select(&sel).next() {
                     $item.$text_field = $crate::html_utils::extract_text(&elem);
                 }
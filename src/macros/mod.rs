@@ -3,3 +3,4 @@
 #[allow(unused_imports)]
 pub mod microformat;
 pub mod py_bindings;
+pub mod selector;
@@ -0,0 +1,42 @@
+//! Per-call-site caching of compiled CSS selectors
+
+/// Compile a CSS selector literal once and reuse it on every later call
+///
+/// Each expansion owns its own `static`, so the selector is parsed the first
+/// time that call site runs and shared (across threads too) afterwards.
+/// Evaluates to `Result<&'static Selector>`.
+///
+/// # Example
+///
+/// ```ignore
+/// let sel = cached_selector!(".h-card")?;
+/// for element in document.select(sel) { /* ... */ }
+/// ```
+#[macro_export]
+macro_rules! cached_selector {
+    ($selector:expr) => {{
+        static SELECTOR: ::std::sync::OnceLock<::std::option::Option<$crate::scraper::Selector>> =
+            ::std::sync::OnceLock::new();
+        SELECTOR
+            .get_or_init(|| $crate::html_utils::create_selector($selector).ok())
+            .as_ref()
+            .ok_or_else(|| {
+                $crate::MicroformatError::ParseError(format!("Invalid selector '{}'", $selector))
+            })
+    }};
+}
+
+#[cfg(test)]
+mod tests {
+    #[test]
+    fn test_selector_is_compiled_once_per_call_site() {
+        let selectors: Vec<_> = (0..3).map(|_| cached_selector!(".h-card").unwrap()).collect();
+        assert!(std::ptr::eq(selectors[0], selectors[1]));
+        assert!(std::ptr::eq(selectors[1], selectors[2]));
+    }
+
+    #[test]
+    fn test_invalid_selector() {
+        assert!(cached_selector!("[[invalid").is_err());
+    }
+}
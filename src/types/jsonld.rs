@@ -3,13 +3,17 @@
 //! JSON-LD is the fastest-growing format (41% adoption) that enables
 //! Google Rich Results, AI/LLM training, and rich metadata extraction.
 
+#[cfg(feature = "python")]
+use pyo3::intern;
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
-use pyo3::types::PyDict;
+use pyo3::sync::GILOnceCell;
+#[cfg(feature = "python")]
+use pyo3::types::{PyDict, PyString};
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 
 /// Helper module for deserializing numeric values that might be strings or numbers
 mod string_or_number {
@@ -88,6 +92,30 @@ pub struct JsonLdObject {
     pub properties: HashMap<String, Value>,
 }
 
+impl JsonLdObject {
+    /// Check whether this object's @type matches `type_name`
+    ///
+    /// Handles both the single-string and the array form of @type.
+    pub fn has_type(&self, type_name: &str) -> bool {
+        match self.type_ {
+            Some(Value::String(ref s)) => s == type_name,
+            Some(Value::Array(ref arr)) => arr.iter().any(|v| v.as_str() == Some(type_name)),
+            _ => false,
+        }
+    }
+
+    /// Check whether any of this object's @type values is in `types`
+    pub fn has_any_type(&self, types: &HashSet<String>) -> bool {
+        match self.type_ {
+            Some(Value::String(ref s)) => types.contains(s),
+            Some(Value::Array(ref arr)) => {
+                arr.iter().filter_map(Value::as_str).any(|t| types.contains(t))
+            }
+            _ => false,
+        }
+    }
+}
+
 /// Article type (most common JSON-LD type)
 #[derive(Debug, Clone, PartialEq, Serialize, Deserialize, Default)]
 pub struct Article {
@@ -822,9 +850,102 @@ pub struct AggregateRating {
     pub item_reviewed: Option<Value>,
 }
 
+/// JSON-LD keywords and common Schema.org property names
+///
+/// Only these keys are interned. Keys come from the page, and interned strings
+/// are never freed (immortal on CPython 3.12+), so interning arbitrary keys
+/// would grow the interpreter without bound in a long-running scraper.
+#[cfg(feature = "python")]
+const KNOWN_KEYS: &[&str] = &[
+    "@context",
+    "@type",
+    "@id",
+    "@graph",
+    "@value",
+    "@language",
+    "@list",
+    "@set",
+    "@reverse",
+    "@vocab",
+    "@base",
+    "name",
+    "url",
+    "description",
+    "image",
+    "author",
+    "publisher",
+    "headline",
+    "datePublished",
+    "dateModified",
+    "logo",
+    "sameAs",
+    "mainEntity",
+    "mainEntityOfPage",
+    "text",
+    "acceptedAnswer",
+    "address",
+    "streetAddress",
+    "addressLocality",
+    "addressRegion",
+    "postalCode",
+    "addressCountry",
+    "telephone",
+    "email",
+    "geo",
+    "latitude",
+    "longitude",
+    "offers",
+    "price",
+    "priceCurrency",
+    "availability",
+    "brand",
+    "sku",
+    "aggregateRating",
+    "ratingValue",
+    "reviewCount",
+    "bestRating",
+    "worstRating",
+    "review",
+    "reviewRating",
+    "reviewBody",
+    "itemListElement",
+    "position",
+    "item",
+    "startDate",
+    "endDate",
+    "location",
+    "organizer",
+    "width",
+    "height",
+    "contentUrl",
+    "thumbnailUrl",
+    "uploadDate",
+    "duration",
+    "keywords",
+    "inLanguage",
+];
+
+/// Python string for a JSON-LD object key
+///
+/// Keys in [`KNOWN_KEYS`] are shared interned strings; any other key is built
+/// fresh so it is freed with the result.
+#[cfg(feature = "python")]
+fn key_to_py<'py>(py: Python<'py>, key: &str) -> Bound<'py, PyString> {
+    static KEYS: GILOnceCell<HashMap<&'static str, Py<PyString>>> = GILOnceCell::new();
+    let known = KEYS.get_or_init(py, || {
+        KNOWN_KEYS.iter().map(|&k| (k, PyString::intern_bound(py, k).unbind())).collect()
+    });
+    match known.get(key) {
+        Some(interned) => interned.bind(py).clone(),
+        None => PyString::new_bound(py, key),
+    }
+}
+
 /// Helper function to convert serde_json::Value to Python objects recursively
+///
+/// Well-known object keys are shared interned strings, see [`key_to_py`].
 #[cfg(feature = "python")]
-fn json_value_to_py(py: Python, value: &Value) -> PyObject {
+pub(crate) fn json_value_to_py(py: Python, value: &Value) -> PyObject {
     match value {
         Value::String(s) => s.to_object(py),
         Value::Number(n) => {
@@ -839,16 +960,13 @@ fn json_value_to_py(py: Python, value: &Value) -> PyObject {
         Value::Bool(b) => b.to_object(py),
         Value::Null => py.None(),
         Value::Array(arr) => {
-            let py_list = pyo3::types::PyList::empty_bound(py);
-            for item in arr {
-                py_list.append(json_value_to_py(py, item)).unwrap();
-            }
-            py_list.to_object(py)
+            let items = arr.iter().map(|item| json_value_to_py(py, item));
+            pyo3::types::PyList::new_bound(py, items).to_object(py)
         }
         Value::Object(map) => {
             let py_dict = PyDict::new_bound(py);
             for (key, val) in map {
-                py_dict.set_item(key, json_value_to_py(py, val)).unwrap();
+                py_dict.set_item(key_to_py(py, key), json_value_to_py(py, val)).unwrap();
             }
             py_dict.to_object(py)
         }
@@ -867,25 +985,26 @@ impl JsonLdObject {
         let dict = PyDict::new_bound(py);
 
         if let Some(ref context) = self.context {
-            dict.set_item("@context", json_value_to_py(py, context)).unwrap();
+            dict.set_item(intern!(py, "@context"), json_value_to_py(py, context)).unwrap();
         }
 
         if let Some(ref type_) = self.type_ {
-            dict.set_item("@type", json_value_to_py(py, type_)).unwrap();
+            dict.set_item(intern!(py, "@type"), json_value_to_py(py, type_)).unwrap();
         }
 
         if let Some(ref id) = self.id {
-            dict.set_item("@id", id).unwrap();
+            dict.set_item(intern!(py, "@id"), id).unwrap();
         }
 
         if let Some(ref graph) = self.graph {
-            let graph_list: Vec<_> = graph.iter().map(|obj| obj.to_py_dict(py)).collect();
-            dict.set_item("@graph", graph_list).unwrap();
+            let graph_list =
+                pyo3::types::PyList::new_bound(py, graph.iter().map(|obj| obj.to_py_dict(py)));
+            dict.set_item(intern!(py, "@graph"), graph_list).unwrap();
         }
 
         // Convert all other properties using deep conversion
         for (key, value) in &self.properties {
-            dict.set_item(key, json_value_to_py(py, value)).unwrap();
+            dict.set_item(key_to_py(py, key), json_value_to_py(py, value)).unwrap();
         }
 
         dict.unbind()
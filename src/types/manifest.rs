@@ -3,6 +3,8 @@
 //! Web App Manifest is a JSON file providing metadata for Progressive Web Apps (PWAs).
 //! It enables web applications to be installed on devices and provides app-like experiences.
 
+#[cfg(feature = "python")]
+use pyo3::intern;
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
@@ -183,43 +185,43 @@ impl WebAppManifest {
         let dict = PyDict::new_bound(py);
 
         if let Some(ref name) = self.name {
-            dict.set_item("name", name).unwrap();
+            dict.set_item(intern!(py, "name"), name).unwrap();
         }
         if let Some(ref short_name) = self.short_name {
-            dict.set_item("short_name", short_name).unwrap();
+            dict.set_item(intern!(py, "short_name"), short_name).unwrap();
         }
         if let Some(ref description) = self.description {
-            dict.set_item("description", description).unwrap();
+            dict.set_item(intern!(py, "description"), description).unwrap();
         }
         if let Some(ref start_url) = self.start_url {
-            dict.set_item("start_url", start_url).unwrap();
+            dict.set_item(intern!(py, "start_url"), start_url).unwrap();
         }
         if let Some(ref display) = self.display {
-            dict.set_item("display", display).unwrap();
+            dict.set_item(intern!(py, "display"), display).unwrap();
         }
         if let Some(ref orientation) = self.orientation {
-            dict.set_item("orientation", orientation).unwrap();
+            dict.set_item(intern!(py, "orientation"), orientation).unwrap();
         }
         if let Some(ref theme_color) = self.theme_color {
-            dict.set_item("theme_color", theme_color).unwrap();
+            dict.set_item(intern!(py, "theme_color"), theme_color).unwrap();
         }
         if let Some(ref background_color) = self.background_color {
-            dict.set_item("background_color", background_color).unwrap();
+            dict.set_item(intern!(py, "background_color"), background_color).unwrap();
         }
         if let Some(ref scope) = self.scope {
-            dict.set_item("scope", scope).unwrap();
+            dict.set_item(intern!(py, "scope"), scope).unwrap();
         }
         if let Some(ref lang) = self.lang {
-            dict.set_item("lang", lang).unwrap();
+            dict.set_item(intern!(py, "lang"), lang).unwrap();
         }
         if let Some(ref dir) = self.dir {
-            dict.set_item("dir", dir).unwrap();
+            dict.set_item(intern!(py, "dir"), dir).unwrap();
         }
         if let Some(ref id) = self.id {
-            dict.set_item("id", id).unwrap();
+            dict.set_item(intern!(py, "id"), id).unwrap();
         }
         if let Some(prefer) = self.prefer_related_applications {
-            dict.set_item("prefer_related_applications", prefer).unwrap();
+            dict.set_item(intern!(py, "prefer_related_applications"), prefer).unwrap();
         }
 
         // Icons array
@@ -228,7 +230,7 @@ impl WebAppManifest {
             for icon in &self.icons {
                 icons_list.append(icon.to_py_dict(py)).unwrap();
             }
-            dict.set_item("icons", icons_list).unwrap();
+            dict.set_item(intern!(py, "icons"), icons_list).unwrap();
         }
 
         // Related applications array
@@ -237,12 +239,12 @@ impl WebAppManifest {
             for app in &self.related_applications {
                 apps_list.append(app.to_py_dict(py)).unwrap();
             }
-            dict.set_item("related_applications", apps_list).unwrap();
+            dict.set_item(intern!(py, "related_applications"), apps_list).unwrap();
         }
 
         // Categories array
         if !self.categories.is_empty() {
-            dict.set_item("categories", self.categories.clone()).unwrap();
+            dict.set_item(intern!(py, "categories"), self.categories.clone()).unwrap();
         }
 
         // Screenshots array
@@ -251,7 +253,7 @@ impl WebAppManifest {
             for screenshot in &self.screenshots {
                 screenshots_list.append(screenshot.to_py_dict(py)).unwrap();
             }
-            dict.set_item("screenshots", screenshots_list).unwrap();
+            dict.set_item(intern!(py, "screenshots"), screenshots_list).unwrap();
         }
 
         // Shortcuts array
@@ -260,7 +262,7 @@ impl WebAppManifest {
             for shortcut in &self.shortcuts {
                 shortcuts_list.append(shortcut.to_py_dict(py)).unwrap();
             }
-            dict.set_item("shortcuts", shortcuts_list).unwrap();
+            dict.set_item(intern!(py, "shortcuts"), shortcuts_list).unwrap();
         }
 
         dict.unbind()
@@ -272,15 +274,15 @@ impl ManifestIcon {
     /// Convert to Python dictionary
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
-        dict.set_item("src", &self.src).unwrap();
+        dict.set_item(intern!(py, "src"), &self.src).unwrap();
         if let Some(ref sizes) = self.sizes {
-            dict.set_item("sizes", sizes).unwrap();
+            dict.set_item(intern!(py, "sizes"), sizes).unwrap();
         }
         if let Some(ref mime_type) = self.mime_type {
-            dict.set_item("type", mime_type).unwrap();
+            dict.set_item(intern!(py, "type"), mime_type).unwrap();
         }
         if let Some(ref purpose) = self.purpose {
-            dict.set_item("purpose", purpose).unwrap();
+            dict.set_item(intern!(py, "purpose"), purpose).unwrap();
         }
         dict.unbind()
     }
@@ -291,12 +293,12 @@ impl RelatedApplication {
     /// Convert to Python dictionary
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
-        dict.set_item("platform", &self.platform).unwrap();
+        dict.set_item(intern!(py, "platform"), &self.platform).unwrap();
         if let Some(ref url) = self.url {
-            dict.set_item("url", url).unwrap();
+            dict.set_item(intern!(py, "url"), url).unwrap();
         }
         if let Some(ref id) = self.id {
-            dict.set_item("id", id).unwrap();
+            dict.set_item(intern!(py, "id"), id).unwrap();
         }
         dict.unbind()
     }
@@ -307,15 +309,15 @@ impl ManifestImage {
     /// Convert to Python dictionary
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
-        dict.set_item("src", &self.src).unwrap();
+        dict.set_item(intern!(py, "src"), &self.src).unwrap();
         if let Some(ref sizes) = self.sizes {
-            dict.set_item("sizes", sizes).unwrap();
+            dict.set_item(intern!(py, "sizes"), sizes).unwrap();
         }
         if let Some(ref mime_type) = self.mime_type {
-            dict.set_item("type", mime_type).unwrap();
+            dict.set_item(intern!(py, "type"), mime_type).unwrap();
         }
         if let Some(ref label) = self.label {
-            dict.set_item("label", label).unwrap();
+            dict.set_item(intern!(py, "label"), label).unwrap();
         }
         dict.unbind()
     }
@@ -326,20 +328,20 @@ impl ManifestShortcut {
     /// Convert to Python dictionary
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
-        dict.set_item("name", &self.name).unwrap();
-        dict.set_item("url", &self.url).unwrap();
+        dict.set_item(intern!(py, "name"), &self.name).unwrap();
+        dict.set_item(intern!(py, "url"), &self.url).unwrap();
         if let Some(ref short_name) = self.short_name {
-            dict.set_item("short_name", short_name).unwrap();
+            dict.set_item(intern!(py, "short_name"), short_name).unwrap();
         }
         if let Some(ref description) = self.description {
-            dict.set_item("description", description).unwrap();
+            dict.set_item(intern!(py, "description"), description).unwrap();
         }
         if !self.icons.is_empty() {
             let icons_list = PyList::empty_bound(py);
             for icon in &self.icons {
                 icons_list.append(icon.to_py_dict(py)).unwrap();
             }
-            dict.set_item("icons", icons_list).unwrap();
+            dict.set_item(intern!(py, "icons"), icons_list).unwrap();
         }
         dict.unbind()
     }
@@ -351,10 +353,10 @@ impl ManifestDiscovery {
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
         if let Some(ref href) = self.href {
-            dict.set_item("href", href).unwrap();
+            dict.set_item(intern!(py, "href"), href).unwrap();
         }
         if let Some(ref manifest) = self.manifest {
-            dict.set_item("manifest", manifest.to_py_dict(py)).unwrap();
+            dict.set_item(intern!(py, "manifest"), manifest.to_py_dict(py)).unwrap();
         }
         dict.unbind()
     }
@@ -1,5 +1,7 @@
 //! Types for standard HTML meta tags (Phase 1)
 
+#[cfg(feature = "python")]
+use pyo3::intern;
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
@@ -153,147 +155,147 @@ impl MetaTags {
         let dict = PyDict::new_bound(py);
 
         if let Some(ref v) = self.title {
-            dict.set_item("title", v).unwrap();
+            dict.set_item(intern!(py, "title"), v).unwrap();
         }
         if let Some(ref v) = self.description {
-            dict.set_item("description", v).unwrap();
+            dict.set_item(intern!(py, "description"), v).unwrap();
         }
         if let Some(ref v) = self.keywords {
-            dict.set_item("keywords", v.clone()).unwrap();
+            dict.set_item(intern!(py, "keywords"), v.clone()).unwrap();
         }
         if let Some(ref v) = self.author {
-            dict.set_item("author", v).unwrap();
+            dict.set_item(intern!(py, "author"), v).unwrap();
         }
         if let Some(ref v) = self.canonical {
-            dict.set_item("canonical", v).unwrap();
+            dict.set_item(intern!(py, "canonical"), v).unwrap();
         }
         if let Some(ref v) = self.viewport {
-            dict.set_item("viewport", v).unwrap();
+            dict.set_item(intern!(py, "viewport"), v).unwrap();
         }
         if let Some(ref v) = self.charset {
-            dict.set_item("charset", v).unwrap();
+            dict.set_item(intern!(py, "charset"), v).unwrap();
         }
         if let Some(ref v) = self.language {
-            dict.set_item("language", v).unwrap();
+            dict.set_item(intern!(py, "language"), v).unwrap();
         }
         if let Some(ref v) = self.theme_color {
-            dict.set_item("theme_color", v).unwrap();
+            dict.set_item(intern!(py, "theme_color"), v).unwrap();
         }
         if let Some(ref v) = self.generator {
-            dict.set_item("generator", v).unwrap();
+            dict.set_item(intern!(py, "generator"), v).unwrap();
         }
         if let Some(ref v) = self.application_name {
-            dict.set_item("application_name", v).unwrap();
+            dict.set_item(intern!(py, "application_name"), v).unwrap();
         }
         if let Some(ref v) = self.referrer {
-            dict.set_item("referrer", v).unwrap();
+            dict.set_item(intern!(py, "referrer"), v).unwrap();
         }
         if let Some(ref v) = self.shortlink {
-            dict.set_item("shortlink", v).unwrap();
+            dict.set_item(intern!(py, "shortlink"), v).unwrap();
         }
 
         // Additional link types
         if let Some(ref v) = self.icon {
-            dict.set_item("icon", v).unwrap();
+            dict.set_item(intern!(py, "icon"), v).unwrap();
         }
         if let Some(ref v) = self.apple_touch_icon {
-            dict.set_item("apple_touch_icon", v).unwrap();
+            dict.set_item(intern!(py, "apple_touch_icon"), v).unwrap();
         }
         if let Some(ref v) = self.manifest {
-            dict.set_item("manifest", v).unwrap();
+            dict.set_item(intern!(py, "manifest"), v).unwrap();
         }
         if let Some(ref v) = self.prev {
-            dict.set_item("prev", v).unwrap();
+            dict.set_item(intern!(py, "prev"), v).unwrap();
         }
         if let Some(ref v) = self.next {
-            dict.set_item("next", v).unwrap();
+            dict.set_item(intern!(py, "next"), v).unwrap();
         }
 
         // Site verification
         if let Some(ref v) = self.google_site_verification {
-            dict.set_item("google_site_verification", v).unwrap();
+            dict.set_item(intern!(py, "google_site_verification"), v).unwrap();
         }
         if let Some(ref v) = self.google_signin_client_id {
-            dict.set_item("google_signin_client_id", v).unwrap();
+            dict.set_item(intern!(py, "google_signin_client_id"), v).unwrap();
         }
         if let Some(ref v) = self.msvalidate_01 {
-            dict.set_item("msvalidate_01", v).unwrap();
+            dict.set_item(intern!(py, "msvalidate_01"), v).unwrap();
         }
         if let Some(ref v) = self.yandex_verification {
-            dict.set_item("yandex_verification", v).unwrap();
+            dict.set_item(intern!(py, "yandex_verification"), v).unwrap();
         }
         if let Some(ref v) = self.p_domain_verify {
-            dict.set_item("p_domain_verify", v).unwrap();
+            dict.set_item(intern!(py, "p_domain_verify"), v).unwrap();
         }
         if let Some(ref v) = self.facebook_domain_verification {
-            dict.set_item("facebook_domain_verification", v).unwrap();
+            dict.set_item(intern!(py, "facebook_domain_verification"), v).unwrap();
         }
 
         // Analytics
         if let Some(ref v) = self.google_analytics {
-            dict.set_item("google_analytics", v).unwrap();
+            dict.set_item(intern!(py, "google_analytics"), v).unwrap();
         }
         if let Some(ref v) = self.fb_app_id {
-            dict.set_item("fb_app_id", v).unwrap();
+            dict.set_item(intern!(py, "fb_app_id"), v).unwrap();
         }
         if let Some(ref v) = self.fb_pages {
-            dict.set_item("fb_pages", v).unwrap();
+            dict.set_item(intern!(py, "fb_pages"), v).unwrap();
         }
 
         // PWA
         if let Some(ref v) = self.mobile_web_app_capable {
-            dict.set_item("mobile_web_app_capable", v).unwrap();
+            dict.set_item(intern!(py, "mobile_web_app_capable"), v).unwrap();
         }
 
         // Apple mobile
         if let Some(ref v) = self.apple_mobile_web_app_capable {
-            dict.set_item("apple_mobile_web_app_capable", v).unwrap();
+            dict.set_item(intern!(py, "apple_mobile_web_app_capable"), v).unwrap();
         }
         if let Some(ref v) = self.apple_mobile_web_app_status_bar_style {
-            dict.set_item("apple_mobile_web_app_status_bar_style", v).unwrap();
+            dict.set_item(intern!(py, "apple_mobile_web_app_status_bar_style"), v).unwrap();
         }
         if let Some(ref v) = self.apple_mobile_web_app_title {
-            dict.set_item("apple_mobile_web_app_title", v).unwrap();
+            dict.set_item(intern!(py, "apple_mobile_web_app_title"), v).unwrap();
         }
 
         // Mobile App Links
         if let Some(ref v) = self.apple_itunes_app {
-            dict.set_item("apple_itunes_app", v).unwrap();
+            dict.set_item(intern!(py, "apple_itunes_app"), v).unwrap();
         }
         if let Some(ref v) = self.google_play_app {
-            dict.set_item("google_play_app", v).unwrap();
+            dict.set_item(intern!(py, "google_play_app"), v).unwrap();
         }
         if let Some(ref v) = self.format_detection {
-            dict.set_item("format_detection", v).unwrap();
+            dict.set_item(intern!(py, "format_detection"), v).unwrap();
         }
 
         // Microsoft/Windows
         if let Some(ref v) = self.msapplication_tile_color {
-            dict.set_item("msapplication_tile_color", v).unwrap();
+            dict.set_item(intern!(py, "msapplication_tile_color"), v).unwrap();
         }
         if let Some(ref v) = self.msapplication_tile_image {
-            dict.set_item("msapplication_tile_image", v).unwrap();
+            dict.set_item(intern!(py, "msapplication_tile_image"), v).unwrap();
         }
         if let Some(ref v) = self.msapplication_config {
-            dict.set_item("msapplication_config", v).unwrap();
+            dict.set_item(intern!(py, "msapplication_config"), v).unwrap();
         }
 
         // Complex types as dictionaries
         if let Some(ref robots) = self.robots {
-            dict.set_item("robots", robots.to_py_dict(py)).unwrap();
+            dict.set_item(intern!(py, "robots"), robots.to_py_dict(py)).unwrap();
         }
         if let Some(ref googlebot) = self.googlebot {
-            dict.set_item("googlebot", googlebot.to_py_dict(py)).unwrap();
+            dict.set_item(intern!(py, "googlebot"), googlebot.to_py_dict(py)).unwrap();
         }
 
         // Lists
         if !self.alternate.is_empty() {
             let alternates: Vec<_> = self.alternate.iter().map(|a| a.to_py_dict(py)).collect();
-            dict.set_item("alternate", alternates).unwrap();
+            dict.set_item(intern!(py, "alternate"), alternates).unwrap();
         }
         if !self.feeds.is_empty() {
             let feeds: Vec<_> = self.feeds.iter().map(|f| f.to_py_dict(py)).collect();
-            dict.set_item("feeds", feeds).unwrap();
+            dict.set_item(intern!(py, "feeds"), feeds).unwrap();
         }
 
         dict.unbind()
@@ -305,24 +307,24 @@ impl RobotsDirective {
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
 
-        dict.set_item("raw", &self.raw).unwrap();
+        dict.set_item(intern!(py, "raw"), &self.raw).unwrap();
         if let Some(v) = self.index {
-            dict.set_item("index", v).unwrap();
+            dict.set_item(intern!(py, "index"), v).unwrap();
         }
         if let Some(v) = self.follow {
-            dict.set_item("follow", v).unwrap();
+            dict.set_item(intern!(py, "follow"), v).unwrap();
         }
         if let Some(v) = self.archive {
-            dict.set_item("archive", v).unwrap();
+            dict.set_item(intern!(py, "archive"), v).unwrap();
         }
         if let Some(v) = self.snippet {
-            dict.set_item("snippet", v).unwrap();
+            dict.set_item(intern!(py, "snippet"), v).unwrap();
         }
         if let Some(v) = self.translate {
-            dict.set_item("translate", v).unwrap();
+            dict.set_item(intern!(py, "translate"), v).unwrap();
         }
         if let Some(v) = self.imageindex {
-            dict.set_item("imageindex", v).unwrap();
+            dict.set_item(intern!(py, "imageindex"), v).unwrap();
         }
 
         dict.unbind()
@@ -333,15 +335,15 @@ impl RobotsDirective {
 impl AlternateLink {
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
-        dict.set_item("href", &self.href).unwrap();
+        dict.set_item(intern!(py, "href"), &self.href).unwrap();
         if let Some(ref v) = self.hreflang {
-            dict.set_item("hreflang", v).unwrap();
+            dict.set_item(intern!(py, "hreflang"), v).unwrap();
         }
         if let Some(ref v) = self.media {
-            dict.set_item("media", v).unwrap();
+            dict.set_item(intern!(py, "media"), v).unwrap();
         }
         if let Some(ref v) = self.r#type {
-            dict.set_item("type", v).unwrap();
+            dict.set_item(intern!(py, "type"), v).unwrap();
         }
         dict.unbind()
     }
@@ -351,10 +353,10 @@ impl AlternateLink {
 impl FeedLink {
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
-        dict.set_item("href", &self.href).unwrap();
-        dict.set_item("type", &self.r#type).unwrap();
+        dict.set_item(intern!(py, "href"), &self.href).unwrap();
+        dict.set_item(intern!(py, "type"), &self.r#type).unwrap();
         if let Some(ref v) = self.title {
-            dict.set_item("title", v).unwrap();
+            dict.set_item(intern!(py, "title"), v).unwrap();
         }
         dict.unbind()
     }
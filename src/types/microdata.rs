@@ -3,6 +3,8 @@
 //! Microdata is an HTML specification for embedding structured data using
 //! itemscope, itemtype, and itemprop attributes with Schema.org vocabulary.
 
+#[cfg(feature = "python")]
+use pyo3::intern;
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
@@ -82,12 +84,12 @@ impl MicrodataItem {
 
         // Add type(s) - always as a list for consistency
         if let Some(ref types) = self.item_type {
-            dict.set_item("type", types.clone()).unwrap();
+            dict.set_item(intern!(py, "type"), types.clone()).unwrap();
         }
 
         // Add id
         if let Some(ref id) = self.id {
-            dict.set_item("id", id).unwrap();
+            dict.set_item(intern!(py, "id"), id).unwrap();
         }
 
         // Add properties
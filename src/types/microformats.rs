@@ -1,4 +1,6 @@
 #[cfg(feature = "python")]
+use pyo3::intern;
+#[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
 use pyo3::types::PyDict;
@@ -17,7 +19,7 @@ pub struct MicroformatItem {
 impl MicroformatItem {
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
-        dict.set_item("type", self.type_.clone()).unwrap();
+        dict.set_item(intern!(py, "type"), self.type_.clone()).unwrap();
 
         // Convert properties
         let props = PyDict::new_bound(py);
@@ -25,13 +27,13 @@ impl MicroformatItem {
             let py_values: Vec<PyObject> = values.iter().map(|v| v.to_python(py)).collect();
             props.set_item(key, py_values).unwrap();
         }
-        dict.set_item("properties", props).unwrap();
+        dict.set_item(intern!(py, "properties"), props).unwrap();
 
         // Convert children if present
         if let Some(children) = &self.children {
             let py_children: Vec<PyObject> =
                 children.iter().map(|child| child.to_py_dict(py).into()).collect();
-            dict.set_item("children", py_children).unwrap();
+            dict.set_item(intern!(py, "children"), py_children).unwrap();
         }
 
         dict.into()
@@ -76,25 +78,25 @@ impl HCard {
         let dict = PyDict::new_bound(py);
 
         if let Some(name) = &self.name {
-            dict.set_item("name", name).unwrap();
+            dict.set_item(intern!(py, "name"), name).unwrap();
         }
         if let Some(url) = &self.url {
-            dict.set_item("url", url).unwrap();
+            dict.set_item(intern!(py, "url"), url).unwrap();
         }
         if let Some(photo) = &self.photo {
-            dict.set_item("photo", photo).unwrap();
+            dict.set_item(intern!(py, "photo"), photo).unwrap();
         }
         if let Some(email) = &self.email {
-            dict.set_item("email", email).unwrap();
+            dict.set_item(intern!(py, "email"), email).unwrap();
         }
         if let Some(tel) = &self.tel {
-            dict.set_item("tel", tel).unwrap();
+            dict.set_item(intern!(py, "tel"), tel).unwrap();
         }
         if let Some(note) = &self.note {
-            dict.set_item("note", note).unwrap();
+            dict.set_item(intern!(py, "note"), note).unwrap();
         }
         if let Some(org) = &self.org {
-            dict.set_item("org", org).unwrap();
+            dict.set_item(intern!(py, "org"), org).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
@@ -125,28 +127,28 @@ impl HEntry {
         let dict = PyDict::new_bound(py);
 
         if let Some(name) = &self.name {
-            dict.set_item("name", name).unwrap();
+            dict.set_item(intern!(py, "name"), name).unwrap();
         }
         if let Some(summary) = &self.summary {
-            dict.set_item("summary", summary).unwrap();
+            dict.set_item(intern!(py, "summary"), summary).unwrap();
         }
         if let Some(content) = &self.content {
-            dict.set_item("content", content).unwrap();
+            dict.set_item(intern!(py, "content"), content).unwrap();
         }
         if let Some(published) = &self.published {
-            dict.set_item("published", published).unwrap();
+            dict.set_item(intern!(py, "published"), published).unwrap();
         }
         if let Some(updated) = &self.updated {
-            dict.set_item("updated", updated).unwrap();
+            dict.set_item(intern!(py, "updated"), updated).unwrap();
         }
         if let Some(author) = &self.author {
-            dict.set_item("author", author.to_py_dict(py)).unwrap();
+            dict.set_item(intern!(py, "author"), author.to_py_dict(py)).unwrap();
         }
         if let Some(url) = &self.url {
-            dict.set_item("url", url).unwrap();
+            dict.set_item(intern!(py, "url"), url).unwrap();
         }
         if !self.category.is_empty() {
-            dict.set_item("category", self.category.clone()).unwrap();
+            dict.set_item(intern!(py, "category"), self.category.clone()).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
@@ -176,25 +178,25 @@ impl HEvent {
         let dict = PyDict::new_bound(py);
 
         if let Some(name) = &self.name {
-            dict.set_item("name", name).unwrap();
+            dict.set_item(intern!(py, "name"), name).unwrap();
         }
         if let Some(summary) = &self.summary {
-            dict.set_item("summary", summary).unwrap();
+            dict.set_item(intern!(py, "summary"), summary).unwrap();
         }
         if let Some(start) = &self.start {
-            dict.set_item("start", start).unwrap();
+            dict.set_item(intern!(py, "start"), start).unwrap();
         }
         if let Some(end) = &self.end {
-            dict.set_item("end", end).unwrap();
+            dict.set_item(intern!(py, "end"), end).unwrap();
         }
         if let Some(location) = &self.location {
-            dict.set_item("location", location).unwrap();
+            dict.set_item(intern!(py, "location"), location).unwrap();
         }
         if let Some(url) = &self.url {
-            dict.set_item("url", url).unwrap();
+            dict.set_item(intern!(py, "url"), url).unwrap();
         }
         if let Some(description) = &self.description {
-            dict.set_item("description", description).unwrap();
+            dict.set_item(intern!(py, "description"), description).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
@@ -242,55 +244,55 @@ impl HReview {
 
         // Modern properties
         if let Some(name) = &self.name {
-            dict.set_item("name", name).unwrap();
+            dict.set_item(intern!(py, "name"), name).unwrap();
         }
         if let Some(content) = &self.content {
-            dict.set_item("content", content).unwrap();
+            dict.set_item(intern!(py, "content"), content).unwrap();
         }
         if let Some(published) = &self.published {
-            dict.set_item("published", published).unwrap();
+            dict.set_item(intern!(py, "published"), published).unwrap();
         }
 
         // Legacy properties (backward compatibility)
         if let Some(summary) = &self.summary {
-            dict.set_item("summary", summary).unwrap();
+            dict.set_item(intern!(py, "summary"), summary).unwrap();
         }
         if let Some(dtreviewed) = &self.dtreviewed {
-            dict.set_item("dtreviewed", dtreviewed).unwrap();
+            dict.set_item(intern!(py, "dtreviewed"), dtreviewed).unwrap();
         }
         if let Some(description) = &self.description {
-            dict.set_item("description", description).unwrap();
+            dict.set_item(intern!(py, "description"), description).unwrap();
         }
 
         // Rating properties
         if let Some(rating) = self.rating {
-            dict.set_item("rating", rating).unwrap();
+            dict.set_item(intern!(py, "rating"), rating).unwrap();
         }
         if let Some(best) = self.best {
-            dict.set_item("best", best).unwrap();
+            dict.set_item(intern!(py, "best"), best).unwrap();
         }
         if let Some(worst) = self.worst {
-            dict.set_item("worst", worst).unwrap();
+            dict.set_item(intern!(py, "worst"), worst).unwrap();
         }
 
         // Item properties
         if let Some(item) = &self.item {
-            dict.set_item("item", item).unwrap();
+            dict.set_item(intern!(py, "item"), item).unwrap();
         }
         if let Some(item_product) = &self.item_product {
-            dict.set_item("item_product", item_product.to_py_dict(py)).unwrap();
+            dict.set_item(intern!(py, "item_product"), item_product.to_py_dict(py)).unwrap();
         }
 
         // Reviewer properties
         if let Some(reviewer) = &self.reviewer {
-            dict.set_item("reviewer", reviewer).unwrap();
+            dict.set_item(intern!(py, "reviewer"), reviewer).unwrap();
         }
         if let Some(reviewer_card) = &self.reviewer_card {
-            dict.set_item("reviewer_card", reviewer_card.to_py_dict(py)).unwrap();
+            dict.set_item(intern!(py, "reviewer_card"), reviewer_card.to_py_dict(py)).unwrap();
         }
 
         if let Some(url) = &self.url {
-            dict.set_item("url", url).unwrap();
+            dict.set_item(intern!(py, "url"), url).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
@@ -324,37 +326,37 @@ impl HRecipe {
         let dict = PyDict::new_bound(py);
 
         if let Some(name) = &self.name {
-            dict.set_item("name", name).unwrap();
+            dict.set_item(intern!(py, "name"), name).unwrap();
         }
         if let Some(summary) = &self.summary {
-            dict.set_item("summary", summary).unwrap();
+            dict.set_item(intern!(py, "summary"), summary).unwrap();
         }
         if !self.ingredient.is_empty() {
-            dict.set_item("ingredient", self.ingredient.clone()).unwrap();
+            dict.set_item(intern!(py, "ingredient"), self.ingredient.clone()).unwrap();
         }
         if let Some(instructions) = &self.instructions {
-            dict.set_item("instructions", instructions).unwrap();
+            dict.set_item(intern!(py, "instructions"), instructions).unwrap();
         }
         if let Some(duration) = &self.duration {
-            dict.set_item("duration", duration).unwrap();
+            dict.set_item(intern!(py, "duration"), duration).unwrap();
         }
         if let Some(yield_) = &self.yield_ {
-            dict.set_item("yield", yield_).unwrap();
+            dict.set_item(intern!(py, "yield"), yield_).unwrap();
         }
         if let Some(nutrition) = &self.nutrition {
-            dict.set_item("nutrition", nutrition).unwrap();
+            dict.set_item(intern!(py, "nutrition"), nutrition).unwrap();
         }
         if let Some(photo) = &self.photo {
-            dict.set_item("photo", photo).unwrap();
+            dict.set_item(intern!(py, "photo"), photo).unwrap();
         }
         if let Some(author) = &self.author {
-            dict.set_item("author", author).unwrap();
+            dict.set_item(intern!(py, "author"), author).unwrap();
         }
         if let Some(published) = &self.published {
-            dict.set_item("published", published).unwrap();
+            dict.set_item(intern!(py, "published"), published).unwrap();
         }
         if !self.category.is_empty() {
-            dict.set_item("category", self.category.clone()).unwrap();
+            dict.set_item(intern!(py, "category"), self.category.clone()).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
@@ -386,31 +388,31 @@ impl HProduct {
         let dict = PyDict::new_bound(py);
 
         if let Some(name) = &self.name {
-            dict.set_item("name", name).unwrap();
+            dict.set_item(intern!(py, "name"), name).unwrap();
         }
         if let Some(description) = &self.description {
-            dict.set_item("description", description).unwrap();
+            dict.set_item(intern!(py, "description"), description).unwrap();
         }
         if let Some(photo) = &self.photo {
-            dict.set_item("photo", photo).unwrap();
+            dict.set_item(intern!(py, "photo"), photo).unwrap();
         }
         if let Some(price) = &self.price {
-            dict.set_item("price", price).unwrap();
+            dict.set_item(intern!(py, "price"), price).unwrap();
         }
         if let Some(brand) = &self.brand {
-            dict.set_item("brand", brand).unwrap();
+            dict.set_item(intern!(py, "brand"), brand).unwrap();
         }
         if !self.category.is_empty() {
-            dict.set_item("category", self.category.clone()).unwrap();
+            dict.set_item(intern!(py, "category"), self.category.clone()).unwrap();
         }
         if let Some(rating) = self.rating {
-            dict.set_item("rating", rating).unwrap();
+            dict.set_item(intern!(py, "rating"), rating).unwrap();
         }
         if let Some(url) = &self.url {
-            dict.set_item("url", url).unwrap();
+            dict.set_item(intern!(py, "url"), url).unwrap();
         }
         if let Some(identifier) = &self.identifier {
-            dict.set_item("identifier", identifier).unwrap();
+            dict.set_item(intern!(py, "identifier"), identifier).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
@@ -437,16 +439,16 @@ impl HFeed {
         let dict = PyDict::new_bound(py);
 
         if let Some(name) = &self.name {
-            dict.set_item("name", name).unwrap();
+            dict.set_item(intern!(py, "name"), name).unwrap();
         }
         if let Some(author) = &self.author {
-            dict.set_item("author", author).unwrap();
+            dict.set_item(intern!(py, "author"), author).unwrap();
         }
         if let Some(url) = &self.url {
-            dict.set_item("url", url).unwrap();
+            dict.set_item(intern!(py, "url"), url).unwrap();
         }
         if let Some(photo) = &self.photo {
-            dict.set_item("photo", photo).unwrap();
+            dict.set_item(intern!(py, "photo"), photo).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
@@ -476,25 +478,25 @@ impl HAdr {
         let dict = PyDict::new_bound(py);
 
         if let Some(street_address) = &self.street_address {
-            dict.set_item("street_address", street_address).unwrap();
+            dict.set_item(intern!(py, "street_address"), street_address).unwrap();
         }
         if let Some(extended_address) = &self.extended_address {
-            dict.set_item("extended_address", extended_address).unwrap();
+            dict.set_item(intern!(py, "extended_address"), extended_address).unwrap();
         }
         if let Some(post_office_box) = &self.post_office_box {
-            dict.set_item("post_office_box", post_office_box).unwrap();
+            dict.set_item(intern!(py, "post_office_box"), post_office_box).unwrap();
         }
         if let Some(locality) = &self.locality {
-            dict.set_item("locality", locality).unwrap();
+            dict.set_item(intern!(py, "locality"), locality).unwrap();
         }
         if let Some(region) = &self.region {
-            dict.set_item("region", region).unwrap();
+            dict.set_item(intern!(py, "region"), region).unwrap();
         }
         if let Some(postal_code) = &self.postal_code {
-            dict.set_item("postal_code", postal_code).unwrap();
+            dict.set_item(intern!(py, "postal_code"), postal_code).unwrap();
         }
         if let Some(country_name) = &self.country_name {
-            dict.set_item("country_name", country_name).unwrap();
+            dict.set_item(intern!(py, "country_name"), country_name).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
@@ -520,13 +522,13 @@ impl HGeo {
         let dict = PyDict::new_bound(py);
 
         if let Some(latitude) = self.latitude {
-            dict.set_item("latitude", latitude).unwrap();
+            dict.set_item(intern!(py, "latitude"), latitude).unwrap();
         }
         if let Some(longitude) = self.longitude {
-            dict.set_item("longitude", longitude).unwrap();
+            dict.set_item(intern!(py, "longitude"), longitude).unwrap();
         }
         if let Some(altitude) = self.altitude {
-            dict.set_item("altitude", altitude).unwrap();
+            dict.set_item(intern!(py, "altitude"), altitude).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
@@ -3,6 +3,8 @@
 //! RDFa is a W3C standard for embedding structured data in HTML using attributes.
 //! It provides semantic markup for web content with 62% desktop adoption.
 
+#[cfg(feature = "python")]
+use pyo3::intern;
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
@@ -92,17 +94,17 @@ impl RdfaItem {
 
         // Add type(s) - always as a list for consistency
         if let Some(ref types) = self.type_of {
-            dict.set_item("type", types.clone()).unwrap();
+            dict.set_item(intern!(py, "type"), types.clone()).unwrap();
         }
 
         // Add vocab
         if let Some(ref vocab) = self.vocab {
-            dict.set_item("vocab", vocab).unwrap();
+            dict.set_item(intern!(py, "vocab"), vocab).unwrap();
         }
 
         // Add about
         if let Some(ref about) = self.about {
-            dict.set_item("about", about).unwrap();
+            dict.set_item(intern!(py, "about"), about).unwrap();
         }
 
         // Add properties
@@ -134,8 +136,8 @@ impl RdfaValue {
             RdfaValue::Item(item) => item.to_py_dict(py).to_object(py),
             RdfaValue::TypedLiteral { value, datatype } => {
                 let dict = PyDict::new_bound(py);
-                dict.set_item("value", value).unwrap();
-                dict.set_item("datatype", datatype).unwrap();
+                dict.set_item(intern!(py, "value"), value).unwrap();
+                dict.set_item(intern!(py, "datatype"), datatype).unwrap();
                 dict.to_object(py)
             }
         }
@@ -6,6 +6,8 @@
 //! - **Open Graph**: Used by Facebook, LinkedIn, WhatsApp, Slack, Discord (60%+ adoption)
 //! - **Twitter Cards**: Used by Twitter/X for link previews (45% adoption)
 
+#[cfg(feature = "python")]
+use pyo3::intern;
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
@@ -242,59 +244,59 @@ impl OpenGraph {
 
         // Basic metadata
         if let Some(ref v) = self.title {
-            let _ = dict.set_item("title", v);
+            let _ = dict.set_item(intern!(py, "title"), v);
         }
         if let Some(ref v) = self.r#type {
-            let _ = dict.set_item("type", v);
+            let _ = dict.set_item(intern!(py, "type"), v);
         }
         if let Some(ref v) = self.url {
-            let _ = dict.set_item("url", v);
+            let _ = dict.set_item(intern!(py, "url"), v);
         }
         if let Some(ref v) = self.image {
-            let _ = dict.set_item("image", v);
+            let _ = dict.set_item(intern!(py, "image"), v);
         }
         if let Some(ref v) = self.description {
-            let _ = dict.set_item("description", v);
+            let _ = dict.set_item(intern!(py, "description"), v);
         }
         if let Some(ref v) = self.site_name {
-            let _ = dict.set_item("site_name", v);
+            let _ = dict.set_item(intern!(py, "site_name"), v);
         }
         if let Some(ref v) = self.locale {
-            let _ = dict.set_item("locale", v);
+            let _ = dict.set_item(intern!(py, "locale"), v);
         }
 
         // Lists and complex types
         if !self.locale_alternate.is_empty() {
-            let _ = dict.set_item("locale_alternate", self.locale_alternate.clone());
+            let _ = dict.set_item(intern!(py, "locale_alternate"), self.locale_alternate.clone());
         }
         if !self.images.is_empty() {
             let images: Vec<_> = self.images.iter().map(|img| img.to_py_dict(py)).collect();
-            let _ = dict.set_item("images", images);
+            let _ = dict.set_item(intern!(py, "images"), images);
         }
         if !self.videos.is_empty() {
             let videos: Vec<_> = self.videos.iter().map(|v| v.to_py_dict(py)).collect();
-            let _ = dict.set_item("videos", videos);
+            let _ = dict.set_item(intern!(py, "videos"), videos);
         }
         if !self.audios.is_empty() {
             let audios: Vec<_> = self.audios.iter().map(|a| a.to_py_dict(py)).collect();
-            let _ = dict.set_item("audios", audios);
+            let _ = dict.set_item(intern!(py, "audios"), audios);
         }
         if let Some(ref article) = self.article {
-            let _ = dict.set_item("article", article.to_py_dict(py));
+            let _ = dict.set_item(intern!(py, "article"), article.to_py_dict(py));
         }
         if let Some(ref book) = self.book {
-            let _ = dict.set_item("book", book.to_py_dict(py));
+            let _ = dict.set_item(intern!(py, "book"), book.to_py_dict(py));
         }
         if let Some(ref profile) = self.profile {
-            let _ = dict.set_item("profile", profile.to_py_dict(py));
+            let _ = dict.set_item(intern!(py, "profile"), profile.to_py_dict(py));
         }
 
         // Platform integration (Phase 6)
         if let Some(ref v) = self.fb_app_id {
-            let _ = dict.set_item("fb_app_id", v);
+            let _ = dict.set_item(intern!(py, "fb_app_id"), v);
         }
         if let Some(ref v) = self.fb_admins {
-            let _ = dict.set_item("fb_admins", v);
+            let _ = dict.set_item(intern!(py, "fb_admins"), v);
         }
 
         dict.unbind()
@@ -306,21 +308,21 @@ impl OgImage {
     /// Convert OgImage to Python dictionary
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
-        let _ = dict.set_item("url", &self.url);
+        let _ = dict.set_item(intern!(py, "url"), &self.url);
         if let Some(ref v) = self.secure_url {
-            let _ = dict.set_item("secure_url", v);
+            let _ = dict.set_item(intern!(py, "secure_url"), v);
         }
         if let Some(ref v) = self.r#type {
-            let _ = dict.set_item("type", v);
+            let _ = dict.set_item(intern!(py, "type"), v);
         }
         if let Some(v) = self.width {
-            let _ = dict.set_item("width", v);
+            let _ = dict.set_item(intern!(py, "width"), v);
         }
         if let Some(v) = self.height {
-            let _ = dict.set_item("height", v);
+            let _ = dict.set_item(intern!(py, "height"), v);
         }
         if let Some(ref v) = self.alt {
-            let _ = dict.set_item("alt", v);
+            let _ = dict.set_item(intern!(py, "alt"), v);
         }
         dict.unbind()
     }
@@ -331,18 +333,18 @@ impl OgVideo {
     /// Convert OgVideo to Python dictionary
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
-        let _ = dict.set_item("url", &self.url);
+        let _ = dict.set_item(intern!(py, "url"), &self.url);
         if let Some(ref v) = self.secure_url {
-            let _ = dict.set_item("secure_url", v);
+            let _ = dict.set_item(intern!(py, "secure_url"), v);
         }
         if let Some(ref v) = self.r#type {
-            let _ = dict.set_item("type", v);
+            let _ = dict.set_item(intern!(py, "type"), v);
         }
         if let Some(v) = self.width {
-            let _ = dict.set_item("width", v);
+            let _ = dict.set_item(intern!(py, "width"), v);
         }
         if let Some(v) = self.height {
-            let _ = dict.set_item("height", v);
+            let _ = dict.set_item(intern!(py, "height"), v);
         }
         dict.unbind()
     }
@@ -353,12 +355,12 @@ impl OgAudio {
     /// Convert OgAudio to Python dictionary
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
-        let _ = dict.set_item("url", &self.url);
+        let _ = dict.set_item(intern!(py, "url"), &self.url);
         if let Some(ref v) = self.secure_url {
-            let _ = dict.set_item("secure_url", v);
+            let _ = dict.set_item(intern!(py, "secure_url"), v);
         }
         if let Some(ref v) = self.r#type {
-            let _ = dict.set_item("type", v);
+            let _ = dict.set_item(intern!(py, "type"), v);
         }
         dict.unbind()
     }
@@ -370,22 +372,22 @@ impl OgArticle {
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
         if let Some(ref v) = self.published_time {
-            let _ = dict.set_item("published_time", v);
+            let _ = dict.set_item(intern!(py, "published_time"), v);
         }
         if let Some(ref v) = self.modified_time {
-            let _ = dict.set_item("modified_time", v);
+            let _ = dict.set_item(intern!(py, "modified_time"), v);
         }
         if let Some(ref v) = self.expiration_time {
-            let _ = dict.set_item("expiration_time", v);
+            let _ = dict.set_item(intern!(py, "expiration_time"), v);
         }
         if !self.author.is_empty() {
-            let _ = dict.set_item("author", self.author.clone());
+            let _ = dict.set_item(intern!(py, "author"), self.author.clone());
         }
         if let Some(ref v) = self.section {
-            let _ = dict.set_item("section", v);
+            let _ = dict.set_item(intern!(py, "section"), v);
         }
         if !self.tag.is_empty() {
-            let _ = dict.set_item("tag", self.tag.clone());
+            let _ = dict.set_item(intern!(py, "tag"), self.tag.clone());
         }
         dict.unbind()
     }
@@ -397,16 +399,16 @@ impl OgBook {
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
         if !self.author.is_empty() {
-            let _ = dict.set_item("author", self.author.clone());
+            let _ = dict.set_item(intern!(py, "author"), self.author.clone());
         }
         if let Some(ref v) = self.isbn {
-            let _ = dict.set_item("isbn", v);
+            let _ = dict.set_item(intern!(py, "isbn"), v);
         }
         if let Some(ref v) = self.release_date {
-            let _ = dict.set_item("release_date", v);
+            let _ = dict.set_item(intern!(py, "release_date"), v);
         }
         if !self.tag.is_empty() {
-            let _ = dict.set_item("tag", self.tag.clone());
+            let _ = dict.set_item(intern!(py, "tag"), self.tag.clone());
         }
         dict.unbind()
     }
@@ -418,16 +420,16 @@ impl OgProfile {
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
         if let Some(ref v) = self.first_name {
-            let _ = dict.set_item("first_name", v);
+            let _ = dict.set_item(intern!(py, "first_name"), v);
         }
         if let Some(ref v) = self.last_name {
-            let _ = dict.set_item("last_name", v);
+            let _ = dict.set_item(intern!(py, "last_name"), v);
         }
         if let Some(ref v) = self.username {
-            let _ = dict.set_item("username", v);
+            let _ = dict.set_item(intern!(py, "username"), v);
         }
         if let Some(ref v) = self.gender {
-            let _ = dict.set_item("gender", v);
+            let _ = dict.set_item(intern!(py, "gender"), v);
         }
         dict.unbind()
     }
@@ -440,39 +442,39 @@ impl TwitterCard {
         let dict = PyDict::new_bound(py);
 
         if let Some(ref v) = self.card {
-            let _ = dict.set_item("card", v);
+            let _ = dict.set_item(intern!(py, "card"), v);
         }
         if let Some(ref v) = self.title {
-            let _ = dict.set_item("title", v);
+            let _ = dict.set_item(intern!(py, "title"), v);
         }
         if let Some(ref v) = self.description {
-            let _ = dict.set_item("description", v);
+            let _ = dict.set_item(intern!(py, "description"), v);
         }
         if let Some(ref v) = self.image {
-            let _ = dict.set_item("image", v);
+            let _ = dict.set_item(intern!(py, "image"), v);
         }
         if let Some(ref v) = self.image_alt {
-            let _ = dict.set_item("image_alt", v);
+            let _ = dict.set_item(intern!(py, "image_alt"), v);
         }
         if let Some(ref v) = self.site {
-            let _ = dict.set_item("site", v);
+            let _ = dict.set_item(intern!(py, "site"), v);
         }
         if let Some(ref v) = self.site_id {
-            let _ = dict.set_item("site_id", v);
+            let _ = dict.set_item(intern!(py, "site_id"), v);
         }
         if let Some(ref v) = self.creator {
-            let _ = dict.set_item("creator", v);
+            let _ = dict.set_item(intern!(py, "creator"), v);
         }
         if let Some(ref v) = self.creator_id {
-            let _ = dict.set_item("creator_id", v);
+            let _ = dict.set_item(intern!(py, "creator_id"), v);
         }
 
         // Complex types
         if let Some(ref app) = self.app {
-            let _ = dict.set_item("app", app.to_py_dict(py));
+            let _ = dict.set_item(intern!(py, "app"), app.to_py_dict(py));
         }
         if let Some(ref player) = self.player {
-            let _ = dict.set_item("player", player.to_py_dict(py));
+            let _ = dict.set_item(intern!(py, "player"), player.to_py_dict(py));
         }
 
         dict.unbind()
@@ -485,34 +487,34 @@ impl TwitterApp {
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
         if let Some(ref v) = self.name_iphone {
-            let _ = dict.set_item("name_iphone", v);
+            let _ = dict.set_item(intern!(py, "name_iphone"), v);
         }
         if let Some(ref v) = self.id_iphone {
-            let _ = dict.set_item("id_iphone", v);
+            let _ = dict.set_item(intern!(py, "id_iphone"), v);
         }
         if let Some(ref v) = self.url_iphone {
-            let _ = dict.set_item("url_iphone", v);
+            let _ = dict.set_item(intern!(py, "url_iphone"), v);
         }
         if let Some(ref v) = self.name_ipad {
-            let _ = dict.set_item("name_ipad", v);
+            let _ = dict.set_item(intern!(py, "name_ipad"), v);
         }
         if let Some(ref v) = self.id_ipad {
-            let _ = dict.set_item("id_ipad", v);
+            let _ = dict.set_item(intern!(py, "id_ipad"), v);
         }
         if let Some(ref v) = self.url_ipad {
-            let _ = dict.set_item("url_ipad", v);
+            let _ = dict.set_item(intern!(py, "url_ipad"), v);
         }
         if let Some(ref v) = self.name_googleplay {
-            let _ = dict.set_item("name_googleplay", v);
+            let _ = dict.set_item(intern!(py, "name_googleplay"), v);
         }
         if let Some(ref v) = self.id_googleplay {
-            let _ = dict.set_item("id_googleplay", v);
+            let _ = dict.set_item(intern!(py, "id_googleplay"), v);
         }
         if let Some(ref v) = self.url_googleplay {
-            let _ = dict.set_item("url_googleplay", v);
+            let _ = dict.set_item(intern!(py, "url_googleplay"), v);
         }
         if let Some(ref v) = self.country {
-            let _ = dict.set_item("country", v);
+            let _ = dict.set_item(intern!(py, "country"), v);
         }
         dict.unbind()
     }
@@ -523,15 +525,15 @@ impl TwitterPlayer {
     /// Convert TwitterPlayer to Python dictionary
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
-        let _ = dict.set_item("url", &self.url);
+        let _ = dict.set_item(intern!(py, "url"), &self.url);
         if let Some(v) = self.width {
-            let _ = dict.set_item("width", v);
+            let _ = dict.set_item(intern!(py, "width"), v);
         }
         if let Some(v) = self.height {
-            let _ = dict.set_item("height", v);
+            let _ = dict.set_item(intern!(py, "height"), v);
         }
         if let Some(ref v) = self.stream {
-            let _ = dict.set_item("stream", v);
+            let _ = dict.set_item(intern!(py, "stream"), v);
         }
         dict.unbind()
     }
@@ -0,0 +1,105 @@
+"""
+Shared fixtures for the MetaOxide test suite.
+
+The tests import the installed extension, so build it into the active
+environment first (``maturin develop`` or ``pip install -e .``). Large HTML
+inputs are built or loaded once per session and shared by the
+error-handling tests and the benchmarks.
+"""
+
+import mmap
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def nested_html():
+    """100 levels of nested <div> elements."""
+    return (FIXTURES / "nested_100.html").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def long_attribute_html():
+    """Meta tag with a 10 KB content attribute."""
+    return (FIXTURES / "long_attribute_10k.html").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def large_attribute_html():
+    """Meta tag with a 100 KB content attribute."""
+    with open(FIXTURES / "large_attribute_100k.html", "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:].decode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def long_html_document():
+    """HTML document with 1,000 meta tags."""
+    return (
+        "<html><head>"
+        + "".join(f'<meta name="test{i}" content="value{i}">' for i in range(1000))
+        + "</head></html>"
+    )
+
+
+@pytest.fixture(scope="session")
+def many_meta_html():
+    """HTML document with 5,000 meta tags."""
+    return (
+        "<html><head>"
+        + "".join(f'<meta name="tag{i}" content="value{i}">' for i in range(5000))
+        + "</head></html>"
+    )
+
+
+@pytest.fixture(scope="session")
+def many_hcards_html():
+    """HTML document with 500 h-cards."""
+    return (
+        "<html><body>"
+        + "".join(
+            f'<div class="h-card"><span class="p-name">Person {i}</span></div>' for i in range(500)
+        )
+        + "</body></html>"
+    )
+
+
+@pytest.fixture(scope="session")
+def article_html():
+    """News-article style page, ~100 KB, with head metadata, JSON-LD and h-entries."""
+    head = (
+        "<html lang='en'><head><title>Article</title>"
+        '<meta name="description" content="An article">'
+        '<meta property="og:title" content="Article">'
+        '<meta property="og:image" content="/lead.jpg">'
+        '<meta name="twitter:card" content="summary_large_image">'
+        '<link rel="canonical" href="/article">'
+        '<script type="application/ld+json">'
+        '{"@context": "https://schema.org", "@type": "NewsArticle", "headline": "Article"}'
+        "</script></head><body>"
+    )
+    entries = "".join(
+        f'<article class="h-entry"><h2 class="p-name">Entry {i}</h2>'
+        f'<a class="u-url" href="/entry/{i}">link</a>'
+        f'<div class="e-content"><p>{"Lorem ipsum dolor sit amet. " * 8}</p></div></article>'
+        for i in range(300)
+    )
+    return head + entries + "</body></html>"
+
+
+@pytest.fixture(scope="session")
+def large_jsonld_html():
+    """Product page whose JSON-LD block carries 2,000 offers."""
+    offers = ",".join(
+        f'{{"@type": "Offer", "sku": "SKU-{i}", "price": "{i}.99", "priceCurrency": "USD"}}'
+        for i in range(2000)
+    )
+    return (
+        '<html><head><script type="application/ld+json">'
+        f'{{"@context": "https://schema.org", "@type": "Product", "name": "Widget",'
+        f' "offers": [{offers}]}}'
+        "</script></head><body></body></html>"
+    )
@@ -0,0 +1,80 @@
+"""
+Performance regression benchmarks for MetaOxide.
+
+These cover the large-input paths exercised by the error-handling tests and
+realistic pages for the combined extractors, and require pytest-benchmark.
+Save a baseline and fail on regressions against it with:
+
+    pytest tests/test_benchmarks.py --benchmark-autosave
+    pytest tests/test_benchmarks.py --benchmark-compare --benchmark-compare-fail=mean:10%
+
+Page benchmarks record their input throughput as ``extra_info["mb_per_s"]``.
+The Rust-side equivalents live in ``benches/extract_all.rs`` (``cargo bench``).
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+meta_oxide = pytest.importorskip("meta_oxide")
+
+
+def _record_throughput(benchmark, html):
+    """Store MB/s of HTML processed at the mean round time."""
+    benchmark.extra_info["mb_per_s"] = len(html.encode("utf-8")) / 1e6 / benchmark.stats["mean"]
+
+
+@pytest.mark.benchmark(group="many-tags", min_rounds=5, warmup=True)
+def test_bench_many_meta_tags(benchmark, many_meta_html):
+    """Benchmark extract_meta() over 5,000 meta tags."""
+    result = benchmark(meta_oxide.extract_meta, many_meta_html)
+    assert isinstance(result, dict)
+
+
+@pytest.mark.benchmark(group="many-tags", min_rounds=5, warmup=True)
+def test_bench_many_hcards(benchmark, many_hcards_html):
+    """Benchmark extract_hcard() over 500 h-cards."""
+    result = benchmark(meta_oxide.extract_hcard, many_hcards_html)
+    assert len(result) == 500
+
+
+@pytest.mark.benchmark(group="long-attribute", min_rounds=5, warmup=True)
+def test_bench_long_attribute(benchmark, long_attribute_html):
+    """Benchmark extract_meta() with a 10 KB attribute value."""
+    result = benchmark(meta_oxide.extract_meta, long_attribute_html)
+    assert isinstance(result, dict)
+
+
+@pytest.mark.benchmark(group="long-attribute", min_rounds=5, warmup=True)
+def test_bench_large_attribute(benchmark, large_attribute_html):
+    """Benchmark extract_meta() with a 100 KB attribute value."""
+    result = benchmark(meta_oxide.extract_meta, large_attribute_html)
+    assert isinstance(result, dict)
+
+
+@pytest.mark.benchmark(group="pages", min_rounds=5, warmup=True)
+def test_bench_extract_all_article(benchmark, article_html):
+    """Benchmark extract_all() over a ~100 KB article page."""
+    result = benchmark(meta_oxide.extract_all, article_html)
+    assert len(result["microformats"]["h-entry"]) == 300
+    _record_throughput(benchmark, article_html)
+
+
+@pytest.mark.benchmark(group="pages", min_rounds=5, warmup=True)
+def test_bench_extract_all_lazy_article(benchmark, article_html):
+    """Benchmark extract_all_lazy() reading only the head sections."""
+
+    def run():
+        result = meta_oxide.extract_all_lazy(article_html)
+        return result["meta"], result["opengraph"]
+
+    meta, _ = benchmark(run)
+    assert meta["title"] == "Article"
+    _record_throughput(benchmark, article_html)
+
+
+@pytest.mark.benchmark(group="pages", min_rounds=5, warmup=True)
+def test_bench_extract_jsonld_large(benchmark, large_jsonld_html):
+    """Benchmark extract_jsonld() over a JSON-LD block with 2,000 offers."""
+    result = benchmark(meta_oxide.extract_jsonld, large_jsonld_html)
+    assert len(result[0]["offers"]) == 2000
+    _record_throughput(benchmark, large_jsonld_html)
@@ -5,16 +5,17 @@ These tests verify that the library handles edge cases, malformed input,
 and error conditions gracefully.
 """
 
-import os
 import sys
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import pytest
 
-try:
-    import meta_oxide
-except ImportError:
-    print("ERROR: meta_oxide module not found")
-    sys.exit(1)
+meta_oxide = pytest.importorskip("meta_oxide")
+
+
+@pytest.fixture(scope="session")
+def extract_meta():
+    """meta_oxide.extract_meta, resolved once for the session."""
+    return meta_oxide.extract_meta
 
 
 class TestMalformedHTML:
@@ -33,13 +34,12 @@ class TestMalformedHTML:
         # Should not crash, should return valid result
         assert isinstance(result, dict)
 
-    def test_deeply_nested_tags(self):
+    def test_deeply_nested_tags(self, nested_html):
         """Test deeply nested HTML structure."""
-        html = "<div>" * 100 + "Content" + "</div>" * 100
-        result = meta_oxide.extract_all(html)
+        result = meta_oxide.extract_all(nested_html)
         assert isinstance(result, dict)
 
-    def test_malformed_meta_tags(self):
+    def test_malformed_meta_tags(self, extract_meta):
         """Test meta tags without proper attributes."""
         html = """
         <html>
@@ -50,7 +50,7 @@ class TestMalformedHTML:
             </head>
         </html>
         """
-        result = meta_oxide.extract_meta(html)
+        result = extract_meta(html)
         assert isinstance(result, dict)
 
     def test_broken_json_ld(self):
@@ -85,7 +85,7 @@ class TestMalformedHTML:
         result = meta_oxide.extract_jsonld(html)
         assert isinstance(result, list)
 
-    def test_script_injection_in_content(self):
+    def test_script_injection_in_content(self, extract_meta):
         """Test that script content doesn't break extraction."""
         html = """
         <html>
@@ -97,10 +97,10 @@ class TestMalformedHTML:
             </head>
         </html>
         """
-        result = meta_oxide.extract_meta(html)
+        result = extract_meta(html)
         assert isinstance(result, dict)
 
-    def test_mixed_quotes_in_attributes(self):
+    def test_mixed_quotes_in_attributes(self, extract_meta):
         """Test mixed quote styles in attributes."""
         html = """
         <html>
@@ -110,7 +110,7 @@ class TestMalformedHTML:
             </head>
         </html>
         """
-        result = meta_oxide.extract_meta(html)
+        result = extract_meta(html)
         assert isinstance(result, dict)
 
 
@@ -122,11 +122,11 @@ class TestEdgeCases:
         result = meta_oxide.extract_all("")
         assert isinstance(result, dict)
 
-    def test_none_like_empty_strings(self):
+    @pytest.mark.parametrize("html", ["", " ", "\n", "\t"])
+    def test_none_like_empty_strings(self, html):
         """Test with various empty-like inputs."""
-        for html in ["", " ", "\n", "\t"]:
-            result = meta_oxide.extract_all(html)
-            assert isinstance(result, dict)
+        result = meta_oxide.extract_all(html)
+        assert isinstance(result, dict)
 
     def test_html_with_only_whitespace(self):
         """Test HTML that's only whitespace."""
@@ -134,25 +134,17 @@ class TestEdgeCases:
         result = meta_oxide.extract_all(html)
         assert isinstance(result, dict)
 
-    def test_very_long_attribute_values(self):
+    def test_very_long_attribute_values(self, extract_meta, long_attribute_html):
         """Test with extremely long attribute values."""
-        long_content = "x" * 10000
-        html = f'<meta name="description" content="{long_content}">'
-        result = meta_oxide.extract_meta(html)
+        result = extract_meta(long_attribute_html)
         assert isinstance(result, dict)
 
-    def test_very_long_html_document(self):
+    def test_very_long_html_document(self, extract_meta, long_html_document):
         """Test with very large HTML document."""
-        # Create a large document with 10,000 meta tags
-        html = "<html><head>"
-        for i in range(1000):
-            html += f'<meta name="test{i}" content="value{i}">'
-        html += "</head></html>"
-
-        result = meta_oxide.extract_meta(html)
+        result = extract_meta(long_html_document)
         assert isinstance(result, dict)
 
-    def test_html_with_unicode_content(self):
+    def test_html_with_unicode_content(self, extract_meta):
         """Test HTML with unicode characters."""
         html = """
         <html>
@@ -162,11 +154,11 @@ class TestEdgeCases:
             </head>
         </html>
         """
-        result = meta_oxide.extract_meta(html)
+        result = extract_meta(html)
         assert isinstance(result, dict)
         assert "title" in result
 
-    def test_html_with_emoji(self):
+    def test_html_with_emoji(self, extract_meta):
         """Test HTML with emoji."""
         html = """
         <html>
@@ -176,10 +168,10 @@ class TestEdgeCases:
             </head>
         </html>
         """
-        result = meta_oxide.extract_meta(html)
+        result = extract_meta(html)
         assert isinstance(result, dict)
 
-    def test_html_with_html_entities(self):
+    def test_html_with_html_entities(self, extract_meta):
         """Test HTML with HTML entities."""
         html = """
         <html>
@@ -189,7 +181,7 @@ class TestEdgeCases:
             </head>
         </html>
         """
-        result = meta_oxide.extract_meta(html)
+        result = extract_meta(html)
         assert isinstance(result, dict)
 
     def test_html_with_cdata_sections(self):
@@ -209,7 +201,7 @@ class TestEdgeCases:
         # Should handle gracefully
         assert isinstance(result, list)
 
-    def test_html_with_comments(self):
+    def test_html_with_comments(self, extract_meta):
         """Test HTML with comments."""
         html = """
         <html>
@@ -220,7 +212,7 @@ class TestEdgeCases:
             </head>
         </html>
         """
-        result = meta_oxide.extract_meta(html)
+        result = extract_meta(html)
         assert isinstance(result, dict)
 
 
@@ -251,52 +243,33 @@ class TestInvalidInput:
         # Should not crash, just won't extract anything meaningful
         assert isinstance(result, dict)
 
-    def test_binary_like_strings(self):
+    def test_binary_like_strings(self, extract_meta):
         """Test with binary-like content."""
         # Test with null bytes (though Python strings don't typically have these)
         html = "<html><head><title>Test\x00Title</title></head></html>"
-        result = meta_oxide.extract_meta(html)
+        result = extract_meta(html)
         assert isinstance(result, dict)
 
 
 class TestInvalidURLs:
     """Test handling of invalid URLs in base_url parameter."""
 
-    def test_invalid_base_url_format(self):
-        """Test with malformed base URL."""
-        html = '<link rel="canonical" href="/page">'
-        # Invalid URL should be handled gracefully
-        try:
-            result = meta_oxide.extract_meta(html, base_url="not a url")
-            # Either succeeds with unresolved URL or handled gracefully
-            assert isinstance(result, dict)
-        except:
-            # If it raises an error, that's also acceptable
-            pass
-
-    def test_relative_base_url(self):
-        """Test with relative path as base URL."""
-        html = '<link rel="canonical" href="/page">'
-        try:
-            result = meta_oxide.extract_meta(html, base_url="/relative/path")
-            assert isinstance(result, dict)
-        except:
-            # If it raises, that's acceptable
-            pass
-
-    def test_empty_base_url(self):
-        """Test with empty string as base URL."""
-        html = '<link rel="canonical" href="/page">'
-        result = meta_oxide.extract_meta(html, base_url="")
-        assert isinstance(result, dict)
-
-    def test_special_characters_in_base_url(self):
-        """Test base URL with special characters."""
+    @pytest.mark.parametrize(
+        ("base_url", "canonical"),
+        [
+            # Base URLs that cannot be parsed leave relative links unresolved
+            ("not a url", "/page"),
+            ("/relative/path", "/page"),
+            ("", "/page"),
+            ("https://example.com/path?query=value&other=123", "https://example.com/page"),
+        ],
+    )
+    def test_base_url_variants(self, extract_meta, base_url, canonical):
+        """Test malformed, relative, empty and query-string base URLs."""
         html = '<link rel="canonical" href="/page">'
-        result = meta_oxide.extract_meta(
-            html, base_url="https://example.com/path?query=value&other=123"
-        )
+        result = extract_meta(html, base_url=base_url)
         assert isinstance(result, dict)
+        assert result["canonical"] == canonical
 
 
 class TestExtractAllRobustness:
@@ -380,63 +353,31 @@ class TestExtractAllRobustness:
 class TestMemoryAndPerformance:
     """Test handling of memory-intensive operations."""
 
-    def test_extract_large_attribute_value(self):
+    def test_extract_large_attribute_value(self, extract_meta, large_attribute_html):
         """Test extraction with very large attribute value."""
-        large_value = "x" * 100000  # 100KB string
-        html = f'<meta name="test" content="{large_value}">'
-        result = meta_oxide.extract_meta(html)
+        result = extract_meta(large_attribute_html)
         assert isinstance(result, dict)
 
-    def test_extract_many_meta_tags(self):
+    def test_extract_many_meta_tags(self, extract_meta, many_meta_html):
         """Test extraction of many meta tags."""
-        html = "<html><head>"
-        for i in range(5000):  # 5000 meta tags
-            html += f'<meta name="tag{i}" content="value{i}">'
-        html += "</head></html>"
-
-        result = meta_oxide.extract_meta(html)
+        result = extract_meta(many_meta_html)
         assert isinstance(result, dict)
 
-    def test_extract_many_microformats(self):
+    def test_extract_many_microformats(self, many_hcards_html):
         """Test extraction of many microformat items."""
-        html = "<html><body>"
-        for i in range(500):  # 500 h-cards
-            html += f'<div class="h-card"><span class="p-name">Person {i}</span></div>'
-        html += "</body></html>"
-
-        result = meta_oxide.extract_hcard(html)
+        result = meta_oxide.extract_hcard(many_hcards_html)
         assert isinstance(result, list)
 
 
 if __name__ == "__main__":
-    print("Running error handling tests...\n")
-
-    # Run a few smoke tests
-    try:
-        test = TestMalformedHTML()
-        test.test_unclosed_tags()
-        print("✓ Unclosed tags handled gracefully")
-    except Exception as e:
-        print(f"✗ Unclosed tags: {e}")
-
-    try:
-        test = TestEdgeCases()
-        test.test_empty_html()
-        print("✓ Empty HTML handled gracefully")
-    except Exception as e:
-        print(f"✗ Empty HTML: {e}")
-
-    try:
-        test.test_html_with_unicode_content()
-        print("✓ Unicode content handled correctly")
-    except Exception as e:
-        print(f"✗ Unicode content: {e}")
-
-    try:
-        test = TestInvalidInput()
-        test.test_non_html_text()
-        print("✓ Non-HTML text handled gracefully")
-    except Exception as e:
-        print(f"✗ Non-HTML text: {e}")
-
-    print("\nError handling tests completed!")
+    # Quick smoke run of a representative subset
+    sys.exit(
+        pytest.main(
+            [
+                __file__,
+                "-q",
+                "-k",
+                "unclosed_tags or empty_html or unicode_content or non_html_text",
+            ]
+        )
+    )
@@ -7,17 +7,10 @@ and return properly formatted data.
 Run with: python -m pytest tests/test_python_api.py -v
 """
 
-import os
-import sys
+import pytest
 
-# Add parent directory to path to import meta_oxide
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
-try:
-    import meta_oxide
-except ImportError:
-    print("ERROR: meta_oxide module not found. Build it first with: maturin develop")
-    sys.exit(1)
+# Build and install the extension first with: maturin develop
+meta_oxide = pytest.importorskip("meta_oxide")
 
 
 class TestExtractMeta:
@@ -62,6 +55,25 @@ class TestExtractMeta:
 
         assert isinstance(result, dict)
 
+    def test_extract_meta_large(self):
+        """Test extraction from a ~10MB non-ASCII document."""
+        body = "<p>Lorem ipsum dolor sit amet, ünïcödé text.</p>\n" * 200_000
+        html = f"""
+        <html>
+            <head>
+                <title>Large Page</title>
+                <meta name="description" content="Large description">
+            </head>
+            <body>{body}</body>
+        </html>
+        """
+        assert len(html.encode("utf-8")) > 10_000_000
+
+        result = meta_oxide.extract_meta(html)
+
+        assert result.get("title") == "Large Page"
+        assert result.get("description") == "Large description"
+
     def test_extract_meta_verification_tags(self):
         """Test extraction of verification meta tags."""
         html = """
@@ -577,7 +589,7 @@ class TestExtractAll:
 
 
 if __name__ == "__main__":
-    # Run a quick smoke test if pytest is not available
+    # Run a quick smoke test without the pytest runner
     print("Running Python API smoke tests...\n")
 
     # Test extract_meta